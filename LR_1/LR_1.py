@@ -1,6 +1,21 @@
-﻿from binary_calculator import BinaryCalculator
+﻿import argparse
+import csv
+from functools import partial
+import json
+import math
+import sys
+import time
+
+from binary_calculator import BinaryCalculator
 from binary_converter import BinaryConverter
+from conversion_cache import conversion_cache
 from decimal_converter import DecimalConverter
+from int_engine import ENGINES
+from parallel import MIN_PARALLEL_ITEMS, ParallelExecutor
+
+BATCH_FORMATS = ('json', 'csv')
+BATCH_FIELDS = ('line', 'a', 'b', 'code', 'decimal', 'error')
+BATCH_CHUNK_SIZE = 256  # строк на одно задание пула процессов
 
 
 
@@ -104,5 +119,131 @@ def main():
         else:
             print("Ошибка: Неверный выбор.")
 
+
+
+# Пакетный режим
+# В пакете одни и те же числа встречаются многократно, поэтому коды берутся из conversion_cache
+
+def calculate_add(num1, num2):
+    result = BinaryCalculator.sum_additional_code(conversion_cache.additional_code(num1),
+                                                  conversion_cache.additional_code(num2))
+    return result, DecimalConverter.additional_code_to_decimal(result)
+
+def calculate_sub(num1, num2):
+    result = BinaryCalculator.subtract_additional_code(conversion_cache.additional_code(num1),
+                                                       conversion_cache.additional_code(num2))
+    return result, DecimalConverter.additional_code_to_decimal(result)
+
+def calculate_mul(num1, num2):
+    result = BinaryCalculator.multiply_direct_code(conversion_cache.direct_code(num1), conversion_cache.direct_code(num2))
+    return result, DecimalConverter.direct_code_to_decimal_int(result)
+
+def calculate_div(num1, num2):
+    if num2 == 0:
+        raise ValueError("Деление на ноль невозможно")
+    result = BinaryCalculator.division_direct_code(conversion_cache.direct_code(num1), conversion_cache.direct_code(num2))
+    return result, DecimalConverter.direct_code_to_decimal_float(result)
+
+def calculate_fadd(num1, num2):
+    result = BinaryCalculator.sum_ieee754(BinaryConverter(num1).ieee754(), BinaryConverter(num2).ieee754())
+    return result, DecimalConverter.ieee754_to_decimal(result)
+
+# Операция -> (функция, тип операндов), как в меню: целые для кодов, дробные для IEEE-754
+BATCH_OPERATIONS = {
+    'add': (calculate_add, int),
+    'sub': (calculate_sub, int),
+    'mul': (calculate_mul, int),
+    'div': (calculate_div, int),
+    'fadd': (calculate_fadd, float),
+}
+
+def process_line(operation, numbered_line):
+    """Вычисляет одну строку входного файла: два числа через пробел или запятую.
+    Ошибки (в том числе бесконечные и NaN операнды) не прерывают обработку, а попадают в поле error."""
+    line_number, line = numbered_line
+    record = dict.fromkeys(BATCH_FIELDS)
+    record['line'] = line_number
+    calculate, number_type = BATCH_OPERATIONS[operation]
+    try:
+        operands = line.replace(',', ' ').split()
+        if len(operands) != 2:
+            raise ValueError("Ожидалось два числа.")
+        num1, num2 = number_type(operands[0]), number_type(operands[1])
+        if number_type is float and not (math.isfinite(num1) and math.isfinite(num2)):
+            raise ValueError("Числа должны быть конечными.")
+        record['a'], record['b'] = num1, num2
+        code, decimal = calculate(num1, num2)
+        if isinstance(decimal, float) and not math.isfinite(decimal):
+            raise ValueError("Результат не является конечным числом.")
+        record['code'], record['decimal'] = code, decimal
+    except (ValueError, ZeroDivisionError, OverflowError) as error:
+        record['error'] = str(error)
+    return record
+
+def read_operand_lines(source):
+    """Лениво выдает (номер строки, строка) без пустых строк и комментариев (#)."""
+    for line_number, line in enumerate(source, 1):
+        line = line.split('#', 1)[0].strip()
+        if line:
+            yield line_number, line
+
+def init_worker(engine):
+    BinaryCalculator.set_engine(engine)
+
+def run_batch(source, output, operation, output_format='json', workers=1, engine=None,
+              min_parallel=MIN_PARALLEL_ITEMS):
+    """Обрабатывает строки source и по мере готовности пишет результаты в output
+    (JSON – по объекту на строку, CSV – с заголовком). Порядок строк сохраняется;
+    при workers > 1 файлы от min_parallel строк обрабатываются в пуле процессов (см. ParallelExecutor).
+    Возвращает (число строк, число ошибок, время в секундах)."""
+    engine = engine or BinaryCalculator.engine
+    if output_format == 'csv':
+        writer = csv.DictWriter(output, fieldnames=BATCH_FIELDS)
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        write = lambda record: output.write(json.dumps(record, ensure_ascii=False, allow_nan=False) + '\n')
+
+    executor = ParallelExecutor(workers, BATCH_CHUNK_SIZE, min_parallel, initializer=init_worker, initargs=(engine,))
+    count = errors = 0
+    # Маленькие пакеты считаются здесь без init_worker: движок задаем сами и потом возвращаем
+    previous_engines = BinaryCalculator.engine, DecimalConverter.engine
+    start = time.perf_counter()
+    try:
+        BinaryCalculator.set_engine(engine)
+        for record in executor.map(partial(process_line, operation), read_operand_lines(source)):
+            write(record)
+            count += 1
+            errors += record['error'] is not None
+    finally:
+        BinaryCalculator.engine, DecimalConverter.engine = previous_engines
+    return count, errors, time.perf_counter() - start
+
+def batch_main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетные вычисления над парами чисел из файла")
+    parser.add_argument('--input', default='-', help="файл с парами чисел, по паре на строке ('-' – стандартный ввод)")
+    parser.add_argument('--output', default='-', help="файл для результатов ('-' – стандартный вывод)")
+    parser.add_argument('--op', required=True, choices=list(BATCH_OPERATIONS), help="операция")
+    parser.add_argument('--format', default='json', choices=BATCH_FORMATS, help="формат результатов")
+    parser.add_argument('--workers', type=int, default=1, help="число процессов")
+    parser.add_argument('--engine', choices=ENGINES, help="движок вычислений BinaryCalculator")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+    try:
+        count, errors, elapsed = run_batch(source, output, args.op, args.format, args.workers, args.engine)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    rate = count / elapsed if elapsed else 0.0
+    print(f"Обработано строк: {count}, ошибок: {errors}, время: {elapsed:.3f} с, {rate:.1f} строк/с", file=sys.stderr)
+    return 1 if errors else 0
+
 if __name__ == "__main__":
+    # Без аргументов – интерактивное меню, с аргументами – пакетный режим
+    if len(sys.argv) > 1:
+        sys.exit(batch_main())
     main()
@@ -0,0 +1,230 @@
+import random
+
+ADDER_RIPPLE = 'ripple'
+ADDER_LOOKAHEAD = 'lookahead'
+ADDER_KOGGE_STONE = 'kogge_stone'
+ADDER_CARRY_SELECT = 'carry_select'
+ADDERS = (ADDER_RIPPLE, ADDER_LOOKAHEAD, ADDER_KOGGE_STONE, ADDER_CARRY_SELECT)
+
+# Размер блока сумматора с ускоренным переносом
+LOOKAHEAD_BLOCK = 4
+
+ZERO = (0, 0)  # константный сигнал: значение 0, задержка 0
+
+
+class Circuit:
+    """Счетчик вентилей схемы. Сигнал – пара (значение бита, глубина), где глубина –
+    число вентилей на самом длинном пути от входов. Каждый двухвходовый вентиль AND/OR/XOR
+    стоит 1 и задерживает на 1; мультиплексор 2:1 собран из AND-OR (3 вентиля, задержка 2,
+    инверсия управляющего сигнала считается бесплатной).
+    """
+
+    def __init__(self):
+        self.gates = 0
+
+    def _gate(self, value: int, *inputs, cost: int = 1, delay: int = 1):
+        self.gates += cost
+        return value, max(depth for _, depth in inputs) + delay
+
+    def and_(self, a, b):
+        return self._gate(a[0] & b[0], a, b)
+
+    def or_(self, a, b):
+        return self._gate(a[0] | b[0], a, b)
+
+    def xor(self, a, b):
+        return self._gate(a[0] ^ b[0], a, b)
+
+    def mux(self, select, if_zero, if_one):
+        return self._gate(if_one[0] if select[0] else if_zero[0], select, if_zero, if_one, cost=3, delay=2)
+
+    def reduce(self, gate, signals):
+        """Сворачивает сигналы сбалансированным деревом вентилей (глубина log2 n)."""
+        while len(signals) > 1:
+            paired = [gate(signals[i], signals[i + 1]) for i in range(0, len(signals) - 1, 2)]
+            if len(signals) % 2:
+                paired.append(signals[-1])
+            signals = paired
+        return signals[0]
+
+    def full_adder(self, a, b, carry):
+        """Полный сумматор: 5 вентилей. Возвращает (сумма, перенос)."""
+        propagate = self.xor(a, b)
+        return self.xor(propagate, carry), self.or_(self.and_(a, b), self.and_(propagate, carry))
+
+
+class Adders:
+    """Модели аппаратных сумматоров на уровне вентилей. Все сумматоры складывают беззнаковые
+    строки битов так же, как BinaryCalculator.add_binaries, и дополнительно возвращают
+    стоимость схемы: {'gates': число вентилей, 'depth': длина критического пути}.
+    Биты внутри хранятся от младшего к старшему.
+    """
+
+    @staticmethod
+    def add(bin1: str, bin2: str, adder: str = ADDER_RIPPLE):
+        """Складывает два беззнаковых числа выбранным сумматором. Возвращает (результат, стоимость)."""
+        max_len = max(len(bin1), len(bin2))
+        circuit = Circuit()
+        bits, carry = Adders.add_signals(circuit, Adders.to_signals(bin1.zfill(max_len)),
+                                         Adders.to_signals(bin2.zfill(max_len)), ZERO, adder)
+        if carry[0]:
+            bits.append(carry)
+        return Adders.to_binary(bits), Adders.cost(circuit, bits + [carry])
+
+    @staticmethod
+    def add_signals(circuit: Circuit, a, b, carry_in, adder: str = ADDER_RIPPLE):
+        """Складывает векторы сигналов одной длины. Возвращает (сигналы суммы, перенос из старшего разряда)."""
+        if adder == ADDER_RIPPLE:
+            return Adders.ripple(circuit, a, b, carry_in)
+        if adder == ADDER_LOOKAHEAD:
+            return Adders.lookahead(circuit, a, b, carry_in)
+        if adder == ADDER_KOGGE_STONE:
+            return Adders.kogge_stone(circuit, a, b, carry_in)
+        if adder == ADDER_CARRY_SELECT:
+            return Adders.carry_select(circuit, a, b, carry_in)
+        raise ValueError(f"Неизвестный сумматор: {adder}")
+
+    @staticmethod
+    def ripple(circuit: Circuit, a, b, carry):
+        """Сумматор с последовательным переносом: цепочка полных сумматоров, глубина O(n)."""
+        bits = []
+        for bit_a, bit_b in zip(a, b):
+            bit, carry = circuit.full_adder(bit_a, bit_b, carry)
+            bits.append(bit)
+        return bits, carry
+
+    @staticmethod
+    def lookahead(circuit: Circuit, a, b, carry):
+        """Сумматор с ускоренным переносом: в каждом блоке из LOOKAHEAD_BLOCK бит переносы
+        вычисляются параллельно двухуровневой логикой c[i+1] = g[i] | p[i]g[i-1] | ... | p[i]..p[0]c[0],
+        между блоками перенос передается последовательно."""
+        propagates = [circuit.xor(bit_a, bit_b) for bit_a, bit_b in zip(a, b)]
+        generates = [circuit.and_(bit_a, bit_b) for bit_a, bit_b in zip(a, b)]
+        bits = []
+        for start in range(0, len(a), LOOKAHEAD_BLOCK):
+            block_p = propagates[start:start + LOOKAHEAD_BLOCK]
+            block_g = generates[start:start + LOOKAHEAD_BLOCK]
+            block_carry = carry
+            for i in range(len(block_p)):
+                bits.append(circuit.xor(block_p[i], block_carry))
+                terms = [block_g[i]]
+                for j in range(i - 1, -1, -1):
+                    terms.append(circuit.reduce(circuit.and_, block_p[j + 1:i + 1] + [block_g[j]]))
+                terms.append(circuit.reduce(circuit.and_, block_p[:i + 1] + [carry]))
+                block_carry = circuit.reduce(circuit.or_, terms)
+            carry = block_carry
+        return bits, carry
+
+    @staticmethod
+    def kogge_stone(circuit: Circuit, a, b, carry):
+        """Параллельно-префиксный сумматор Когге – Стоуна: пары (g, p) объединяются на расстояниях
+        1, 2, 4, ..., поэтому перенос в каждый разряд готов за log2 n уровней."""
+        propagates = [circuit.xor(bit_a, bit_b) for bit_a, bit_b in zip(a, b)]
+        # Входной перенос учитывается как генерация в нулевом разряде
+        generates = [circuit.and_(bit_a, bit_b) for bit_a, bit_b in zip(a, b)]
+        if carry is not ZERO:
+            generates[0] = circuit.or_(generates[0], circuit.and_(propagates[0], carry))
+        group_g, group_p = list(generates), list(propagates)
+        distance = 1
+        while distance < len(a):
+            next_g, next_p = list(group_g), list(group_p)
+            for i in range(distance, len(a)):
+                next_g[i] = circuit.or_(group_g[i], circuit.and_(group_p[i], group_g[i - distance]))
+                next_p[i] = circuit.and_(group_p[i], group_p[i - distance])
+            group_g, group_p = next_g, next_p
+            distance <<= 1
+        carries = [carry] + group_g[:-1]
+        bits = [circuit.xor(propagate, bit_carry) for propagate, bit_carry in zip(propagates, carries)]
+        return bits, group_g[-1] if a else carry
+
+    @staticmethod
+    def carry_select(circuit: Circuit, a, b, carry, block: int = None):
+        """Сумматор с выбором переноса: каждый блок считается дважды (для переноса 0 и 1)
+        последовательными сумматорами, а настоящий перенос только выбирает готовый результат.
+        По умолчанию размер блока ~ sqrt(n)."""
+        block = block or max(1, round(len(a) ** 0.5))
+        bits, carry = Adders.ripple(circuit, a[:block], b[:block], carry)
+        for start in range(block, len(a), block):
+            block_a, block_b = a[start:start + block], b[start:start + block]
+            bits_zero, carry_zero = Adders.ripple(circuit, block_a, block_b, ZERO)
+            bits_one, carry_one = Adders.ripple(circuit, block_a, block_b, (1, 0))
+            bits += [circuit.mux(carry, bit_zero, bit_one) for bit_zero, bit_one in zip(bits_zero, bits_one)]
+            carry = circuit.mux(carry, carry_zero, carry_one)
+        return bits, carry
+
+    @staticmethod
+    def carry_save(operands, adder: str = ADDER_KOGGE_STONE):
+        """Складывает несколько беззнаковых чисел: сумматоры с сохранением переноса сводят
+        каждые три слагаемых к двум (сумма и сдвинутые переносы) без распространения переноса,
+        и только последняя пара складывается сумматором adder. Возвращает (результат, стоимость)."""
+        if not operands:
+            raise ValueError("Нужно хотя бы одно слагаемое.")
+        max_len = max(len(operand) for operand in operands)
+        # Сумма n чисел по max_len бит помещается в max_len + ceil(log2 n) бит
+        width = max_len + (len(operands) - 1).bit_length()
+        circuit = Circuit()
+
+        def step(row_a, row_b, row_c):
+            sums, carries = [], [ZERO]
+            for bit_a, bit_b, bit_c in zip(row_a, row_b, row_c):
+                bit, carry = circuit.full_adder(bit_a, bit_b, bit_c)
+                sums.append(bit)
+                carries.append(carry)
+            return sums, carries[:width]
+
+        rows = Adders.reduce_rows([Adders.to_signals(operand.zfill(width)) for operand in operands], step)
+        if len(rows) == 1:
+            bits = rows[0]
+        else:
+            bits, _ = Adders.add_signals(circuit, rows[0], rows[1], ZERO, adder)
+        binary = Adders.to_binary(bits).lstrip('0').zfill(max_len)
+        return binary, Adders.cost(circuit, bits)
+
+    @staticmethod
+    def reduce_rows(rows, step):
+        """Дерево сумматоров с сохранением переноса (3 -> 2): пока слагаемых больше двух, каждые три
+        сводятся к двум функцией step(a, b, c) -> (сумма, сдвинутые переносы), остаток переходит
+        на следующий уровень как есть. Возвращает список из одного или двух слагаемых."""
+        while len(rows) > 2:
+            reduced = []
+            for i in range(0, len(rows) - 2, 3):
+                reduced.extend(step(rows[i], rows[i + 1], rows[i + 2]))
+            reduced.extend(rows[len(rows) - len(rows) % 3:])
+            rows = reduced
+        return rows
+
+    @staticmethod
+    def to_signals(bin_str: str):
+        return [(int(bit), 0) for bit in reversed(bin_str)]
+
+    @staticmethod
+    def to_binary(signals) -> str:
+        return ''.join(str(bit) for bit, _ in reversed(signals))
+
+    @staticmethod
+    def cost(circuit: Circuit, outputs) -> dict:
+        return {'gates': circuit.gates, 'depth': max((depth for _, depth in outputs), default=0)}
+
+    @staticmethod
+    def sweep(widths, adders=ADDERS, seed: int = 0):
+        """Прогоняет сумматоры на случайных операндах каждой ширины.
+        Возвращает словарь {ширина: {сумматор: стоимость}}."""
+        rng = random.Random(seed)
+        results = {}
+        for width in widths:
+            bin1 = format(rng.getrandbits(width), f'0{width}b')
+            bin2 = format(rng.getrandbits(width), f'0{width}b')
+            results[width] = {adder: Adders.add(bin1, bin2, adder)[1] for adder in adders}
+        return results
+
+
+# Сравнение сумматоров по числу вентилей и глубине
+if __name__ == "__main__":
+    widths = [4, 8, 16, 32, 64, 128, 256]
+    results = Adders.sweep(widths)
+
+    print(f"{'Бит':>6} " + " ".join(f"{adder:>20}" for adder in ADDERS))
+    for width in widths:
+        print(f"{width:>6} " + " ".join(f"{results[width][adder]['gates']:>11} / {results[width][adder]['depth']:<6}"
+                                        for adder in ADDERS))
+    print("(вентилей / глубина)")
@@ -0,0 +1,105 @@
+class ALU:
+    """Арифметико-логическое устройство фиксированной ширины (8/16/32/64/N бит).
+    Регистры хранятся как беззнаковые целые в диапазоне [0, 2^width), поэтому длинные цепочки
+    операций не удлиняют результат и не создают строк. После каждой операции выставляются флаги:
+    carry – перенос (заем при вычитании) из старшего разряда,
+    overflow – переполнение в дополнительном коде, zero – нулевой результат, negative – знаковый бит.
+    """
+
+    def __init__(self, width: int = 32):
+        if width < 1:
+            raise ValueError("Ширина регистра должна быть положительной.")
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.sign_bit = 1 << (width - 1)
+        self.carry = False
+        self.overflow = False
+        self.zero = False
+        self.negative = False
+
+    # Преобразования на границе
+
+    def load(self, code: str) -> int:
+        """Загружает код в дополнительном коде; более короткий код расширяется знаком."""
+        if len(code) > self.width:
+            raise ValueError(f"Код {code} не помещается в {self.width} бит.")
+        value = int(code, 2)
+        if code[0] == '1':
+            value |= self.mask ^ ((1 << len(code)) - 1)
+        return value
+
+    def load_number(self, number: int) -> int:
+        """Загружает целое число со знаком."""
+        if not -self.sign_bit <= number < self.sign_bit:
+            raise ValueError(f"Число {number} не помещается в {self.width} бит.")
+        return number & self.mask
+
+    def store(self, value: int) -> str:
+        """Возвращает содержимое регистра в виде кода ровно из width бит."""
+        return format(value, f'0{self.width}b')
+
+    def to_signed(self, value: int) -> int:
+        return value - (1 << self.width) if value & self.sign_bit else value
+
+    def flags(self) -> dict:
+        return {'carry': self.carry, 'overflow': self.overflow, 'zero': self.zero, 'negative': self.negative}
+
+    def _set_result_flags(self, result: int) -> int:
+        self.zero = result == 0
+        self.negative = bool(result & self.sign_bit)
+        return result
+
+    # Операции
+
+    def add(self, a: int, b: int, carry_in: int = 0) -> int:
+        total = a + b + carry_in
+        result = total & self.mask
+        self.carry = total > self.mask
+        # Переполнение: слагаемые одного знака, а результат другого
+        self.overflow = bool(~(a ^ b) & (a ^ result) & self.sign_bit)
+        return self._set_result_flags(result)
+
+    def sub(self, a: int, b: int) -> int:
+        """a - b через сложение с дополнением; carry означает заем."""
+        result = self.add(a, (~b) & self.mask, 1)
+        self.carry = not self.carry
+        self.overflow = bool((a ^ b) & (a ^ result) & self.sign_bit)
+        return result
+
+    def neg(self, a: int) -> int:
+        return self.sub(0, a)
+
+    def mul(self, a: int, b: int) -> int:
+        """Знаковое умножение с сохранением младших width бит; overflow и carry – если произведение не поместилось."""
+        product = self.to_signed(a) * self.to_signed(b)
+        result = product & self.mask
+        self.overflow = self.carry = self.to_signed(result) != product
+        return self._set_result_flags(result)
+
+    def logical_and(self, a: int, b: int) -> int:
+        self.carry = self.overflow = False
+        return self._set_result_flags(a & b)
+
+    def logical_or(self, a: int, b: int) -> int:
+        self.carry = self.overflow = False
+        return self._set_result_flags(a | b)
+
+    def logical_xor(self, a: int, b: int) -> int:
+        self.carry = self.overflow = False
+        return self._set_result_flags(a ^ b)
+
+    def logical_not(self, a: int) -> int:
+        self.carry = self.overflow = False
+        return self._set_result_flags(~a & self.mask)
+
+    def shift_left(self, a: int, count: int = 1) -> int:
+        shifted = a << count
+        self.carry = bool(count and (shifted >> self.width) & 1)
+        self.overflow = False
+        return self._set_result_flags(shifted & self.mask)
+
+    def shift_right(self, a: int, count: int = 1) -> int:
+        """Арифметический сдвиг вправо с сохранением знака."""
+        self.carry = bool(count and (a >> (count - 1)) & 1)
+        self.overflow = False
+        return self._set_result_flags((self.to_signed(a) >> count) & self.mask)
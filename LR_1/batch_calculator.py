@@ -0,0 +1,88 @@
+from int_engine import IntEngine
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него работает режим для списков строк
+    np = None
+
+# Сумма двух чисел шириной width занимает width + 1 бит и должна помещаться в int64
+MAX_NUMPY_WIDTH = 62
+
+
+class BatchCalculator:
+    """Пакетное сложение и вычитание в дополнительном коде.
+    Принимает списки строк или массивы NumPy беззнаковых целых фиксированной ширины
+    и возвращает пару (коды результатов, десятичные значения результатов).
+    Для целочисленных массивов NumPy шириной до MAX_NUMPY_WIDTH результат – массивы NumPy
+    (коды – массив строк, значения – int64), во всех остальных случаях – списки.
+    Оба операнда должны быть одного вида: смешивать строки и целые нельзя.
+    """
+
+    @staticmethod
+    def sum_additional_code(bins1, bins2, width=None):
+        """Складывает попарно операнды двух массивов в дополнительном коде.
+        Для строк результат совпадает с BinaryCalculator.sum_additional_code,
+        десятичные значения – с DecimalConverter.additional_code_to_decimal.
+        Для массивов NumPy нужна ширина операндов width.
+        """
+        return BatchCalculator._calculate(bins1, bins2, width, subtract=False)
+
+    @staticmethod
+    def subtract_additional_code(bins1, bins2, width=None):
+        """Вычитает попарно операнды двух массивов в дополнительном коде."""
+        return BatchCalculator._calculate(bins1, bins2, width, subtract=True)
+
+    @staticmethod
+    def _calculate(bins1, bins2, width, subtract):
+        if len(bins1) != len(bins2):
+            raise ValueError("Массивы операндов должны быть одинаковой длины.")
+
+        if np is not None and (isinstance(bins1, np.ndarray) or isinstance(bins2, np.ndarray)):
+            is_strings1 = np.asarray(bins1).dtype.kind in 'US'
+            is_strings2 = np.asarray(bins2).dtype.kind in 'US'
+            if is_strings1 != is_strings2:
+                raise ValueError("Операнды должны быть одного вида: оба – коды-строки или оба – целые числа.")
+            if is_strings1:
+                # Массив строк из '0' и '1' обрабатываем так же, как список строк
+                return BatchCalculator._calculate_strings([str(bin1) for bin1 in bins1],
+                                                          [str(bin2) for bin2 in bins2], subtract)
+            if width is None:
+                raise ValueError("Для массивов NumPy необходимо указать ширину операндов.")
+            if width <= MAX_NUMPY_WIDTH:
+                return BatchCalculator._calculate_numpy(bins1, bins2, width, subtract)
+            # Слишком широкие операнды не помещаются в int64: переводим в строки
+            bins1 = [format(value, f'0{width}b') for value in np.asarray(bins1).tolist()]
+            bins2 = [format(value, f'0{width}b') for value in np.asarray(bins2).tolist()]
+
+        return BatchCalculator._calculate_strings(bins1, bins2, subtract)
+
+    @staticmethod
+    def _calculate_strings(bins1, bins2, subtract):
+        to_signed = IntEngine.to_signed
+        sign = -1 if subtract else 1
+
+        decimals = [to_signed(bin1) + sign * to_signed(bin2) for bin1, bin2 in zip(bins1, bins2)]
+        codes = [IntEngine.to_code(value, max(len(bin1), len(bin2)) + 1)
+                 for value, bin1, bin2 in zip(decimals, bins1, bins2)]
+        return codes, decimals
+
+    @staticmethod
+    def _calculate_numpy(bins1, bins2, width, subtract):
+        values1 = BatchCalculator._to_signed_numpy(bins1, width)
+        values2 = BatchCalculator._to_signed_numpy(bins2, width)
+        decimals = values1 - values2 if subtract else values1 + values2
+
+        result_width = width + 1
+        codes = decimals.astype(np.uint64) & np.uint64((1 << result_width) - 1)
+
+        # Раскладываем коды на биты одним проходом и собираем строки без цикла на Python
+        shifts = np.arange(result_width - 1, -1, -1, dtype=np.uint64)
+        bits = ((codes[:, None] >> shifts) & np.uint64(1)).astype(np.uint8) + ord('0')
+        strings = np.ascontiguousarray(bits).view(f'S{result_width}').ravel().astype(f'U{result_width}')
+        return strings, decimals
+
+    @staticmethod
+    def _to_signed_numpy(values, width):
+        unsigned = np.asarray(values).astype(np.uint64) & np.uint64((1 << width) - 1)
+        sign = (unsigned >> np.uint64(width - 1)) & np.uint64(1)
+        return unsigned.astype(np.int64) - (sign.astype(np.int64) << np.int64(width))
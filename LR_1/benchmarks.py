@@ -0,0 +1,172 @@
+import argparse
+from fractions import Fraction
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from binary_calculator import BinaryCalculator
+from binary_converter import BinaryConverter
+from decimal_converter import DecimalConverter
+from int_engine import ENGINE_INT, ENGINE_STR
+from radix import RADIX_SPLIT
+
+DEFAULT_WIDTHS = [8 << i for i in range(11)]  # 8 ... 8192 бит
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_THRESHOLD = 0.2
+IEEE754_WIDTH = 32
+DIVISION_PRECISION = 64
+
+
+def _random_code(rng: random.Random, width: int, sign: str = '0') -> str:
+    """Случайный код ширины width со старшей единицей модуля после знакового бита."""
+    return sign + '1' + format(rng.getrandbits(width - 2), f'0{width - 2}b') if width > 2 else sign + '1'
+
+
+def _setup_to_binary(rng, width):
+    return (rng.getrandbits(width) | (1 << (width - 1)),)
+
+
+def _setup_frac_to_binary(rng, width):
+    # Двоичная запись float заканчивается через 53 бита; дробь n / (2^(width+1) - 1) периодична
+    # с периодом width + 1, поэтому работа действительно растет с точностью width
+    return Fraction(rng.getrandbits(width) | 1, (1 << (width + 1)) - 1), width
+
+
+def _setup_pair(rng, width):
+    return _random_code(rng, width), _random_code(rng, width, '1')
+
+
+def _setup_division(rng, width):
+    return _random_code(rng, width), _random_code(rng, max(width // 2, 2)), DIVISION_PRECISION
+
+
+def _setup_ieee754(rng, width):
+    return BinaryConverter(rng.uniform(1, 1000)).ieee754(), BinaryConverter(rng.uniform(1, 1000)).ieee754()
+
+
+def _engine_benchmarks(name, function, setup):
+    return {f"{name}[{engine}]": (setup, lambda *args, engine=engine: function(*args, engine=engine))
+            for engine in (ENGINE_STR, ENGINE_INT)}
+
+
+# Имя замера -> (подготовка аргументов по ширине, замеряемая функция)
+BENCHMARKS = {
+    'to_binary': (_setup_to_binary, BinaryConverter.to_binary),
+    'to_binary[split]': (_setup_to_binary, lambda num: BinaryConverter.to_binary(num, RADIX_SPLIT)),
+    'binary_to_decimal': (_setup_to_binary, lambda num: DecimalConverter.binary_to_decimal(format(num, 'b'))),
+    'frac_to_binary': (_setup_frac_to_binary, BinaryConverter.frac_to_binary),
+    **_engine_benchmarks('add_binaries', BinaryCalculator.add_binaries, _setup_pair),
+    **_engine_benchmarks('multiply_direct_code', BinaryCalculator.multiply_direct_code, _setup_pair),
+    **_engine_benchmarks('division_direct_code', BinaryCalculator.division_direct_code, _setup_division),
+    'sum_ieee754': (_setup_ieee754, BinaryCalculator.sum_ieee754),
+}
+# Замеры, не зависящие от ширины операндов
+FIXED_WIDTH = {'sum_ieee754': IEEE754_WIDTH}
+# Строковые умножение и деление квадратичны по ширине: на 8192 битах один вызов идет минутами
+MAX_WIDTH = {'multiply_direct_code[str]': 1024, 'division_direct_code[str]': 2048}
+
+
+def measure(function, args, min_time: float = DEFAULT_MIN_TIME):
+    """Возвращает (операций в секунду, пик выделенной памяти за один вызов в байтах)."""
+    calls = 0
+    elapsed = 0.0
+    batch = 1
+    while elapsed < min_time:
+        start = time.perf_counter()
+        for _ in range(batch):
+            function(*args)
+        elapsed += time.perf_counter() - start
+        calls += batch
+        batch *= 2
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        function(*args)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return calls / elapsed, peak
+
+
+def run(names=None, widths=DEFAULT_WIDTHS, min_time: float = DEFAULT_MIN_TIME, seed: int = 0, progress=None):
+    """Прогоняет замеры по всем ширинам. Возвращает список словарей с результатами."""
+    results = []
+    for name in names or BENCHMARKS:
+        setup, function = BENCHMARKS[name]
+        if name in FIXED_WIDTH:
+            name_widths = [FIXED_WIDTH[name]]
+        else:
+            name_widths = [width for width in widths if width <= MAX_WIDTH.get(name, width)]
+        for width in name_widths:
+            args = setup(random.Random(seed), width)
+            ops_per_sec, peak_bytes = measure(function, args, min_time)
+            result = {'benchmark': name, 'width': width, 'ops_per_sec': ops_per_sec, 'peak_bytes': peak_bytes}
+            results.append(result)
+            if progress:
+                progress(result)
+    return results
+
+
+def compare(results, baseline, threshold: float = DEFAULT_THRESHOLD):
+    """Находит замеры, которые стали медленнее базовых больше чем на threshold (доля).
+    Возвращает список (имя, ширина, базовая скорость, текущая скорость)."""
+    saved = {(entry['benchmark'], entry['width']): entry['ops_per_sec'] for entry in baseline}
+    regressions = []
+    for entry in results:
+        key = (entry['benchmark'], entry['width'])
+        if key in saved and entry['ops_per_sec'] < saved[key] * (1 - threshold):
+            regressions.append((*key, saved[key], entry['ops_per_sec']))
+    return regressions
+
+
+def save(path: str, results):
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+
+
+def load(path: str):
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)['results']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры скорости операций LR_1 в зависимости от ширины операндов")
+    parser.add_argument('--output', default='benchmark_results.json', help="куда сохранить результаты (JSON)")
+    parser.add_argument('--baseline', help="JSON с базовыми результатами для поиска регрессий")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="допустимое замедление относительно базовых результатов (доля)")
+    parser.add_argument('--max-width', type=int, default=DEFAULT_WIDTHS[-1], help="наибольшая ширина операндов")
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME, help="время на один замер, с")
+    parser.add_argument('--only', nargs='*', choices=list(BENCHMARKS), help="запустить только эти замеры")
+    args = parser.parse_args(argv)
+
+    widths = [width for width in DEFAULT_WIDTHS if width <= args.max_width]
+    print(f"{'Замер':<28} {'Бит':>6} {'Оп/с':>14} {'Пик памяти, Б':>14}")
+    results = run(args.only, widths, args.min_time, progress=lambda result: print(
+        f"{result['benchmark']:<28} {result['width']:>6} {result['ops_per_sec']:>14.1f} {result['peak_bytes']:>14}"))
+    save(args.output, results)
+    print(f"\nРезультаты сохранены в {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, load(args.baseline), args.threshold)
+        for name, width, before, after in regressions:
+            print(f"РЕГРЕССИЯ {name} ({width} бит): {before:.1f} -> {after:.1f} оп/с")
+        if regressions:
+            return 1
+        print("Регрессий нет")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,38 @@
-﻿from binary_converter import BinaryConverter
+﻿from itertools import chain
+
+from adders import ADDER_KOGGE_STONE, ADDER_RIPPLE, Adders
+from binary_converter import BinaryConverter
+from bit_vector import BitVector
 from decimal_converter import DecimalConverter
+from divider import Divider
+from int_engine import ENGINE_INT, ENGINE_STR, IntEngine, check_engine
 
 BITS_OF_MANTISSA = 24
 BITS_OF_IEEE754 = 32
 BITS_OF_EXPONENT = 9
+# Цифра радикс-4 кодирования Бута по тройке битов множителя (b[2i+1], b[2i], b[2i-1])
+BOOTH_DIGITS = {'000': 0, '001': 1, '010': 1, '011': 2, '100': -2, '101': -1, '110': -1, '111': 0}
 
 
 class BinaryCalculator:
+    # Движок по умолчанию: 'str' (эталонный, побитовый на строках) или 'int'
+    engine = ENGINE_STR
+
+    @staticmethod
+    def set_engine(engine: str):
+        """Глобально выбирает движок вычислений для всех операций."""
+        BinaryCalculator.engine = check_engine(engine)
+        DecimalConverter.engine = engine
+
+    @staticmethod
+    def resolve_engine(engine=None, *operands) -> str:
+        """Возвращает движок для вызова: переданный явно или глобальный.
+        Операнды BitVector всегда обрабатываются движком 'int', он же возвращает BitVector."""
+        engine = check_engine(BinaryCalculator.engine if engine is None else engine)
+        if any(isinstance(operand, BitVector) for operand in operands):
+            return ENGINE_INT
+        return engine
+
     @staticmethod
     def sign_extend(bin_str: str, new_len: int) -> str:
         """Расширяет двоичное число до new_len бит с учетом знака.
@@ -17,7 +43,11 @@ class BinaryCalculator:
         sign_bit = bin_str[0]
         return sign_bit * (new_len - len(bin_str)) + bin_str
 
-    def add_binaries(bin1, bin2):
+    @staticmethod
+    def add_binaries(bin1, bin2, engine=None):
+        if BinaryCalculator.resolve_engine(engine, bin1, bin2) == ENGINE_INT:
+            return IntEngine.add_binaries(bin1, bin2)
+
         max_len = max(len(bin1), len(bin2))
     
         # Дополняем строки нулями до одинаковой длины
@@ -45,12 +75,47 @@ class BinaryCalculator:
 
 
     @staticmethod
-    def sum_additional_code(bin1, bin2):
+    def add_with_cost(bin1: str, bin2: str, adder: str = ADDER_RIPPLE):
+        """Складывает как add_binaries, моделируя выбранный аппаратный сумматор (см. adders.py).
+        Возвращает (результат, {'gates': число вентилей, 'depth': длина критического пути})."""
+        return Adders.add(bin1, bin2, adder)
+
+
+    @staticmethod
+    def add_many_with_cost(operands, adder: str = ADDER_KOGGE_STONE):
+        """Складывает несколько беззнаковых чисел деревом сумматоров с сохранением переноса;
+        последняя пара складывается сумматором adder. Возвращает (результат, стоимость)."""
+        return Adders.carry_save(operands, adder)
+
+
+    @staticmethod
+    def check_width(width, *codes):
+        """Проверяет, что коды помещаются в регистр фиксированной ширины."""
+        for code in codes:
+            if len(code) > width:
+                raise ValueError(f"Код {code} не помещается в {width} бит.")
+
+
+    @staticmethod
+    def sum_additional_code(bin1, bin2, engine=None, width=None):
+        """Складывает два двоичных числа в дополнительном коде.
+        Если задана ширина width, результат всегда занимает ровно width бит (перенос отбрасывается),
+        как в регистре фиксированной ширины; флаги переноса и переполнения дает ALU.
+        """
+        if width is not None:
+            BinaryCalculator.check_width(width, bin1, bin2)
+        if BinaryCalculator.resolve_engine(engine, bin1, bin2) == ENGINE_INT:
+            return IntEngine.sum_additional_code(bin1, bin2, width)
+        if width is not None:
+            bin1 = BinaryCalculator.sign_extend(bin1, width)
+            bin2 = BinaryCalculator.sign_extend(bin2, width)
+            return BinaryCalculator.sum_additional_code(bin1, bin2, engine=ENGINE_STR)[-width:]
+
         max_len = max(len(bin1), len(bin2)) + 1  # Увеличиваем max_len на 1
         bin1 = BinaryCalculator.sign_extend(bin1, max_len)
         bin2 = BinaryCalculator.sign_extend(bin2, max_len)
 
-        result = BinaryCalculator.add_binaries(bin1, bin2)
+        result = BinaryCalculator.add_binaries(bin1, bin2, engine=ENGINE_STR)
 
         # Если результат длиннее max_len, обрезаем лишний бит
         if len(result) > max_len:
@@ -60,8 +125,63 @@ class BinaryCalculator:
 
 
     @staticmethod
-    def subtract_additional_code(bin1: str, bin2: str) -> str:
-        """Вычитает два двоичных числа в дополнительном коде."""
+    def sum_width(codes) -> int:
+        """Ширина, в которую гарантированно помещается сумма кодов: max_len + ceil(log2 N)."""
+        return max(len(code) for code in codes) + (len(codes) - 1).bit_length()
+
+
+    @staticmethod
+    def carry_save_step(bin1: str, bin2: str, bin3: str):
+        """Сводит три кода одной длины к двум без распространения переноса:
+        поразрядная сумма и переносы, сдвинутые на разряд влево (старший перенос отбрасывается)."""
+        sum_bits = []
+        carry_bits = []
+        for bit_a, bit_b, bit_c in zip(bin1, bin2, bin3):
+            ones = (bit_a == '1') + (bit_b == '1') + (bit_c == '1')
+            sum_bits.append('1' if ones % 2 else '0')
+            carry_bits.append('1' if ones >= 2 else '0')
+        return ''.join(sum_bits), ''.join(carry_bits[1:]) + '0'
+
+
+    @staticmethod
+    def sum_many(codes, engine=None, width=None) -> str:
+        """Складывает список кодов в дополнительном коде за один проход.
+        Ширина результата вычисляется один раз по числу слагаемых (см. sum_width)
+        или задается width, как в sum_additional_code.
+        Строковый движок сводит слагаемые деревом сумматоров с сохранением переноса (3 -> 2,
+        общее с моделью Adders.carry_save, см. Adders.reduce_rows) и выполняет одно сложение
+        с распространением переноса в конце; движок 'int' просто накапливает сумму в целом числе."""
+        codes = list(codes)
+        if not codes:
+            raise ValueError("Нужно хотя бы одно слагаемое.")
+        if width is not None:
+            BinaryCalculator.check_width(width, *codes)
+        else:
+            width = BinaryCalculator.sum_width(codes)
+        if BinaryCalculator.resolve_engine(engine, *codes) == ENGINE_INT:
+            return IntEngine.sum_many(codes, width)
+
+        rows = Adders.reduce_rows([BinaryCalculator.sign_extend(code, width) for code in codes],
+                                  BinaryCalculator.carry_save_step)
+        if len(rows) == 1:
+            return rows[0]
+        # Вычисления идут по модулю 2^width, поэтому перенос за пределы width отбрасывается
+        return BinaryCalculator.add_binaries(rows[0], rows[1], engine=ENGINE_STR)[-width:]
+
+
+    @staticmethod
+    def subtract_additional_code(bin1: str, bin2: str, engine=None, width=None) -> str:
+        """Вычитает два двоичных числа в дополнительном коде.
+        Ширина width работает так же, как в sum_additional_code."""
+        if width is not None:
+            BinaryCalculator.check_width(width, bin1, bin2)
+        if BinaryCalculator.resolve_engine(engine, bin1, bin2) == ENGINE_INT:
+            return IntEngine.subtract_additional_code(bin1, bin2, width)
+        if width is not None:
+            bin1 = BinaryCalculator.sign_extend(bin1, width)
+            bin2 = BinaryCalculator.sign_extend(bin2, width)
+            return BinaryCalculator.subtract_additional_code(bin1, bin2, engine=ENGINE_STR)[-width:]
+
         # Увеличиваем max_len на 1, чтобы учесть возможный перенос
         max_len = max(len(bin1), len(bin2)) + 1
         bin1 = BinaryCalculator.sign_extend(bin1, max_len)
@@ -71,10 +191,10 @@ class BinaryCalculator:
         inverted_bin2 = ''.join('1' if bit == '0' else '0' for bit in bin2)
 
         # Добавляем 1 к инвертированному bin2 (получаем дополнительный код)
-        bin2_twos_complement = BinaryCalculator.sum_additional_code(inverted_bin2, '1'.zfill(max_len))
+        bin2_twos_complement = BinaryCalculator.sum_additional_code(inverted_bin2, '1'.zfill(max_len), engine=ENGINE_STR)
 
         # Складываем bin1 и bin2_twos_complement
-        result = BinaryCalculator.sum_additional_code(bin1, bin2_twos_complement)
+        result = BinaryCalculator.sum_additional_code(bin1, bin2_twos_complement, engine=ENGINE_STR)
 
         # Обрезаем результат до max_len
         if len(result) > max_len:
@@ -84,8 +204,13 @@ class BinaryCalculator:
 
 
     @staticmethod
-    def multiply_direct_code(bin1: str, bin2: str) -> str:
-        """Умножает два двоичных числа в прямом коде."""
+    def multiply_direct_code(bin1: str, bin2: str, engine=None, method=None) -> str:
+        """Умножает два двоичных числа в прямом коде.
+        В движке 'int' method выбирает алгоритм умножения модулей (см. multiplier.py),
+        по умолчанию он выбирается по ширине модулей (Multiplier.choose_method).
+        """
+        if BinaryCalculator.resolve_engine(engine, bin1, bin2) == ENGINE_INT:
+            return IntEngine.multiply_direct_code(bin1, bin2, method)
 
         # Определяем знак результата
         sign = '0' if bin1[0] == bin2[0] else '1'
@@ -103,19 +228,75 @@ class BinaryCalculator:
                 # Сдвигаем bin1_mod на (len(bin2_mod) - 1 - i) позиций влево
                 shifted_bin1 = bin1_mod + '0' * (len(bin2_mod) - 1 - i)
                 # Складываем result и shifted_bin1
-                result = BinaryCalculator.add_binaries(result, shifted_bin1)
+                result = BinaryCalculator.add_binaries(result, shifted_bin1, engine=ENGINE_STR)
 
         # Добавляем знак к результату
         return sign + result
 
 
     @staticmethod
-    def division_direct_code(dividend, divisor, precision=5):
+    def booth_partial_products(bin1: str, bin2: str, width: int):
+        """Частичные произведения радикс-4 умножения Бута для кодов в дополнительном коде.
+        Множитель bin2 просматривается тройками битов с перекрытием в один бит, каждая тройка
+        дает цифру из {-2, -1, 0, 1, 2}, поэтому слагаемых вдвое меньше, чем битов множителя.
+        Отрицательные слагаемые записываются инвертированными, а недостающие единицы
+        собираются в отдельную строку поправок. Все строки занимают ровно width бит."""
+        multiplicand = BinaryCalculator.sign_extend(bin1, width)
+        doubled = multiplicand[1:] + '0'
+        # Неявный нуль справа и расширение знаком до четной длины
+        multiplier = BinaryCalculator.sign_extend(bin2, len(bin2) + len(bin2) % 2) + '0'
+        rows = []
+        corrections = ['0'] * width
+        for shift in range(0, len(multiplier) - 1, 2):
+            end = len(multiplier) - shift
+            triple = multiplier[end - 3:end]
+            digit = BOOTH_DIGITS[triple]
+            if digit == 0:
+                continue
+            row = multiplicand if abs(digit) == 1 else doubled
+            if digit < 0:
+                row = ''.join('1' if bit == '0' else '0' for bit in row)
+                corrections[width - 1 - shift] = '1'
+            rows.append((row + '0' * shift)[-width:])
+        if '1' in corrections:
+            rows.append(''.join(corrections))
+        return rows
+
+
+    @staticmethod
+    def multiply_additional_code(bin1: str, bin2: str, engine=None, full=False) -> str:
+        """Умножает два числа в дополнительном коде без перевода в прямой код.
+        При full=True результат занимает полную двойную ширину len(bin1) + len(bin2),
+        иначе – наименьшую ширину, в которую помещается произведение со знаком.
+        Строковый движок использует радикс-4 умножение Бута и складывает частичные
+        произведения деревом сумматоров с сохранением переноса (sum_many)."""
+        if BinaryCalculator.resolve_engine(engine, bin1, bin2) == ENGINE_INT:
+            return IntEngine.multiply_additional_code(bin1, bin2, full)
+
+        width = len(bin1) + len(bin2)
+        rows = BinaryCalculator.booth_partial_products(bin1, bin2, width)
+        product = BinaryCalculator.sum_many(rows, engine=ENGINE_STR, width=width) if rows else '0' * width
+        if full:
+            return product
+        # Отбрасываем повторяющиеся знаковые биты
+        sign = product[0]
+        start = 0
+        while start < width - 1 and product[start + 1] == sign:
+            start += 1
+        return product[start:]
+
+
+    @staticmethod
+    def division_direct_code(dividend, divisor, precision=5, engine=None):
         """
         Выполняет деление двух двоичных чисел в прямом коде.
-        Возвращает результат с точностью до precision знаков после запятой.
+        Возвращает результат с точностью до precision знаков после запятой
+        (при precision = 0 – целое частное без точки).
         Удаляет лишние нули перед знаковым битом в целой части.
         """
+        if BinaryCalculator.resolve_engine(engine, dividend, divisor) == ENGINE_INT:
+            return IntEngine.division_direct_code(dividend, divisor, precision)
+
         # Определяем знак результата
         sign = '0' if dividend[0] == divisor[0] else '1'
     
@@ -146,18 +327,47 @@ class BinaryCalculator:
             else:
                 result += '0'
     
-        # Вставляем точку
-        result = result[:-precision] + '.' + result[-precision:]
+        # Отделяем дробную часть (при precision = 0 ее нет, и точка не ставится)
+        int_part = result[:len(result) - precision]
+        frac_part = result[len(result) - precision:]
     
         # Удаляем ведущие нули в целой части
-        int_part, frac_part = result.split('.')
         int_part = int_part.lstrip('0') or '0'  # Удаляем ведущие нули, оставляя хотя бы один ноль
-        result = int_part + '.' + frac_part
+        result = int_part + '.' + frac_part if precision else int_part
     
         # Возвращаем результат с учетом знака
         return sign + result
 
 
+    @staticmethod
+    def divmod_direct_code(dividend, divisor, precision=5):
+        """
+        Делит два двоичных числа в прямом коде целочисленным делителем без восстановления остатка.
+        Возвращает пару (частное, остаток): частное в формате division_direct_code,
+        остаток в прямом коде со знаком делимого, в единицах 2^-precision.
+        """
+        return IntEngine.divmod_direct_code(dividend, divisor, precision)
+
+
+    @staticmethod
+    def iter_division_direct_code(dividend, divisor):
+        """
+        Лениво выдает результат деления в прямом коде: сначала знак с целой частью и точкой,
+        затем по одному биту дробной части. Вызывающий может остановиться на любой точности;
+        если деление выполнилось нацело, выдается только знак с целой частью, без точки.
+        Делитель проверяется сразу при вызове, а не при первом next().
+        """
+        sign = '0' if dividend[0] == divisor[0] else '1'
+        divisor_value = IntEngine.to_unsigned(divisor[1:])
+        if divisor_value == 0:
+            raise ValueError("Деление на ноль невозможно")
+
+        quotient, remainder = Divider.non_restoring(IntEngine.to_unsigned(dividend[1:]), divisor_value)
+        if not remainder:
+            return iter((sign + format(quotient, 'b'),))
+        return chain((sign + format(quotient, 'b') + '.',), Divider.fraction_bits(remainder, divisor_value))
+
+
     @staticmethod
     def binary_compare(bin1, bin2):
         """
@@ -1,28 +1,56 @@
-﻿PLUS_TO_EXPONENT = 127
+﻿from decimal import Decimal
+from fractions import Fraction
+
+from bit_vector import BitVector
+from ieee754_bulk import IEEE754Bulk
+from radix import RADIX_BUILTIN, RADIX_SPLIT, RadixConverter, check_radix_method
+
+PLUS_TO_EXPONENT = 127
 BITS_OF_MANTISSA = 23
+FRACTION_PRECISION = 10
 
 
 class BinaryConverter:
-    def __init__(self, number):
+    """Коды одного числа. Каждый вызов direct_code/reverse_code/additional_code считает код заново;
+    если одни и те же числа переводятся многократно, используйте conversion_cache (см. conversion_cache.py).
+    """
+
+    def __init__(self, number, precision=FRACTION_PRECISION, width=None):
+        """precision – число бит дробной части,
+        width – ширина целой части кода вместе со знаковым битом (None – минимально необходимая)."""
         self.number = number
+        self.precision = precision
+        self.width = width
 
 
     @staticmethod
-    def to_binary(num: int) -> str:
-        """Переводит целую часть числа в двоичный формат (без знака)."""
-        if num == 0:
-            return "0"  # Особый случай для числа 0
+    def to_binary(num: int, method: str = RADIX_BUILTIN) -> str:
+        """Переводит целую часть числа в двоичный формат (без знака).
+        method: RADIX_BUILTIN – встроенный format (линейный), RADIX_SPLIT – «разделяй и властвуй»
+        по степеням 2^k, RADIX_LOOP – деление на 2 с добавлением цифры в начало (квадратичный)."""
+        check_radix_method(method)
+        if method == RADIX_BUILTIN:
+            return format(num, 'b')
+        if method == RADIX_SPLIT:
+            return RadixConverter.split_to_binary(num)
+        return RadixConverter.loop_to_binary(num)
 
-        binary = ""
-        while num > 0:
-            binary = str(num % 2) + binary  # Добавляем остаток в начало строки
-            num = num // 2  # Делим число на 2
-        return binary
+
+    @staticmethod
+    def decimal_to_binary(digits: str) -> str:
+        """Переводит десятичную запись целого (строку любой длины) в двоичную без знака."""
+        value = RadixConverter.decimal_to_int(digits)
+        if value < 0:
+            raise ValueError("Перевод поддерживает только неотрицательные числа.")
+        return format(value, 'b')
 
 
     @staticmethod
     def frac_to_binary(frac: float, precision: int = 10) -> str:
-        """Переводит дробную часть числа в двоичный формат."""
+        """Переводит дробную часть числа в двоичный формат.
+        Fraction и Decimal переводятся точно, через предпериод и период (см. exact_frac_to_binary)."""
+        if isinstance(frac, (Fraction, Decimal)):
+            return BinaryConverter.expand_fraction(*BinaryConverter.exact_frac_to_binary(frac), precision)
         binary = ""
         while frac and len(binary) < precision:
             frac *= 2
@@ -32,6 +60,43 @@ class BinaryConverter:
         return binary
 
 
+    @staticmethod
+    def exact_frac_to_binary(frac) -> tuple:
+        """Точно переводит дробную часть (Fraction, Decimal, float или int) в двоичную дробь.
+        Возвращает (предпериод, период): 1/3 -> ('', '01'), 5/8 -> ('101', ''), 1/10 -> ('0', '0011').
+        Каждый остаток запоминается вместе с позицией бита; повтор остатка означает начало периода,
+        поэтому работа занимает O(длина предпериода + длина периода) шагов."""
+        frac = Fraction(frac)
+        if not 0 <= frac < 1:
+            raise ValueError(f"Дробная часть должна лежать в [0, 1), получено {frac}.")
+        denominator = frac.denominator
+        remainder = frac.numerator
+        positions = {}
+        bits = []
+        while remainder and remainder not in positions:
+            positions[remainder] = len(bits)
+            remainder <<= 1
+            if remainder >= denominator:
+                remainder -= denominator
+                bits.append('1')
+            else:
+                bits.append('0')
+        binary = ''.join(bits)
+        if not remainder:
+            return binary, ''
+        start = positions[remainder]
+        return binary[:start], binary[start:]
+
+
+    @staticmethod
+    def expand_fraction(prefix: str, period: str, precision: int) -> str:
+        """Разворачивает (предпериод, период) в первые precision бит дроби."""
+        if not period or len(prefix) >= precision:
+            return prefix[:precision]
+        repeats = -(-(precision - len(prefix)) // len(period))
+        return (prefix + period * repeats)[:precision]
+
+
     def direct_code(self) -> str:
         """Возвращает прямой код числа (включая дробную часть, если она есть)."""
         # Разделяем число на целую и дробную части
@@ -40,10 +105,14 @@ class BinaryConverter:
 
         # Преобразуем целую часть
         int_binary = self.to_binary(int_part)
+        if self.width is not None:
+            if len(int_binary) > self.width - 1:
+                raise ValueError(f"Число {self.number} не помещается в {self.width} бит.")
+            int_binary = int_binary.zfill(self.width - 1)
 
         # Преобразуем дробную часть, если она есть
         if frac_part != 0:
-            frac_binary = self.frac_to_binary(frac_part)
+            frac_binary = self.frac_to_binary(frac_part, self.precision)
             binary = int_binary + '.' + frac_binary
         else:
             binary = int_binary
@@ -60,55 +129,107 @@ class BinaryConverter:
         direct = self.direct_code()
         if self.number >= 0:
             return direct
-        else:
-            # Инвертируем все биты, кроме знакового
-            reversed_bits = '1'
-            for bit in direct[1:]:  # Пропускаем знаковый бит
-                if bit == '0':
-                    reversed_bits += '1'
-                elif bit == '1':
-                    reversed_bits += '0'
-                else:
-                    reversed_bits += '.'  # Сохраняем точку
-            return reversed_bits
+        return self.invert_code(direct)
+
+
+    def is_additional_min(self) -> bool:
+        """Число равно -2^(width-1): оно есть в дополнительном коде ширины width,
+        но не помещается в прямой и обратный коды той же ширины."""
+        return self.width is not None and self.width > 0 and self.number == -(1 << (self.width - 1))
 
 
     def additional_code(self) -> str:
         """Возвращает дополнительный код числа (включая дробную часть)."""
+        if self.is_additional_min():
+            return '1' + '0' * (self.width - 1)
         reverse = self.reverse_code()
         if self.number >= 0:
             return reverse
-        else:
-            # Разделяем на целую и дробную части
-            reverse_list = reverse.split('.')
-            int_part = reverse_list[0]  # Целая часть всегда есть
-
-            # Если есть дробная часть, обрабатываем её
-            if len(reverse_list) > 1:
-                frac_part = reverse_list[1]
-                # Добавляем 1 к дробной части
-                frac_list = list(frac_part)
-                carry = 1
-                for i in range(len(frac_list) - 1, -1, -1):
-                    if frac_list[i] == '0' and carry == 1:
-                        frac_list[i] = '1'
-                        carry = 0
-                    elif frac_list[i] == '1' and carry == 1:
-                        frac_list[i] = '0'
-                frac_part = ''.join(frac_list)
-                return int_part + '.' + frac_part
+        return self.increment_code(reverse)
+
+
+    def codes(self):
+        """Возвращает прямой, обратный и дополнительный коды за один проход:
+        каждый следующий код получается из предыдущего, а не вычисляется заново.
+        Для -2^(width-1) прямого и обратного кодов нет, вместо них возвращается None."""
+        if self.is_additional_min():
+            return None, None, self.additional_code()
+        direct = self.direct_code()
+        if self.number >= 0:
+            return direct, direct, direct
+        reverse = self.invert_code(direct)
+        return direct, reverse, self.increment_code(reverse)
+
+
+    def bit_vectors(self):
+        """Возвращает прямой, обратный и дополнительный коды целого числа в виде BitVector.
+        Коды вычисляются операциями над словом целиком, без строк; ширина и None для -2^(width-1) – как у codes()."""
+        if self.number != int(self.number):
+            raise ValueError("Коды BitVector поддерживаются только для целых чисел.")
+        number = int(self.number)
+        magnitude = abs(number)
+        # Целая часть занимает хотя бы один бит, как в to_binary(0) == '0'
+        width = max(magnitude.bit_length(), 1) + 1 if self.width is None else self.width
+        if self.is_additional_min():
+            return None, None, BitVector(magnitude, width)
+        if magnitude.bit_length() > width - 1:
+            raise ValueError(f"Число {self.number} не помещается в {width} бит.")
+        direct = BitVector(magnitude, width)
+        if number >= 0:
+            return direct, direct, direct
+        direct = BitVector(magnitude | 1 << (width - 1), width)
+        reverse = ~direct | BitVector(1 << (width - 1), width)
+        return direct, reverse, BitVector((reverse.value + 1) & ((1 << width) - 1), width)
+
+
+    @staticmethod
+    def invert_code(direct: str) -> str:
+        """Получает обратный код отрицательного числа из прямого."""
+        # Инвертируем все биты, кроме знакового
+        reversed_bits = '1'
+        for bit in direct[1:]:  # Пропускаем знаковый бит
+            if bit == '0':
+                reversed_bits += '1'
+            elif bit == '1':
+                reversed_bits += '0'
             else:
-                # Если дробной части нет, добавляем 1 к целой части
-                int_list = list(int_part)
-                carry = 1
-                for i in range(len(int_list) - 1, -1, -1):
-                    if int_list[i] == '0' and carry == 1:
-                        int_list[i] = '1'
-                        carry = 0
-                    elif int_list[i] == '1' and carry == 1:
-                        int_list[i] = '0'
-                int_part = ''.join(int_list)
-                return int_part
+                reversed_bits += '.'  # Сохраняем точку
+        return reversed_bits
+
+
+    @staticmethod
+    def increment_code(reverse: str) -> str:
+        """Получает дополнительный код отрицательного числа из обратного."""
+        # Разделяем на целую и дробную части
+        reverse_list = reverse.split('.')
+        int_part = reverse_list[0]  # Целая часть всегда есть
+
+        # Если есть дробная часть, обрабатываем её
+        if len(reverse_list) > 1:
+            frac_part = reverse_list[1]
+            # Добавляем 1 к дробной части
+            frac_list = list(frac_part)
+            carry = 1
+            for i in range(len(frac_list) - 1, -1, -1):
+                if frac_list[i] == '0' and carry == 1:
+                    frac_list[i] = '1'
+                    carry = 0
+                elif frac_list[i] == '1' and carry == 1:
+                    frac_list[i] = '0'
+            frac_part = ''.join(frac_list)
+            return int_part + '.' + frac_part
+        else:
+            # Если дробной части нет, добавляем 1 к целой части
+            int_list = list(int_part)
+            carry = 1
+            for i in range(len(int_list) - 1, -1, -1):
+                if int_list[i] == '0' and carry == 1:
+                    int_list[i] = '1'
+                    carry = 0
+                elif int_list[i] == '1' and carry == 1:
+                    int_list[i] = '0'
+            int_part = ''.join(int_list)
+            return int_part
 
 
 
@@ -154,6 +275,12 @@ class BinaryConverter:
 
 
 
+    @staticmethod
+    def ieee754_many(values, bits=32, as_strings=True):
+        """Переводит массив чисел в коды IEEE-754 на 32 или 64 бита за один проход (см. IEEE754Bulk)."""
+        return IEEE754Bulk.encode(values, bits, as_strings)
+
+
     def __str__(self):
         return (f"Число введено: {self.number}\n"
                 f"Прямой код: {self.direct_code()}\n"
@@ -0,0 +1,120 @@
+class BitVector:
+    """Компактный двоичный код фиксированной ширины: биты хранятся в одном целом value,
+    ширина – в width. Строка из '0' и '1' создается только по требованию (str()).
+    Индексация повторяет строки: bits[0] – старший (знаковый) бит в виде '0' или '1',
+    срез дает новый BitVector, поэтому код, написанный для строк, работает и с BitVector.
+    Побитовые операции и сдвиги выполняются над словом целиком, в пределах width бит.
+    """
+
+    __slots__ = ('value', 'width')
+
+    def __init__(self, value: int = 0, width: int = 1):
+        if width < 0 or not 0 <= value < 1 << width:
+            raise ValueError(f"Число {value} не помещается в {width} бит.")
+        self.value = value
+        self.width = width
+
+    @classmethod
+    def from_str(cls, bin_str: str) -> 'BitVector':
+        if bin_str.strip('01'):
+            raise ValueError(f"Код может содержать только '0' и '1': {bin_str}")
+        return cls(int(bin_str, 2) if bin_str else 0, len(bin_str))
+
+    @classmethod
+    def from_signed(cls, value: int, width: int) -> 'BitVector':
+        """Записывает целое со знаком в дополнительном коде ширины width."""
+        if not -(1 << width >> 1) <= value < 1 << width >> 1:
+            raise ValueError(f"Число {value} не помещается в {width} бит.")
+        return cls(value & ((1 << width) - 1), width)
+
+    @staticmethod
+    def coerce(code) -> 'BitVector':
+        """Возвращает BitVector для строки или BitVector."""
+        return code if isinstance(code, BitVector) else BitVector.from_str(code)
+
+    def to_signed(self) -> int:
+        if self.width and self.value >> (self.width - 1):
+            return self.value - (1 << self.width)
+        return self.value
+
+    def sign_extend(self, width: int) -> 'BitVector':
+        if width <= self.width:
+            return self
+        if self.width and self.value >> (self.width - 1):
+            return BitVector(self.value | ((1 << width) - (1 << self.width)), width)
+        return BitVector(self.value, width)
+
+    def to_bytes(self) -> bytes:
+        """Упакованное представление: (width + 7) // 8 байт, старший бит первым, с заполнением справа."""
+        size = (self.width + 7) // 8
+        return (self.value << (size * 8 - self.width)).to_bytes(size, 'big')
+
+    def __str__(self):
+        return format(self.value, f'0{self.width}b') if self.width else ''
+
+    def __repr__(self):
+        return f"BitVector('{self}')"
+
+    def __len__(self):
+        return self.width
+
+    def __int__(self):
+        return self.value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.width)
+            if step != 1:
+                return BitVector.from_str(str(self)[index])
+            stop = max(start, stop)
+            return BitVector((self.value >> (self.width - stop)) & ((1 << (stop - start)) - 1), stop - start)
+        if index < 0:
+            index += self.width
+        if not 0 <= index < self.width:
+            raise IndexError("Индекс бита вне кода.")
+        return '1' if self.value >> (self.width - 1 - index) & 1 else '0'
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __eq__(self, other):
+        if isinstance(other, BitVector):
+            return self.width == other.width and self.value == other.value
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        # BitVector равен своей строке, поэтому и хеш у них должен совпадать
+        return hash(str(self))
+
+    def __add__(self, other):
+        """Конкатенация, как у строк."""
+        other = BitVector.coerce(other)
+        return BitVector(self.value << other.width | other.value, self.width + other.width)
+
+    def _check_width(self, other):
+        if self.width != other.width:
+            raise ValueError("Коды должны быть одинаковой ширины.")
+
+    def __and__(self, other):
+        self._check_width(other)
+        return BitVector(self.value & other.value, self.width)
+
+    def __or__(self, other):
+        self._check_width(other)
+        return BitVector(self.value | other.value, self.width)
+
+    def __xor__(self, other):
+        self._check_width(other)
+        return BitVector(self.value ^ other.value, self.width)
+
+    def __invert__(self):
+        return BitVector(self.value ^ ((1 << self.width) - 1), self.width)
+
+    def __lshift__(self, count: int):
+        return BitVector((self.value << count) & ((1 << self.width) - 1), self.width)
+
+    def __rshift__(self, count: int):
+        """Логический сдвиг вправо."""
+        return BitVector(self.value >> count, self.width)
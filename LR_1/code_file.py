@@ -0,0 +1,188 @@
+from collections.abc import Sequence
+import mmap
+import os
+import struct
+
+from bit_vector import BitVector
+
+FORMAT_TEXT = 'text'
+FORMAT_PACKED = 'packed'
+FORMATS = (FORMAT_TEXT, FORMAT_PACKED)
+
+# Заголовок упакованного файла: сигнатура, ширина кода в битах, число кодов
+PACKED_MAGIC = b'LR1B'
+PACKED_HEADER = struct.Struct('<4sIQ')
+
+
+def packed_record_size(width: int) -> int:
+    return (width + 7) // 8
+
+
+class CodeFile(Sequence):
+    """Файл кодов фиксированной ширины, отображенный в память (mmap).
+    Текстовый формат – по одному коду из '0' и '1' на строке; упакованный – заголовок
+    PACKED_HEADER и коды по packed_record_size(width) байт, старший бит первым.
+    Формат определяется по сигнатуре. Коды читаются по требованию: файл не загружается
+    в память целиком, а объект ведет себя как последовательность строк и подходит
+    везде, где ожидается список операндов (BinaryCalculator, BatchCalculator, DecimalConverter.decode_many).
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._buffer = b''
+        try:
+            self._read_header(path)
+        except (OSError, ValueError):
+            # Файл и отображение не должны оставаться открытыми, если объект не создан
+            self.close()
+            raise
+
+    def _read_header(self, path: str):
+        size = os.fstat(self._file.fileno()).st_size
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+        if self._buffer[:len(PACKED_MAGIC)] == PACKED_MAGIC:
+            self.format = FORMAT_PACKED
+            if size < PACKED_HEADER.size:
+                raise ValueError(f"Файл {path} обрезан: заголовок короче {PACKED_HEADER.size} байт.")
+            _, self.width, self._count = PACKED_HEADER.unpack_from(self._buffer)
+            self._offset = PACKED_HEADER.size
+            self._record = packed_record_size(self.width)
+            if self._offset + self._count * self._record > size:
+                raise ValueError(f"Файл {path} обрезан: ожидалось {self._count} кодов.")
+            return
+
+        self.format = FORMAT_TEXT
+        self._offset = 0
+        line_end = self._buffer.find(b'\n')
+        if line_end == -1:
+            # Одна строка без перевода строки (или пустой файл)
+            self.width = size
+            self._record = size
+            self._count = 1 if size else 0
+            return
+        self.width = line_end - (line_end > 0 and self._buffer[line_end - 1:line_end] == b'\r')
+        self._record = line_end + 1
+        # Последняя строка может быть без перевода строки
+        self._count, rest = divmod(size, self._record)
+        if rest == self.width:
+            self._count += 1
+        elif rest:
+            raise ValueError(f"Коды в файле {path} должны быть одинаковой ширины.")
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Индекс кода вне файла.")
+        if self.format == FORMAT_TEXT:
+            return self._text_code(index).decode('ascii')
+        return format(self.value(index), f'0{self.width}b')
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def value(self, index: int) -> int:
+        """Возвращает код с номером index как беззнаковое целое, не создавая строку
+        для упакованного формата."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Индекс кода вне файла.")
+        if self.format == FORMAT_TEXT:
+            code = self._text_code(index)
+            return int(code, 2) if code else 0
+        start = self._offset + index * self._record
+        # Лишние младшие биты последнего байта – заполнение
+        return int.from_bytes(self._buffer[start:start + self._record], 'big') >> (self._record * 8 - self.width)
+
+    def bit_vector(self, index: int) -> BitVector:
+        return BitVector(self.value(index), self.width)
+
+    def _text_code(self, index: int) -> bytes:
+        start = index * self._record
+        end = start + self._record
+        # Ширина строк и символы проверяются при чтении, чтобы не просматривать файл заранее
+        code = self._buffer[start:start + self.width]
+        if b'\n' in code or end <= len(self._buffer) and self._buffer[end - 1:end] != b'\n':
+            raise ValueError(f"Код номер {index} имеет ширину, отличную от {self.width} бит.")
+        if code.strip(b'01'):
+            raise ValueError(f"Код номер {index} должен состоять только из '0' и '1'.")
+        return code
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CodeFileWriter:
+    """Потоковая запись кодов фиксированной ширины в текстовом или упакованном формате.
+    Коды (строки из '0' и '1' или беззнаковые целые) записываются по мере поступления;
+    число кодов в заголовке упакованного файла дописывается при закрытии."""
+
+    def __init__(self, path: str, width: int, file_format: str = FORMAT_PACKED):
+        if file_format not in FORMATS:
+            raise ValueError(f"Неизвестный формат файла кодов: {file_format}")
+        if width < 1:
+            raise ValueError("Ширина кода должна быть положительной.")
+        self.width = width
+        self.format = file_format
+        self.count = 0
+        self._record = packed_record_size(width)
+        self._padding = self._record * 8 - width
+        self._file = open(path, 'wb')
+        if file_format == FORMAT_PACKED:
+            self._file.write(PACKED_HEADER.pack(PACKED_MAGIC, width, 0))
+
+    def write(self, code):
+        if isinstance(code, str):
+            if len(code) != self.width:
+                raise ValueError(f"Код {code} не имеет ширину {self.width} бит.")
+            value = int(code, 2)
+        else:
+            if not 0 <= code < 1 << self.width:
+                raise ValueError(f"Число {code} не помещается в {self.width} бит.")
+            value = code
+        if self.format == FORMAT_PACKED:
+            self._file.write((value << self._padding).to_bytes(self._record, 'big'))
+        else:
+            self._file.write(format(value, f'0{self.width}b').encode('ascii') + b'\n')
+        self.count += 1
+
+    def write_many(self, codes):
+        for code in codes:
+            self.write(code)
+        return self.count
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self.format == FORMAT_PACKED:
+            self._file.seek(0)
+            self._file.write(PACKED_HEADER.pack(PACKED_MAGIC, self.width, self.count))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_codes(path: str, codes, width: int, file_format: str = FORMAT_PACKED) -> int:
+    """Записывает коды в файл и возвращает их число."""
+    with CodeFileWriter(path, width, file_format) as writer:
+        return writer.write_many(codes)
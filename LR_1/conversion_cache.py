@@ -0,0 +1,69 @@
+from collections import OrderedDict
+
+from binary_converter import FRACTION_PRECISION, BinaryConverter
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+class ConversionCache:
+    """Ограниченный LRU-кэш кодов BinaryConverter.
+    Ключ – (число, ширина, точность дробной части); при промахе прямой, обратный
+    и дополнительный коды вычисляются за один проход и сохраняются вместе.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError("Размер кэша не может быть отрицательным.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def codes(self, number, width=None, precision=FRACTION_PRECISION):
+        """Возвращает (прямой, обратный, дополнительный) коды числа."""
+        key = (number, width, precision)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = BinaryConverter(number, precision, width).codes()
+        if self.maxsize:
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def direct_code(self, number, width=None, precision=FRACTION_PRECISION) -> str:
+        return self.codes(number, width, precision)[0]
+
+    def reverse_code(self, number, width=None, precision=FRACTION_PRECISION) -> str:
+        return self.codes(number, width, precision)[1]
+
+    def additional_code(self, number, width=None, precision=FRACTION_PRECISION) -> str:
+        return self.codes(number, width, precision)[2]
+
+    def resize(self, maxsize: int):
+        """Меняет размер кэша, вытесняя самые давно использованные записи."""
+        if maxsize < 0:
+            raise ValueError("Размер кэша не может быть отрицательным.")
+        self.maxsize = maxsize
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Общий кэш для модулей, которым не нужен собственный
+conversion_cache = ConversionCache()
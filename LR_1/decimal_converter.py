@@ -1,9 +1,37 @@
-﻿BITS_OF_IEEE754 = 32
+﻿from bit_vector import BitVector
+from ieee754_bulk import IEEE754Bulk
+from int_engine import ENGINE_INT, ENGINE_STR, IntEngine, check_engine
+from radix import RadixConverter
+
+BITS_OF_IEEE754 = 32
 PLUS_TO_EXPONENT = 127
 
+# Виды кодов для массового перевода iter_decode и decode_many
+CODE_DIRECT = 'direct'
+CODE_REVERSE = 'reverse'
+CODE_ADDITIONAL = 'additional'
+CODE_FIXED_POINT = 'fixed_point'
+CODE_KINDS = (CODE_DIRECT, CODE_REVERSE, CODE_ADDITIONAL, CODE_FIXED_POINT)
+# Размер куска, которым читается буфер кодов в iter_buffer_codes
+BUFFER_CHUNK = 1 << 16
+
 class DecimalConverter:
+    # Движок по умолчанию; меняется вместе с движком BinaryCalculator.set_engine
+    engine = ENGINE_STR
+
     @staticmethod
-    def reverse_code_to_decimal(binary_str):
+    def resolve_engine(engine=None, code=None) -> str:
+        """Движок для вызова; код BitVector всегда переводится движком 'int'."""
+        if isinstance(code, BitVector):
+            return ENGINE_INT
+        return check_engine(DecimalConverter.engine if engine is None else engine)
+
+
+    @staticmethod
+    def reverse_code_to_decimal(binary_str, engine=None):
+        if DecimalConverter.resolve_engine(engine, binary_str) == ENGINE_INT:
+            return IntEngine.reverse_code_to_decimal(binary_str)
+
         # Проверяем, является ли число отрицательным (первый бит равен 1)
         is_negative = binary_str[0] == '1'
     
@@ -28,7 +56,11 @@ class DecimalConverter:
         return decimal_value
 
 
-    def additional_code_to_decimal(bin_str):
+    @staticmethod
+    def additional_code_to_decimal(bin_str, engine=None):
+        if DecimalConverter.resolve_engine(engine, bin_str) == ENGINE_INT:
+            return IntEngine.to_signed(bin_str)
+
         n = len(bin_str)
         # Проверяем, является ли число отрицательным
         if bin_str[0] == '1':
@@ -64,7 +96,10 @@ class DecimalConverter:
 
 
     @staticmethod
-    def direct_code_to_decimal_int(binary_str):
+    def direct_code_to_decimal_int(binary_str, engine=None):
+        if DecimalConverter.resolve_engine(engine, binary_str) == ENGINE_INT:
+            return IntEngine.direct_code_to_decimal_int(binary_str)
+
         # Определяем знак по старшему биту
         if binary_str[0] == '1':
             sign = -1  # Отрицательное число
@@ -81,10 +116,13 @@ class DecimalConverter:
 
 
     @staticmethod
-    def direct_code_to_decimal_float(binary):
+    def direct_code_to_decimal_float(binary, engine=None):
         """
         Переводит дробное число из двоичного прямого кода в десятичный формат.
         """
+        if DecimalConverter.resolve_engine(engine, binary) == ENGINE_INT:
+            return IntEngine.direct_code_to_decimal_float(binary)
+
         # Проверяем, есть ли точка в числе
         if '.' not in binary:
             binary += '.'  # Добавляем точку, если её нет
@@ -139,4 +177,70 @@ class DecimalConverter:
             mantissa += int(bit) * (2 ** -(i + 1))
 
         # Вычисляем итоговое значение
-        return sign * mantissa * (2 ** exponent)
\ No newline at end of file
+        return sign * mantissa * (2 ** exponent)
+
+
+    @staticmethod
+    def ieee754_many_to_decimal(codes, bits=32):
+        """
+        Преобразует массив кодов IEEE-754 (строки или беззнаковые целые) в числа за один проход.
+        """
+        return IEEE754Bulk.decode(codes, bits)
+
+
+    @staticmethod
+    def binary_to_decimal(binary_str):
+        """
+        Переводит двоичную запись целого без знака (строку любой длины) в десятичную строку.
+        Время растет почти линейно от длины, ограничение sys.set_int_max_str_digits не действует.
+        """
+        return RadixConverter.int_to_decimal(int(binary_str, 2))
+
+
+    @staticmethod
+    def iter_decode(codes, kind=CODE_ADDITIONAL, engine=None):
+        """
+        Лениво переводит много кодов одного вида (CODE_DIRECT, CODE_REVERSE, CODE_ADDITIONAL или
+        CODE_FIXED_POINT – дробный прямой код) в числа, по одному на каждый код.
+        codes – итерируемый набор строк или буфер (bytes, bytearray, memoryview, mmap) с кодами,
+        разделенными пробельными символами; буфер читается кусками, без копирования целиком.
+        По умолчанию используется глобальный движок (см. BinaryCalculator.set_engine).
+        """
+        decoders = {
+            CODE_DIRECT: DecimalConverter.direct_code_to_decimal_int,
+            CODE_REVERSE: DecimalConverter.reverse_code_to_decimal,
+            CODE_ADDITIONAL: DecimalConverter.additional_code_to_decimal,
+            CODE_FIXED_POINT: DecimalConverter.direct_code_to_decimal_float,
+        }
+        if kind not in decoders:
+            raise ValueError(f"Неизвестный вид кода: {kind}")
+        decode = decoders[kind]
+        engine = DecimalConverter.resolve_engine(engine)
+        if isinstance(codes, (bytes, bytearray, memoryview)) or hasattr(codes, 'find'):
+            codes = DecimalConverter.iter_buffer_codes(codes)
+        return (decode(code, engine) for code in codes)
+
+
+    @staticmethod
+    def decode_many(codes, kind=CODE_ADDITIONAL, engine=None):
+        """Список чисел для небольших наборов кодов; см. iter_decode."""
+        return list(DecimalConverter.iter_decode(codes, kind, engine))
+
+
+    @staticmethod
+    def iter_buffer_codes(buffer):
+        """
+        Лениво выдает коды (строки) из буфера, где они разделены переводами строк или пробелами.
+        Буфер копируется кусками по BUFFER_CHUNK байт; код на границе кусков переносится в следующий.
+        """
+        if isinstance(buffer, memoryview) and buffer.format != 'B':
+            buffer = buffer.cast('B')
+        size = len(buffer)
+        tail = b''
+        for start in range(0, size, BUFFER_CHUNK):
+            chunk = tail + bytes(buffer[start:start + BUFFER_CHUNK])
+            codes = chunk.split()
+            # Последний код может продолжаться в следующем куске
+            tail = codes.pop() if start + BUFFER_CHUNK < size and not chunk[-1:].isspace() else b''
+            for code in codes:
+                yield code.decode('ascii')
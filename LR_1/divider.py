@@ -0,0 +1,43 @@
+class Divider:
+    """Деление беззнаковых целых без восстановления остатка (non-restoring),
+    как в аппаратном делителе: на каждом шаге остаток сдвигается и к нему
+    прибавляется или из него вычитается делитель в зависимости от знака.
+    """
+
+    @staticmethod
+    def non_restoring(dividend: int, divisor: int, bits: int = None):
+        """Делит dividend на divisor, обрабатывая bits старших битов делимого.
+        Возвращает пару (частное, остаток)."""
+        if divisor == 0:
+            raise ValueError("Деление на ноль невозможно")
+        if bits is None:
+            bits = dividend.bit_length()
+
+        remainder = 0
+        quotient = 0
+        for i in range(bits - 1, -1, -1):
+            bit = (dividend >> i) & 1
+            if remainder >= 0:
+                remainder = (remainder << 1 | bit) - divisor
+            else:
+                remainder = (remainder << 1 | bit) + divisor
+            quotient = quotient << 1 | (remainder >= 0)
+
+        # Отрицательный остаток восстанавливается один раз, в самом конце
+        if remainder < 0:
+            remainder += divisor
+        return quotient, remainder
+
+    @staticmethod
+    def fraction_bits(remainder: int, divisor: int):
+        """Лениво выдает биты дробной части частного remainder / divisor (remainder < divisor).
+        Генератор останавливается, только если деление выполнилось нацело."""
+        if divisor == 0:
+            raise ValueError("Деление на ноль невозможно")
+        while remainder:
+            remainder <<= 1
+            if remainder >= divisor:
+                remainder -= divisor
+                yield '1'
+            else:
+                yield '0'
@@ -0,0 +1,209 @@
+from fractions import Fraction
+from functools import lru_cache
+import re
+import sys
+
+from binary_calculator import BinaryCalculator
+from binary_converter import FRACTION_PRECISION
+from conversion_cache import conversion_cache
+from int_engine import ENGINE_INT, IntEngine
+
+TOKEN_PATTERN = re.compile(r'\s*(?:(\d+(?:\.\d*)?|\.\d+)|(.))')
+NEGATE = 'neg'
+PRIORITY = {NEGATE: 3, '*': 2, '/': 2, '+': 1, '-': 1}
+COMPILE_CACHE_SIZE = 1024
+
+
+class CompiledExpression:
+    """Выражение, один раз переведенное в обратную польскую запись: последовательность
+    загрузок констант (целые с frac_bits дробными битами) и операций BinaryCalculator."""
+
+    __slots__ = ('expression', 'frac_bits', 'steps')
+
+    def __init__(self, expression: str, frac_bits: int, steps):
+        self.expression = expression
+        self.frac_bits = frac_bits
+        self.steps = steps
+
+    def evaluate(self):
+        """Вычисляет выражение. Возвращает (дополнительный код результата, десятичное значение)."""
+        stack = []
+        for step in self.steps:
+            if isinstance(step, int):
+                stack.append(step)
+            elif step == NEGATE:
+                stack.append(ExpressionEvaluator.negate(stack.pop()))
+            else:
+                right = stack.pop()
+                left = stack.pop()
+                stack.append(ExpressionEvaluator.OPERATIONS[step](left, right, self.frac_bits))
+        return ExpressionEvaluator.format_result(stack[0], self.frac_bits)
+
+
+class ExpressionEvaluator:
+    """Потоковый вычислитель арифметических выражений над целыми числами и числами
+    с фиксированной точкой. Все вычисления выполняются операциями BinaryCalculator
+    над двоичными кодами; дробные значения хранятся как целые с frac_bits дробными битами."""
+
+    @staticmethod
+    def tokenize(expression: str):
+        tokens = []
+        for number, symbol in TOKEN_PATTERN.findall(expression):
+            if number:
+                tokens.append(number)
+            elif symbol.strip():
+                tokens.append(symbol)
+        return tokens
+
+    @staticmethod
+    @lru_cache(maxsize=COMPILE_CACHE_SIZE)
+    def compile(expression: str, precision: int = FRACTION_PRECISION) -> CompiledExpression:
+        """Переводит выражение в CompiledExpression (алгоритм сортировочной станции).
+        Целочисленные выражения без деления вычисляются точно, иначе – с precision дробными битами."""
+        tokens = ExpressionEvaluator.tokenize(expression)
+        if not tokens:
+            raise ValueError("Пустое выражение")
+        is_fixed_point = any('.' in token or token == '/' for token in tokens)
+        if is_fixed_point and precision < 1:
+            raise ValueError("Для дробных выражений нужна хотя бы одна двоичная цифра после точки")
+        frac_bits = precision if is_fixed_point else 0
+
+        steps = []
+        stack = []
+        expect_operand = True
+        for token in tokens:
+            if token[0].isdigit() or token[0] == '.':
+                # Дробная часть отбрасывается после frac_bits бит, как в BinaryConverter.frac_to_binary
+                steps.append(int(Fraction(token) * (1 << frac_bits)))
+                expect_operand = False
+            elif token == '(':
+                stack.append(token)
+                expect_operand = True
+            elif token == ')':
+                while stack and stack[-1] != '(':
+                    steps.append(stack.pop())
+                if not stack:
+                    raise ValueError("Несогласованные скобки")
+                stack.pop()
+                expect_operand = False
+            elif token in PRIORITY:
+                if expect_operand:
+                    if token != '-':
+                        raise ValueError(f"Ожидалось число перед '{token}'")
+                    # Унарный минус правоассоциативен: ничего не выталкиваем
+                    stack.append(NEGATE)
+                    continue
+                while stack and stack[-1] != '(' and PRIORITY[stack[-1]] >= PRIORITY[token]:
+                    steps.append(stack.pop())
+                stack.append(token)
+                expect_operand = True
+            else:
+                raise ValueError(f"Недопустимый символ: {token}")
+
+        while stack:
+            token = stack.pop()
+            if token == '(':
+                raise ValueError("Несогласованные скобки")
+            steps.append(token)
+
+        # Проверяем глубину стека заранее, чтобы вычисление не могло сломаться на середине
+        depth = 0
+        for step in steps:
+            needed = 0 if isinstance(step, int) else 1 if step == NEGATE else 2
+            if depth < needed:
+                raise ValueError("Не хватает операндов")
+            depth += 1 - needed
+        if depth != 1:
+            raise ValueError("Лишние операнды")
+        return CompiledExpression(expression, frac_bits, tuple(steps))
+
+    @staticmethod
+    def evaluate(expression: str, precision: int = FRACTION_PRECISION):
+        return ExpressionEvaluator.compile(expression.strip(), precision).evaluate()
+
+    @staticmethod
+    def evaluate_lines(lines, precision: int = FRACTION_PRECISION):
+        """Лениво вычисляет выражения построчно; пустые строки и комментарии (#) пропускаются.
+        Выдает кортежи (выражение, код, десятичное значение, ошибка) и не хранит прочитанные строки."""
+        for line in lines:
+            expression = line.split('#', 1)[0].strip()
+            if not expression:
+                continue
+            try:
+                code, decimal = ExpressionEvaluator.evaluate(expression, precision)
+                yield expression, code, decimal, None
+            except (ValueError, ZeroDivisionError) as error:
+                yield expression, None, None, str(error)
+
+    # Операции над целыми с frac_bits дробными битами
+
+    @staticmethod
+    def additional_code(value: int) -> str:
+        return conversion_cache.additional_code(value)
+
+    @staticmethod
+    def direct_code(value: int) -> str:
+        return conversion_cache.direct_code(value)
+
+    @staticmethod
+    def add(left: int, right: int, frac_bits: int) -> int:
+        code = BinaryCalculator.sum_additional_code(ExpressionEvaluator.additional_code(left),
+                                                    ExpressionEvaluator.additional_code(right), engine=ENGINE_INT)
+        return IntEngine.to_signed(code)
+
+    @staticmethod
+    def subtract(left: int, right: int, frac_bits: int) -> int:
+        code = BinaryCalculator.subtract_additional_code(ExpressionEvaluator.additional_code(left),
+                                                         ExpressionEvaluator.additional_code(right), engine=ENGINE_INT)
+        return IntEngine.to_signed(code)
+
+    @staticmethod
+    def negate(value: int) -> int:
+        return ExpressionEvaluator.subtract(0, value, 0)
+
+    @staticmethod
+    def multiply(left: int, right: int, frac_bits: int) -> int:
+        code = BinaryCalculator.multiply_direct_code(ExpressionEvaluator.direct_code(left),
+                                                     ExpressionEvaluator.direct_code(right), engine=ENGINE_INT)
+        magnitude = IntEngine.to_unsigned(code[1:]) >> frac_bits
+        return -magnitude if code[0] == '1' else magnitude
+
+    @staticmethod
+    def divide(left: int, right: int, frac_bits: int) -> int:
+        if right == 0:
+            raise ZeroDivisionError("Деление на ноль невозможно")
+        code = BinaryCalculator.division_direct_code(ExpressionEvaluator.direct_code(left),
+                                                     ExpressionEvaluator.direct_code(right),
+                                                     precision=frac_bits, engine=ENGINE_INT)
+        magnitude = IntEngine.to_unsigned(code[1:].replace('.', ''))
+        return -magnitude if code[0] == '1' else magnitude
+
+    OPERATIONS = {'+': add, '-': subtract, '*': multiply, '/': divide}
+
+    @staticmethod
+    def format_result(value: int, frac_bits: int):
+        """Возвращает дополнительный код результата (с точкой перед дробными битами) и его значение."""
+        code = ExpressionEvaluator.additional_code(value)
+        if not frac_bits:
+            return code, value
+        code = IntEngine.to_code(value, max(len(code), frac_bits + 1))
+        return code[:-frac_bits] + '.' + code[-frac_bits:], value / (1 << frac_bits)
+
+
+def main(argv=None):
+    """Вычисляет выражения из файла (первый аргумент) или из стандартного ввода."""
+    argv = sys.argv[1:] if argv is None else argv
+    source = open(argv[0], encoding='utf-8') if argv else sys.stdin
+    try:
+        for expression, code, decimal, error in ExpressionEvaluator.evaluate_lines(source):
+            if error:
+                print(f"{expression}: Ошибка: {error}")
+            else:
+                print(f"{expression} = {decimal} ({code})")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+if __name__ == "__main__":
+    main()
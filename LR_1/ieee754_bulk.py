@@ -0,0 +1,105 @@
+from array import array
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него работает переинтерпретация через array и memoryview
+    np = None
+
+# Коды типов array/memoryview и NumPy для каждой ширины формата
+FLOAT_CODES = {32: 'f', 64: 'd'}
+UINT_CODES = {32: 'I', 64: 'Q'}
+NUMPY_FLOATS = {32: 'float32', 64: 'float64'}
+NUMPY_UINTS = {32: 'uint32', 64: 'uint64'}
+
+
+def _check_bits(bits: int):
+    if bits not in FLOAT_CODES:
+        raise ValueError("Поддерживаются только форматы IEEE-754 на 32 и 64 бита.")
+
+
+def _raise_overflow(bits: int):
+    raise OverflowError(f"Конечное число не помещается в формат IEEE-754 на {bits} бит.")
+
+
+def _check_code(code: str, bits: int):
+    if len(code) != bits or code.strip('01'):
+        raise ValueError(f"Код {code!r} должен состоять ровно из {bits} символов '0' и '1'.")
+
+
+class IEEE754Bulk:
+    """Массовое преобразование чисел с плавающей точкой в битовые коды IEEE-754 и обратно.
+    Биты не вычисляются, а переинтерпретируются без копирования (numpy.view или memoryview.cast),
+    поэтому в отличие от BinaryConverter.ieee754 поддерживаются отрицательные числа,
+    денормализованные числа, бесконечности и NaN, а мантисса округляется, а не обрезается.
+    Конечное число, которое не помещается в формат, вызывает OverflowError (с NumPy и без него одинаково);
+    строковые коды проверяются на ширину и символы до преобразования.
+    """
+
+    @staticmethod
+    def encode(values, bits: int = 32, as_strings: bool = True):
+        """Переводит последовательность чисел в коды IEEE-754.
+        Возвращает список строк из '0' и '1' или, при as_strings=False, беззнаковые целые
+        (массив NumPy, если NumPy установлен, иначе memoryview)."""
+        _check_bits(bits)
+        if np is not None:
+            with np.errstate(over='ignore'):
+                floats = np.ascontiguousarray(values, dtype=NUMPY_FLOATS[bits])
+            overflow = np.isinf(floats)
+            if overflow.any() and np.isfinite(np.asarray(values, dtype=np.float64)[overflow]).any():
+                _raise_overflow(bits)
+            codes = floats.view(NUMPY_UINTS[bits])
+            return IEEE754Bulk._codes_to_strings_numpy(codes, bits) if as_strings else codes
+
+        if isinstance(values, array) and values.typecode == FLOAT_CODES[bits]:
+            floats = values
+        else:
+            values = values if isinstance(values, (list, tuple, array)) else list(values)
+            # В зависимости от версии Python array('f') при переполнении дает inf или OverflowError
+            try:
+                floats = array(FLOAT_CODES[bits], values)
+            except OverflowError:
+                _raise_overflow(bits)
+            if bits == 32 and any(map(math.isinf, floats)) and \
+                    any(math.isinf(number) and not math.isinf(value) for number, value in zip(floats, values)):
+                _raise_overflow(bits)
+        codes = memoryview(floats).cast('B').cast(UINT_CODES[bits])
+        if as_strings:
+            return [format(code, f'0{bits}b') for code in codes]
+        return codes
+
+    @staticmethod
+    def decode(codes, bits: int = 32):
+        """Переводит коды IEEE-754 (строки из '0' и '1' или беззнаковые целые) в числа.
+        Возвращает массив NumPy, если NumPy установлен, иначе список чисел."""
+        _check_bits(bits)
+        if np is not None:
+            codes = np.asarray(codes)
+            if codes.dtype.kind in 'US':
+                codes = codes.astype('U')
+                # astype(f'S{bits}') молча обрезает длинные строки, поэтому ширина проверяется заранее
+                invalid = (np.char.str_len(codes) != bits) | np.char.strip(codes, '01').astype(bool)
+                if invalid.any():
+                    _check_code(str(codes[invalid][0]), bits)
+                codes = IEEE754Bulk._strings_to_codes_numpy(codes, bits)
+            return np.ascontiguousarray(codes, dtype=NUMPY_UINTS[bits]).view(NUMPY_FLOATS[bits])
+
+        codes = list(codes)
+        for code in codes:
+            if isinstance(code, str):
+                _check_code(code, bits)
+        unsigned = array(UINT_CODES[bits], (int(code, 2) if isinstance(code, str) else code for code in codes))
+        return memoryview(unsigned).cast('B').cast(FLOAT_CODES[bits]).tolist()
+
+    @staticmethod
+    def _codes_to_strings_numpy(codes, bits: int):
+        # Старший байт первым, затем распаковка байтов в биты и сборка строк фиксированной длины
+        big_endian = codes.astype(NUMPY_UINTS[bits]).astype(f'>u{bits // 8}')
+        bit_rows = np.unpackbits(big_endian.view(np.uint8).reshape(-1, bits // 8), axis=1) + ord('0')
+        return bit_rows.view(f'S{bits}').ravel().astype(f'U{bits}').tolist()
+
+    @staticmethod
+    def _strings_to_codes_numpy(strings, bits: int):
+        bit_rows = strings.astype(f'S{bits}').view(np.uint8).reshape(-1, bits) - ord('0')
+        packed = np.packbits(bit_rows, axis=1)
+        return np.ascontiguousarray(packed).view(f'>u{bits // 8}').ravel().astype(NUMPY_UINTS[bits])
@@ -0,0 +1,148 @@
+from bit_vector import BitVector
+from divider import Divider
+from multiplier import Multiplier
+
+ENGINE_STR = 'str'
+ENGINE_INT = 'int'
+ENGINES = (ENGINE_STR, ENGINE_INT)
+
+
+def check_engine(engine: str) -> str:
+    """Проверяет название движка вычислений и возвращает его."""
+    if engine not in ENGINES:
+        raise ValueError(f"Неизвестный движок вычислений: {engine}")
+    return engine
+
+
+class IntEngine:
+    """Целочисленный движок: операнды внутри хранятся как int,
+    строки из '0' и '1' формируются только на выходе.
+    Результаты совпадают со строковым движком BinaryCalculator бит в бит.
+    """
+
+    @staticmethod
+    def to_unsigned(bin_str: str) -> int:
+        """Переводит строку битов (или BitVector) в беззнаковое целое."""
+        if isinstance(bin_str, BitVector):
+            return bin_str.value
+        return int(bin_str, 2) if bin_str else 0
+
+    @staticmethod
+    def to_signed(bin_str: str) -> int:
+        """Переводит строку в дополнительном коде в целое со знаком."""
+        value = IntEngine.to_unsigned(bin_str)
+        if bin_str and bin_str[0] == '1':
+            value -= 1 << len(bin_str)
+        return value
+
+    @staticmethod
+    def to_code(value: int, width: int) -> str:
+        """Записывает целое в дополнительном коде ровно в width бит."""
+        return format(value & ((1 << width) - 1), f'0{width}b')
+
+    @staticmethod
+    def emit(value: int, width: int, *operands):
+        """Записывает результат в дополнительном коде ширины width: BitVector, если хотя бы
+        один операнд был BitVector, иначе строкой."""
+        if any(isinstance(operand, BitVector) for operand in operands):
+            return BitVector(value & ((1 << width) - 1), width)
+        return IntEngine.to_code(value, width)
+
+    @staticmethod
+    def reverse_code_to_decimal(bin_str: str) -> int:
+        value = IntEngine.to_unsigned(bin_str)
+        if bin_str[0] == '1':
+            return -(value ^ ((1 << len(bin_str)) - 1))
+        return value
+
+    @staticmethod
+    def direct_code_to_decimal_int(bin_str: str) -> int:
+        magnitude = IntEngine.to_unsigned(bin_str[1:])
+        return -magnitude if bin_str[0] == '1' else magnitude
+
+    @staticmethod
+    def direct_code_to_decimal_float(bin_str: str):
+        """Дробный прямой код: модуль читается как целое и масштабируется сдвигом на число дробных бит.
+        Как и строковый вариант, возвращает int, если в дробной части нет единиц."""
+        if isinstance(bin_str, BitVector):
+            return IntEngine.direct_code_to_decimal_int(bin_str)
+        int_part, _, frac_part = bin_str[1:].partition('.')
+        magnitude = IntEngine.to_unsigned(int_part + frac_part)
+        if magnitude & ((1 << len(frac_part)) - 1):
+            value = magnitude / (1 << len(frac_part))
+        else:
+            value = magnitude >> len(frac_part)
+        return -value if bin_str[0] == '1' else value
+
+    @staticmethod
+    def add_binaries(bin1: str, bin2: str) -> str:
+        max_len = max(len(bin1), len(bin2))
+        total = IntEngine.to_unsigned(bin1) + IntEngine.to_unsigned(bin2)
+        # Перенос из старшего разряда удлиняет результат на один бит, как и в строковом движке
+        return IntEngine.emit(total, max(max_len, total.bit_length()), bin1, bin2)
+
+    @staticmethod
+    def sum_additional_code(bin1: str, bin2: str, width=None) -> str:
+        max_len = max(len(bin1), len(bin2)) + 1 if width is None else width
+        return IntEngine.emit(IntEngine.to_signed(bin1) + IntEngine.to_signed(bin2), max_len, bin1, bin2)
+
+    @staticmethod
+    def subtract_additional_code(bin1: str, bin2: str, width=None) -> str:
+        max_len = max(len(bin1), len(bin2)) + 1 if width is None else width
+        return IntEngine.emit(IntEngine.to_signed(bin1) - IntEngine.to_signed(bin2), max_len, bin1, bin2)
+
+    @staticmethod
+    def sum_many(codes, width: int) -> str:
+        codes = list(codes)
+        return IntEngine.emit(sum(IntEngine.to_signed(code) for code in codes), width, *codes)
+
+    @staticmethod
+    def min_width(value: int) -> int:
+        """Наименьшая ширина дополнительного кода, в которую помещается value (вместе со знаком)."""
+        return (value if value >= 0 else ~value).bit_length() + 1
+
+    @staticmethod
+    def multiply_additional_code(bin1: str, bin2: str, full: bool = False) -> str:
+        product = IntEngine.to_signed(bin1) * IntEngine.to_signed(bin2)
+        return IntEngine.emit(product, len(bin1) + len(bin2) if full else IntEngine.min_width(product), bin1, bin2)
+
+    @staticmethod
+    def multiply_direct_code(bin1: str, bin2: str, method=None) -> str:
+        sign = 0 if bin1[0] == bin2[0] else 1
+        bin1_mod = bin1[1:] if len(bin1) > 1 else bin1
+        bin2_mod = bin2[1:] if len(bin2) > 1 else bin2
+
+        multiplier = IntEngine.to_unsigned(bin2_mod)
+        if not multiplier:
+            return IntEngine.emit(sign << 1, 2, bin1, bin2)
+
+        product = Multiplier.multiply(IntEngine.to_unsigned(bin1_mod), multiplier, method)
+        # Строковый движок не отбрасывает ведущие нули последнего сдвинутого слагаемого
+        first_one = len(bin2_mod) - multiplier.bit_length()
+        width = max(len(bin1_mod) + len(bin2_mod) - 1 - first_one, product.bit_length())
+        return IntEngine.emit(sign << width | product, width + 1, bin1, bin2)
+
+    @staticmethod
+    def divmod_direct_code(dividend: str, divisor: str, precision: int = 5):
+        """Возвращает частное в том же виде, что и division_direct_code, и остаток
+        в прямом коде со знаком делимого: |делимое| = |частное|·|делитель| + остаток·2^-precision."""
+        sign = '0' if dividend[0] == divisor[0] else '1'
+        dividend_mod = dividend[1:]
+        divisor_value = IntEngine.to_unsigned(divisor[1:])
+        if divisor_value == 0:
+            raise ValueError("Деление на ноль невозможно")
+
+        bits = len(dividend_mod) + precision
+        scaled = IntEngine.to_unsigned(dividend_mod) << precision
+        quotient, remainder = Divider.non_restoring(scaled, divisor_value, bits)
+
+        # Та же раскладка, что у строкового движка; при precision = 0 точка не ставится
+        result = format(quotient, f'0{bits}b') if bits else ''
+        int_part = result[:bits - precision].lstrip('0') or '0'
+        frac_part = result[bits - precision:]
+        quotient_code = sign + int_part + '.' + frac_part if precision else sign + int_part
+        return quotient_code, dividend[0] + format(remainder, 'b')
+
+    @staticmethod
+    def division_direct_code(dividend: str, divisor: str, precision: int = 5) -> str:
+        return IntEngine.divmod_direct_code(dividend, divisor, precision)[0]
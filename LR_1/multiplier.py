@@ -0,0 +1,178 @@
+import random
+import time
+
+METHOD_NATIVE = 'native'
+METHOD_TABLE = 'table'
+METHOD_SHIFT_ADD = 'shift_add'
+METHOD_KARATSUBA = 'karatsuba'
+METHODS = (METHOD_NATIVE, METHOD_TABLE, METHOD_SHIFT_ADD, METHOD_KARATSUBA)
+
+# Ширина цифры табличного умножителя и размер таблицы произведений цифр
+DIGIT_BITS = 8
+DIGIT_MASK = (1 << DIGIT_BITS) - 1
+
+# Ниже этой ширины (в битах большего операнда) Карацуба не делит числа, а умножает встроенным *
+KARATSUBA_MIN_WIDTH = 1024
+
+# Пороги автоматического выбора (см. choose_method и thresholds), замерены benchmark в CPython 3.11.
+# До TABLE_MAX_WIDTH бит (одна цифра) произведение – одно обращение к таблице, по времени это тот же
+# порядок, что и встроенное умножение (0.2 мкс против 0.1 мкс вместе с выбором алгоритма);
+# начиная с двух цифр таблица медленнее встроенного * в 8 раз и больше, поэтому дальше не выбирается.
+TABLE_MAX_WIDTH = DIGIT_BITS
+# С какой ширины выбирается Карацуба. Встроенное умножение CPython само переходит на Карацубу
+# для длинных чисел, и замеры до 2^20 бит не находят точки перехода (Карацуба на Python в 2–3 раза
+# медленнее), поэтому по умолчанию порога нет; его можно передать в choose_method из thresholds.
+KARATSUBA_AUTO_WIDTH = None
+
+
+class Multiplier:
+    """Умножение беззнаковых целых: встроенное умножение Python и модели аппаратных алгоритмов
+    (табличный, сдвиг-сложение, Карацуба) для сравнения.
+    """
+
+    _table = None
+
+    @staticmethod
+    def multiply(a: int, b: int, method=None) -> int:
+        """Умножает два неотрицательных целых. Если method не указан, алгоритм
+        выбирается автоматически по длине большего операнда."""
+        if method is None:
+            method = Multiplier.choose_method(max(a.bit_length(), b.bit_length()))
+        if method == METHOD_NATIVE:
+            return a * b
+        if method == METHOD_TABLE:
+            return Multiplier.table(a, b)
+        if method == METHOD_SHIFT_ADD:
+            return Multiplier.shift_add(a, b)
+        if method == METHOD_KARATSUBA:
+            return Multiplier.karatsuba(a, b)
+        raise ValueError(f"Неизвестный алгоритм умножения: {method}")
+
+    @staticmethod
+    def choose_method(width: int, table_max_width: int = TABLE_MAX_WIDTH,
+                      karatsuba_min_width=KARATSUBA_AUTO_WIDTH) -> str:
+        """Выбирает алгоритм по ширине большего операнда: таблица для узких операндов,
+        Карацуба для широких (если порог задан), между ними – встроенное умножение."""
+        if width <= table_max_width:
+            return METHOD_TABLE
+        if karatsuba_min_width is not None and width >= karatsuba_min_width:
+            return METHOD_KARATSUBA
+        return METHOD_NATIVE
+
+    @staticmethod
+    def thresholds(results):
+        """Пороги для choose_method по результатам benchmark: (наибольшая ширина, до которой таблица
+        быстрее встроенного умножения, или 0; ширина, с которой Карацуба быстрее встроенного, или None)."""
+        table_max_width = 0
+        for width in sorted(results):
+            if results[width][METHOD_TABLE] >= results[width][METHOD_NATIVE]:
+                break
+            table_max_width = width
+        return table_max_width, Multiplier.find_crossover(results, METHOD_NATIVE, METHOD_KARATSUBA)
+
+    @staticmethod
+    def digit_table():
+        """Таблица произведений всех пар цифр по DIGIT_BITS бит (строится один раз)."""
+        if Multiplier._table is None:
+            size = 1 << DIGIT_BITS
+            Multiplier._table = [[i * j for j in range(size)] for i in range(size)]
+        return Multiplier._table
+
+    @staticmethod
+    def table(a: int, b: int) -> int:
+        """Умножение по цифрам из DIGIT_BITS бит с поиском частичных произведений в таблице."""
+        table = Multiplier.digit_table()
+        if a <= DIGIT_MASK and b <= DIGIT_MASK:
+            return table[a][b]
+        digits_b = []
+        while b:
+            digits_b.append(b & DIGIT_MASK)
+            b >>= DIGIT_BITS
+
+        result = 0
+        shift = 0
+        while a:
+            row = table[a & DIGIT_MASK]
+            inner_shift = shift
+            for digit in digits_b:
+                if digit:
+                    result += row[digit] << inner_shift
+                inner_shift += DIGIT_BITS
+            a >>= DIGIT_BITS
+            shift += DIGIT_BITS
+        return result
+
+    @staticmethod
+    def shift_add(a: int, b: int) -> int:
+        """Умножение сдвигом и сложением: по одному слагаемому на каждую единицу множителя."""
+        result = 0
+        shift = 0
+        while b:
+            if b & 1:
+                result += a << shift
+            b >>= 1
+            shift += 1
+        return result
+
+    @staticmethod
+    def karatsuba(a: int, b: int) -> int:
+        """Умножение Карацубы: три рекурсивных умножения половин вместо четырех."""
+        width = max(a.bit_length(), b.bit_length())
+        if width < KARATSUBA_MIN_WIDTH:
+            return a * b
+
+        half = width // 2
+        mask = (1 << half) - 1
+        a_high, a_low = a >> half, a & mask
+        b_high, b_low = b >> half, b & mask
+
+        low = Multiplier.karatsuba(a_low, b_low)
+        high = Multiplier.karatsuba(a_high, b_high)
+        middle = Multiplier.karatsuba(a_low + a_high, b_low + b_high) - low - high
+        return (high << (2 * half)) + (middle << half) + low
+
+    @staticmethod
+    def benchmark(widths, repeat: int = 20, seed: int = 0):
+        """Замеряет время (в секундах на одно умножение) каждого алгоритма для каждой ширины
+        на плотных случайных операндах ровно заданной ширины.
+        Возвращает словарь {ширина: {алгоритм: время}}."""
+        Multiplier.digit_table()
+        rng = random.Random(seed)
+        results = {}
+        for width in widths:
+            a = (1 << (width - 1)) | rng.getrandbits(width - 1)
+            b = (1 << (width - 1)) | rng.getrandbits(width - 1)
+            results[width] = {}
+            for method in METHODS:
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    Multiplier.multiply(a, b, method)
+                results[width][method] = (time.perf_counter() - start) / repeat
+        return results
+
+    @staticmethod
+    def find_crossover(results, slow: str, fast: str):
+        """Возвращает наименьшую ширину, начиная с которой алгоритм fast
+        быстрее slow на всех больших ширинах."""
+        crossover = None
+        for width in sorted(results, reverse=True):
+            if results[width][fast] >= results[width][slow]:
+                break
+            crossover = width
+        return crossover
+
+
+# Замер точек перехода между алгоритмами
+if __name__ == "__main__":
+    widths = [4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096]
+    results = Multiplier.benchmark(widths)
+
+    print(f"{'Бит':>6} " + " ".join(f"{method:>12}" for method in METHODS))
+    for width in widths:
+        print(f"{width:>6} " + " ".join(f"{results[width][method] * 1e6:>10.1f}мкс" for method in METHODS))
+
+    print(f"\nСдвиг-сложение быстрее таблицы с {Multiplier.find_crossover(results, METHOD_TABLE, METHOD_SHIFT_ADD)} бит")
+    print(f"Карацуба быстрее сдвига-сложения с {Multiplier.find_crossover(results, METHOD_SHIFT_ADD, METHOD_KARATSUBA)} бит")
+    table_max_width, karatsuba_min_width = Multiplier.thresholds(results)
+    print(f"Таблица быстрее встроенного умножения до {table_max_width} бит (TABLE_MAX_WIDTH = {TABLE_MAX_WIDTH})")
+    print(f"Карацуба быстрее встроенного умножения с {karatsuba_min_width} бит (KARATSUBA_AUTO_WIDTH = {KARATSUBA_AUTO_WIDTH})")
@@ -0,0 +1,123 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+import os
+import random
+import time
+
+from binary_calculator import BinaryCalculator
+
+DEFAULT_CHUNK_SIZE = 256
+# Меньшие пакеты считаются в текущем процессе: запуск пула дороже самих вычислений
+MIN_PARALLEL_ITEMS = 1024
+# Сколько заданий на процесс держать в очереди, чтобы процессы не простаивали
+CHUNKS_PER_WORKER = 2
+
+
+def _run_chunk(function, chunk):
+    return [function(item) for item in chunk]
+
+
+class ParallelExecutor:
+    """Пакетное выполнение функции над большим числом элементов в пуле процессов.
+    Элементы читаются лениво и отправляются кусками по chunk_size, одновременно в работе
+    не больше CHUNKS_PER_WORKER кусков на процесс, результаты выдаются в порядке входа.
+    Если элементов меньше min_parallel или процесс один, все считается в текущем процессе.
+    initializer готовит только процессы пула и в текущем процессе не вызывается, чтобы не менять
+    его глобальное состояние: при последовательном счете вызывающий сам задает нужное состояние.
+    function и initializer должны быть функциями уровня модуля (их передают в процессы через pickle).
+    """
+
+    def __init__(self, workers=None, chunk_size: int = DEFAULT_CHUNK_SIZE, min_parallel: int = MIN_PARALLEL_ITEMS,
+                 initializer=None, initargs=()):
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1 or chunk_size < 1:
+            raise ValueError("Число процессов и размер куска должны быть положительными.")
+        self.chunk_size = chunk_size
+        self.min_parallel = min_parallel
+        self.initializer = initializer
+        self.initargs = initargs
+
+    def map(self, function, items):
+        """Лениво выдает function(item) для каждого элемента в исходном порядке."""
+        items = iter(items)
+        head = list(islice(items, max(self.min_parallel, 1)))
+        if not head:
+            return
+        if self.workers == 1 or len(head) < self.min_parallel:
+            # Пакет маленький: пул не запускаем
+            yield from map(function, head)
+            yield from map(function, items)
+            return
+
+        chunks = self._chunks(head, items)
+        task = partial(_run_chunk, function)
+        with ProcessPoolExecutor(self.workers, initializer=self.initializer, initargs=self.initargs) as pool:
+            pending = deque(pool.submit(task, chunk) for chunk in islice(chunks, self.workers * CHUNKS_PER_WORKER))
+            while pending:
+                results = pending.popleft().result()
+                # Освободившееся место в очереди сразу занимаем следующим куском
+                for chunk in islice(chunks, 1):
+                    pending.append(pool.submit(task, chunk))
+                yield from results
+
+    def _chunks(self, head, items):
+        for start in range(0, len(head), self.chunk_size):
+            yield head[start:start + self.chunk_size]
+        while True:
+            chunk = list(islice(items, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+# Готовые пакетные операции BinaryCalculator
+
+def _divide(precision, engine, pair):
+    return BinaryCalculator.division_direct_code(pair[0], pair[1], precision, engine)
+
+
+def _multiply(engine, pair):
+    return BinaryCalculator.multiply_direct_code(pair[0], pair[1], engine)
+
+
+def divide_many(pairs, precision: int = 5, engine=None, workers=None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                min_parallel: int = MIN_PARALLEL_ITEMS):
+    """Делит пары (делимое, делитель) в прямом коде, см. BinaryCalculator.division_direct_code.
+    Возвращает итератор частных в порядке пар."""
+    executor = ParallelExecutor(workers, chunk_size, min_parallel)
+    return executor.map(partial(_divide, precision, BinaryCalculator.resolve_engine(engine)), pairs)
+
+
+def multiply_many(pairs, engine=None, workers=None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  min_parallel: int = MIN_PARALLEL_ITEMS):
+    """Умножает пары в прямом коде, см. BinaryCalculator.multiply_direct_code."""
+    executor = ParallelExecutor(workers, chunk_size, min_parallel)
+    return executor.map(partial(_multiply, BinaryCalculator.resolve_engine(engine)), pairs)
+
+
+def benchmark(workers_list, count: int = 2000, width: int = 64, precision: int = 64, seed: int = 0):
+    """Замеряет время деления count пар строковым движком при разном числе процессов.
+    Возвращает словарь {число процессов: время в секундах}."""
+    rng = random.Random(seed)
+    pairs = [('0' + format(rng.getrandbits(width), f'0{width}b'),
+              '01' + format(rng.getrandbits(width // 2), f'0{width // 2}b')) for _ in range(count)]
+    results = {}
+    for workers in workers_list:
+        start = time.perf_counter()
+        for _ in divide_many(pairs, precision, 'str', workers):
+            pass
+        results[workers] = time.perf_counter() - start
+    return results
+
+
+# Масштабирование деления по числу процессов
+if __name__ == "__main__":
+    cpus = os.cpu_count() or 1
+    workers_list = sorted({1, 2, 4, cpus} | {cpus // 2 or 1})
+    results = benchmark(workers_list)
+    print(f"Процессоров: {cpus}")
+    print(f"{'Процессов':>10} {'Время, с':>10} {'Ускорение':>10}")
+    for workers in workers_list:
+        print(f"{workers:>10} {results[workers]:>10.3f} {results[1] / results[workers]:>10.2f}")
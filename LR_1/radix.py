@@ -0,0 +1,117 @@
+import decimal
+
+RADIX_LOOP = 'loop'
+RADIX_BUILTIN = 'builtin'
+RADIX_SPLIT = 'split'
+RADIX_METHODS = (RADIX_LOOP, RADIX_BUILTIN, RADIX_SPLIT)
+
+# Размер листа рекурсии: куски не длиннее переводятся напрямую
+SPLIT_LEAF_BITS = 64
+DECIMAL_LEAF_BITS = 128
+DECIMAL_LEAF_DIGITS = 2048  # меньше sys.get_int_max_str_digits() по умолчанию
+
+
+def check_radix_method(method: str) -> str:
+    """Проверяет название способа перевода целой части и возвращает его."""
+    if method not in RADIX_METHODS:
+        raise ValueError(f"Неизвестный способ перевода: {method}")
+    return method
+
+
+class RadixConverter:
+    """Перевод больших целых между основаниями 2 и 10 методом «разделяй и властвуй».
+    Число делится пополам по степени основания, половины переводятся рекурсивно и
+    склеиваются, поэтому время растет почти линейно, а не квадратично от длины числа.
+    """
+
+    @staticmethod
+    def loop_to_binary(num: int) -> str:
+        """Перевод делением на 2 с добавлением цифры в начало строки (квадратичный)."""
+        if num == 0:
+            return "0"
+        binary = ""
+        while num > 0:
+            binary = str(num % 2) + binary
+            num = num // 2
+        return binary
+
+    @staticmethod
+    def split_to_binary(num: int) -> str:
+        """Делит число по степеням 2^k на старшую и младшую половины и переводит их рекурсивно;
+        куски до SPLIT_LEAF_BITS бит переводятся делением на 2."""
+        if num < 0:
+            raise ValueError("Перевод поддерживает только неотрицательные числа.")
+
+        def convert(value: int, width: int) -> str:
+            # width – число бит, которые должен занять кусок (с ведущими нулями)
+            if width <= SPLIT_LEAF_BITS:
+                return RadixConverter.loop_to_binary(value).zfill(width)
+            low_width = width >> 1
+            high = value >> low_width
+            return convert(high, width - low_width) + convert(value ^ (high << low_width), low_width)
+
+        width = num.bit_length()
+        if width <= SPLIT_LEAF_BITS:
+            return RadixConverter.loop_to_binary(num)
+        return convert(num, width)
+
+    @staticmethod
+    def int_to_decimal(num: int) -> str:
+        """Переводит целое в десятичную строку. Половины числа собираются в decimal.Decimal,
+        где умножение больших чисел быстрее школьного, и не упираются в ограничение
+        sys.set_int_max_str_digits."""
+        if num < 0:
+            return '-' + RadixConverter.int_to_decimal(-num)
+        powers = {}
+
+        def power_of_two(width: int):
+            result = powers.get(width)
+            if result is None:
+                if width <= DECIMAL_LEAF_BITS:
+                    result = decimal.Decimal(1 << width)
+                else:
+                    half = width >> 1
+                    result = power_of_two(half) * power_of_two(width - half)
+                powers[width] = result
+            return result
+
+        def convert(value: int, width: int):
+            if width <= DECIMAL_LEAF_BITS:
+                return decimal.Decimal(value)
+            low_width = width >> 1
+            high = value >> low_width
+            return convert(high, width - low_width) * power_of_two(low_width) + convert(value ^ (high << low_width), low_width)
+
+        with decimal.localcontext() as context:
+            context.prec = decimal.MAX_PREC
+            context.Emax = decimal.MAX_EMAX
+            context.Emin = decimal.MIN_EMIN
+            context.traps[decimal.Inexact] = True
+            return str(convert(num, num.bit_length()))
+
+    @staticmethod
+    def decimal_to_int(digits: str) -> int:
+        """Переводит десятичную строку в целое: строка делится пополам, старшая половина
+        умножается на 10^k (умножение Карацубы в int) и складывается с младшей."""
+        digits = digits.strip()
+        negative = digits.startswith('-')
+        if negative or digits.startswith('+'):
+            digits = digits[1:]
+        if not digits.isdigit() or not digits.isascii():
+            raise ValueError(f"Недопустимая десятичная запись: {digits}")
+        powers = {}
+
+        def power_of_ten(count: int) -> int:
+            result = powers.get(count)
+            if result is None:
+                result = powers[count] = 10 ** count
+            return result
+
+        def convert(start: int, end: int) -> int:
+            if end - start <= DECIMAL_LEAF_DIGITS:
+                return int(digits[start:end])
+            middle = (start + end + 1) >> 1
+            return convert(start, middle) * power_of_ten(end - middle) + convert(middle, end)
+
+        value = convert(0, len(digits))
+        return -value if negative else value
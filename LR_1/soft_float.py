@@ -0,0 +1,264 @@
+from math import isqrt
+import struct
+
+ROUND_NEAREST_EVEN = 'nearest_even'
+ROUND_NEAREST_AWAY = 'nearest_away'
+ROUND_TOWARD_ZERO = 'toward_zero'
+ROUND_UP = 'up'      # к +бесконечности
+ROUND_DOWN = 'down'  # к -бесконечности
+ROUNDING_MODES = (ROUND_NEAREST_EVEN, ROUND_NEAREST_AWAY, ROUND_TOWARD_ZERO, ROUND_UP, ROUND_DOWN)
+
+# Виды значений после разбора битового поля
+FINITE = 'finite'
+INFINITY = 'inf'
+NAN = 'nan'
+
+
+class FloatFormat:
+    """Параметры двоичного формата IEEE-754."""
+
+    def __init__(self, name: str, exponent_bits: int, fraction_bits: int, struct_code: str):
+        self.name = name
+        self.exponent_bits = exponent_bits
+        self.fraction_bits = fraction_bits
+        self.struct_code = struct_code
+        self.bits = 1 + exponent_bits + fraction_bits
+        self.precision = fraction_bits + 1
+        self.bias = (1 << (exponent_bits - 1)) - 1
+        self.exponent_mask = (1 << exponent_bits) - 1
+        self.fraction_mask = (1 << fraction_bits) - 1
+        self.sign_mask = 1 << (self.bits - 1)
+        # Показатель младшего бита мантиссы у денормализованных и наименьших нормализованных чисел
+        self.min_lsb = 1 - self.bias - fraction_bits
+        self.infinity = self.exponent_mask << fraction_bits
+        self.max_finite = self.infinity - 1
+        self.default_nan = self.infinity | (1 << (fraction_bits - 1))
+
+    def __repr__(self):
+        return f"FloatFormat({self.name})"
+
+
+BINARY32 = FloatFormat('binary32', 8, 23, 'f')
+BINARY64 = FloatFormat('binary64', 11, 52, 'd')
+
+
+class SoftFloat:
+    """Программная арифметика IEEE-754 над целочисленными битовыми полями.
+    Операнды и результаты – целые числа с битовым представлением числа в формате fmt.
+    Поддерживаются знаки, денормализованные числа, бесконечности, NaN и пять режимов округления.
+    """
+
+    def __init__(self, fmt: FloatFormat = BINARY32, rounding: str = ROUND_NEAREST_EVEN):
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Неизвестный режим округления: {rounding}")
+        self.fmt = fmt
+        self.rounding = rounding
+
+    # Преобразования на границе
+
+    def from_float(self, value: float) -> int:
+        """Битовое представление числа Python в формате fmt (через struct)."""
+        return int.from_bytes(struct.pack('>' + self.fmt.struct_code, value), 'big')
+
+    def to_float(self, bits: int) -> float:
+        return struct.unpack('>' + self.fmt.struct_code, bits.to_bytes(self.fmt.bits // 8, 'big'))[0]
+
+    def from_str(self, bin_str: str) -> int:
+        if len(bin_str) != self.fmt.bits:
+            raise ValueError(f"Длина двоичной строки должна быть {self.fmt.bits} бит")
+        return int(bin_str, 2)
+
+    def to_str(self, bits: int) -> str:
+        """Строка в том же виде, что возвращают BinaryConverter.ieee754 и BinaryCalculator.sum_ieee754."""
+        return format(bits, f'0{self.fmt.bits}b')
+
+    def is_nan(self, bits: int) -> bool:
+        return self.unpack(bits)[0] == NAN
+
+    # Разбор и сборка
+
+    def unpack(self, bits: int):
+        """Разбирает число на (вид, знак, мантисса, показатель): значение = (-1)^знак · мантисса · 2^показатель."""
+        fmt = self.fmt
+        sign = (bits >> (fmt.bits - 1)) & 1
+        biased = (bits >> fmt.fraction_bits) & fmt.exponent_mask
+        fraction = bits & fmt.fraction_mask
+
+        if biased == fmt.exponent_mask:
+            return (NAN if fraction else INFINITY), sign, fraction, 0
+        if biased == 0:
+            return FINITE, sign, fraction, fmt.min_lsb
+        return FINITE, sign, fraction | (1 << fmt.fraction_bits), biased + fmt.min_lsb - 1
+
+    def _sign(self, sign: int) -> int:
+        return self.fmt.sign_mask if sign else 0
+
+    def _quiet(self, bits: int) -> int:
+        """Превращает сигнальный NaN в тихий, сохраняя полезную нагрузку."""
+        return bits | (1 << (self.fmt.fraction_bits - 1))
+
+    def _propagate_nan(self, *operands) -> int:
+        for bits in operands:
+            if self.is_nan(bits):
+                return self._quiet(bits)
+        return self.fmt.default_nan
+
+    def _overflow(self, sign: int) -> int:
+        rounding = self.rounding
+        to_infinity = (rounding in (ROUND_NEAREST_EVEN, ROUND_NEAREST_AWAY)
+                       or (rounding == ROUND_UP and not sign)
+                       or (rounding == ROUND_DOWN and sign))
+        return self._sign(sign) | (self.fmt.infinity if to_infinity else self.fmt.max_finite)
+
+    def round_pack(self, sign: int, significand: int, exponent: int, sticky: bool = False) -> int:
+        """Округляет значение (-1)^sign · (significand + δ) · 2^exponent и упаковывает его в формат.
+        sticky означает, что 0 < δ < 1 (отброшенные ранее биты не все нулевые), иначе δ = 0."""
+        fmt = self.fmt
+        length = significand.bit_length()
+        lsb = max(exponent + length - fmt.precision, fmt.min_lsb)
+        shift = lsb - exponent
+
+        if shift <= 0:
+            kept = significand << -shift
+            round_bit = 0
+            rest = sticky
+        else:
+            kept = significand >> shift
+            round_bit = (significand >> (shift - 1)) & 1
+            rest = sticky or (significand & ((1 << (shift - 1)) - 1)) != 0
+
+        rounding = self.rounding
+        if rounding == ROUND_NEAREST_EVEN:
+            increment = round_bit and (rest or kept & 1)
+        elif rounding == ROUND_NEAREST_AWAY:
+            increment = round_bit
+        elif rounding == ROUND_TOWARD_ZERO:
+            increment = False
+        elif rounding == ROUND_UP:
+            increment = (round_bit or rest) and not sign
+        else:
+            increment = (round_bit or rest) and sign
+
+        if increment:
+            kept += 1
+            if kept >> fmt.precision:
+                kept >>= 1
+                lsb += 1
+
+        biased = lsb - fmt.min_lsb + 1 if kept >> fmt.fraction_bits else 0
+        if biased >= fmt.exponent_mask:
+            return self._overflow(sign)
+        return self._sign(sign) | (biased << fmt.fraction_bits) | (kept & fmt.fraction_mask)
+
+    def _exact_zero(self, sign1: int, sign2: int) -> int:
+        """Знак точного нуля суммы: общий знак слагаемых, иначе +0 (-0 при округлении вниз)."""
+        if sign1 == sign2:
+            return self._sign(sign1)
+        return self._sign(self.rounding == ROUND_DOWN)
+
+    def _add_finite(self, sign1, significand1, exponent1, sign2, significand2, exponent2) -> int:
+        exponent = min(exponent1, exponent2)
+        value1 = significand1 << (exponent1 - exponent)
+        value2 = significand2 << (exponent2 - exponent)
+        total = (-value1 if sign1 else value1) + (-value2 if sign2 else value2)
+
+        if total == 0:
+            return self._exact_zero(sign1, sign2)
+        return self.round_pack(int(total < 0), abs(total), exponent)
+
+    # Операции
+
+    def add(self, a: int, b: int) -> int:
+        kind_a, sign_a, sig_a, exp_a = self.unpack(a)
+        kind_b, sign_b, sig_b, exp_b = self.unpack(b)
+
+        if NAN in (kind_a, kind_b):
+            return self._propagate_nan(a, b)
+        if kind_a == INFINITY and kind_b == INFINITY:
+            return a if sign_a == sign_b else self.fmt.default_nan
+        if kind_a == INFINITY:
+            return a
+        if kind_b == INFINITY:
+            return b
+        return self._add_finite(sign_a, sig_a, exp_a, sign_b, sig_b, exp_b)
+
+    def sub(self, a: int, b: int) -> int:
+        if self.is_nan(b):
+            return self._propagate_nan(a, b)
+        return self.add(a, b ^ self.fmt.sign_mask)
+
+    def mul(self, a: int, b: int) -> int:
+        kind_a, sign_a, sig_a, exp_a = self.unpack(a)
+        kind_b, sign_b, sig_b, exp_b = self.unpack(b)
+        sign = sign_a ^ sign_b
+
+        if NAN in (kind_a, kind_b):
+            return self._propagate_nan(a, b)
+        if INFINITY in (kind_a, kind_b):
+            if (kind_a == FINITE and sig_a == 0) or (kind_b == FINITE and sig_b == 0):
+                return self.fmt.default_nan
+            return self._sign(sign) | self.fmt.infinity
+        if sig_a == 0 or sig_b == 0:
+            return self._sign(sign)
+        return self.round_pack(sign, sig_a * sig_b, exp_a + exp_b)
+
+    def div(self, a: int, b: int) -> int:
+        kind_a, sign_a, sig_a, exp_a = self.unpack(a)
+        kind_b, sign_b, sig_b, exp_b = self.unpack(b)
+        sign = sign_a ^ sign_b
+
+        if NAN in (kind_a, kind_b):
+            return self._propagate_nan(a, b)
+        if kind_a == INFINITY:
+            return self.fmt.default_nan if kind_b == INFINITY else self._sign(sign) | self.fmt.infinity
+        if kind_b == INFINITY:
+            return self._sign(sign)
+        if sig_b == 0:
+            return self.fmt.default_nan if sig_a == 0 else self._sign(sign) | self.fmt.infinity
+        if sig_a == 0:
+            return self._sign(sign)
+
+        # Частное должно иметь минимум на два бита больше точности формата: бит округления и запас
+        shift = max(0, self.fmt.precision + 2 + sig_b.bit_length() - sig_a.bit_length())
+        quotient, remainder = divmod(sig_a << shift, sig_b)
+        return self.round_pack(sign, quotient, exp_a - exp_b - shift, sticky=remainder != 0)
+
+    def sqrt(self, a: int) -> int:
+        kind, sign, significand, exponent = self.unpack(a)
+
+        if kind == NAN:
+            return self._propagate_nan(a)
+        if kind == FINITE and significand == 0:
+            return a
+        if sign:
+            return self.fmt.default_nan
+        if kind == INFINITY:
+            return a
+
+        if exponent & 1:
+            significand <<= 1
+            exponent -= 1
+        # Корень должен иметь минимум precision + 2 бита
+        shift = max(0, 2 * (self.fmt.precision + 2) - significand.bit_length() + 1) // 2
+        scaled = significand << (2 * shift)
+        root = isqrt(scaled)
+        return self.round_pack(0, root, exponent // 2 - shift, sticky=root * root != scaled)
+
+    def fma(self, a: int, b: int, c: int) -> int:
+        """Вычисляет a · b + c с единственным округлением."""
+        kind_a, sign_a, sig_a, exp_a = self.unpack(a)
+        kind_b, sign_b, sig_b, exp_b = self.unpack(b)
+        kind_c, sign_c, sig_c, exp_c = self.unpack(c)
+        sign_p = sign_a ^ sign_b
+
+        if NAN in (kind_a, kind_b, kind_c):
+            return self._propagate_nan(a, b, c)
+        if INFINITY in (kind_a, kind_b):
+            if (kind_a == FINITE and sig_a == 0) or (kind_b == FINITE and sig_b == 0):
+                return self.fmt.default_nan
+            if kind_c == INFINITY and sign_c != sign_p:
+                return self.fmt.default_nan
+            return self._sign(sign_p) | self.fmt.infinity
+        if kind_c == INFINITY:
+            return c
+        return self._add_finite(sign_p, sig_a * sig_b, exp_a + exp_b, sign_c, sig_c, exp_c)
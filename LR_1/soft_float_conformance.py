@@ -0,0 +1,218 @@
+from array import array
+from fractions import Fraction
+import math
+import random
+import struct
+import sys
+
+from soft_float import (BINARY32, BINARY64, ROUND_DOWN, ROUND_NEAREST_EVEN,
+                        ROUND_TOWARD_ZERO, ROUND_UP, ROUNDING_MODES, SoftFloat)
+
+OPERATIONS = ('add', 'sub', 'mul', 'div', 'sqrt', 'fma')
+ARITY = {'add': 2, 'sub': 2, 'mul': 2, 'div': 2, 'sqrt': 1, 'fma': 3}
+
+
+def hardware_round(fmt, value: float) -> int:
+    """Битовое представление аппаратного округления double в формат fmt.
+    Для binary32 используется приведение типа в C (array 'f'), которое не падает при переполнении."""
+    if fmt is BINARY64:
+        return struct.unpack('>Q', struct.pack('>d', value))[0]
+    return struct.unpack('=I', array('f', [value]).tobytes())[0]
+
+
+def hardware_result(fmt, operation: str, operands):
+    """Результат операции на аппаратном FPU (округление к ближайшему четному).
+    Для binary32 операции над double с последующим округлением дают точный результат,
+    так как 53 >= 2 · 24 + 2; FMA считается точно через Fraction и округляется один раз."""
+    unit = SoftFloat(fmt)
+    values = [unit.to_float(bits) for bits in operands]
+
+    if operation == 'fma':
+        if not all(math.isfinite(value) for value in values):
+            return None
+        a, b, c = values
+        exact = Fraction(a) * Fraction(b) + Fraction(c)
+        if exact == 0:
+            return None
+        return _round_exact_nearest(fmt, exact)
+
+    if operation == 'sqrt':
+        value = values[0]
+        return hardware_round(fmt, math.nan if value < 0 else math.sqrt(value))
+
+    a, b = values
+    if operation == 'add':
+        result = a + b
+    elif operation == 'sub':
+        result = a - b
+    elif operation == 'mul':
+        result = a * b
+    elif b == 0:
+        if a == 0 or math.isnan(a):
+            result = math.nan
+        else:
+            negative = (math.copysign(1, a) < 0) != (math.copysign(1, b) < 0)
+            result = -math.inf if negative else math.inf
+    else:
+        result = a / b
+    return hardware_round(fmt, result)
+
+
+def _round_exact_nearest(fmt, exact: Fraction) -> int:
+    try:
+        nearest = float(exact)
+    except OverflowError:
+        return hardware_round(fmt, math.inf if exact > 0 else -math.inf)
+    if fmt is BINARY32 and Fraction(nearest) != exact:
+        # Двойное округление возможно только если double попал ровно в середину между соседями binary32
+        nearest = math.nextafter(nearest, math.inf if exact > nearest else -math.inf)
+    return hardware_round(fmt, nearest)
+
+
+def _exact_value(fmt, operation, operands):
+    """Точное значение операции как Fraction (для sqrt – квадрат результата) или None,
+    если результат не конечен или точно равен нулю."""
+    unit = SoftFloat(fmt)
+    values = [unit.to_float(bits) for bits in operands]
+    if not all(math.isfinite(value) for value in values):
+        return None
+    exact = [Fraction(value) for value in values]
+
+    if operation == 'add':
+        result = exact[0] + exact[1]
+    elif operation == 'sub':
+        result = exact[0] - exact[1]
+    elif operation == 'mul':
+        result = exact[0] * exact[1]
+    elif operation == 'div':
+        if exact[1] == 0:
+            return None
+        result = exact[0] / exact[1]
+    elif operation == 'sqrt':
+        result = exact[0]
+        if result <= 0:
+            return None
+    else:
+        result = exact[0] * exact[1] + exact[2]
+    return None if result == 0 else result
+
+
+def _to_key(fmt, bits: int) -> int:
+    """Монотонный ключ: соседние числа формата отличаются на 1, +0 и -0 совпадают."""
+    magnitude = bits & ~fmt.sign_mask
+    return -magnitude if bits & fmt.sign_mask else magnitude
+
+
+def _from_key(fmt, key: int, negative: bool) -> int:
+    if key < 0 or (key == 0 and negative):
+        return fmt.sign_mask | -key
+    return key
+
+
+def _value(fmt, bits: int) -> Fraction:
+    return Fraction(SoftFloat(fmt).to_float(bits))
+
+
+def expected_result(fmt, operation: str, operands, rounding: str):
+    """Ожидаемый результат в режиме rounding: соседи аппаратного результата по сетке формата
+    выбираются по точному значению. None, если случай проверяется только в режиме к ближайшему."""
+    nearest = hardware_result(fmt, operation, operands)
+    if rounding == ROUND_NEAREST_EVEN or nearest is None:
+        return nearest
+    exact = _exact_value(fmt, operation, operands)
+    if exact is None:
+        return None
+
+    if operation == 'sqrt':
+        def compare(bits):  # знак разности sqrt(x) - значение bits
+            value = _value(fmt, bits)
+            return (exact > value * value) - (exact < value * value)
+        negative = False
+    else:
+        def compare(bits):
+            value = _value(fmt, bits)
+            return (exact > value) - (exact < value)
+        negative = exact < 0
+
+    key = _to_key(fmt, nearest)
+    if abs(key) > _to_key(fmt, fmt.max_finite):
+        # Бесконечность при округлении к ближайшему: точное значение за пределами наибольшего числа
+        lower_key = upper_key = None
+        if negative:
+            lower_key, upper_key = key, -_to_key(fmt, fmt.max_finite)
+        else:
+            lower_key, upper_key = _to_key(fmt, fmt.max_finite), key
+    else:
+        order = compare(nearest)
+        if order == 0:
+            return nearest
+        lower_key, upper_key = (key, key + 1) if order > 0 else (key - 1, key)
+
+    lower = _from_key(fmt, lower_key, negative)
+    upper = _from_key(fmt, upper_key, negative)
+
+    if rounding == ROUND_DOWN:
+        return lower
+    if rounding == ROUND_UP:
+        return upper
+    if rounding == ROUND_TOWARD_ZERO:
+        return upper if negative else lower
+
+    # К ближайшему с округлением половины от нуля отличается от четного только в точной середине
+    if abs(upper_key) > _to_key(fmt, fmt.max_finite) or abs(lower_key) > _to_key(fmt, fmt.max_finite):
+        return nearest
+    middle = (_value(fmt, lower) + _value(fmt, upper)) / 2
+    if operation == 'sqrt':
+        is_tie = exact == middle * middle
+    else:
+        is_tie = exact == middle
+    if not is_tie:
+        return nearest
+    return lower if negative else upper
+
+
+def random_operand(fmt, rng: random.Random) -> int:
+    """Случайный операнд: произвольные биты, особые значения, денормализованные и обычные числа."""
+    choice = rng.random()
+    sign = fmt.sign_mask if rng.random() < 0.5 else 0
+    if choice < 0.4:
+        return rng.getrandbits(fmt.bits)
+    if choice < 0.55:
+        return sign | rng.choice([0, fmt.infinity, fmt.default_nan, fmt.max_finite, 1, fmt.fraction_mask,
+                                  1 << fmt.fraction_bits])
+    if choice < 0.7:
+        return sign | rng.getrandbits(fmt.fraction_bits)
+    # Близкие порядки, чтобы чаще встречались вычитание с потерей разрядов и точные середины
+    biased = fmt.bias + rng.randint(-4, 4)
+    return sign | (biased << fmt.fraction_bits) | (rng.getrandbits(8) << (fmt.fraction_bits - 8))
+
+
+def run_conformance(fmt, count: int = 1000, seed: int = 0, operations=OPERATIONS, roundings=ROUNDING_MODES):
+    """Сравнивает SoftFloat с аппаратными результатами на count случайных наборах операндов.
+    Возвращает список расхождений (формат, операция, режим, операнды, ожидалось, получено)."""
+    rng = random.Random(seed)
+    mismatches = []
+    units = {rounding: SoftFloat(fmt, rounding) for rounding in roundings}
+
+    for _ in range(count):
+        operation = rng.choice(operations)
+        operands = [random_operand(fmt, rng) for _ in range(ARITY[operation])]
+        for rounding, unit in units.items():
+            expected = expected_result(fmt, operation, operands, rounding)
+            if expected is None:
+                continue
+            actual = getattr(unit, operation)(*operands)
+            if unit.is_nan(expected) and unit.is_nan(actual):
+                continue
+            if actual != expected:
+                mismatches.append((fmt.name, operation, rounding, operands, expected, actual))
+    return mismatches
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for fmt in (BINARY32, BINARY64):
+        mismatches = run_conformance(fmt, count)
+        print(f"{fmt.name}: {count} наборов операндов, расхождений: {len(mismatches)}")
+        for mismatch in mismatches[:10]:
+            print("   ", mismatch)
@@ -1,8 +1,36 @@
+from adders import ADDER_CARRY_SELECT, ADDER_KOGGE_STONE, ADDER_LOOKAHEAD, ADDER_RIPPLE, ADDERS, Adders
+from alu import ALU
+from batch_calculator import BatchCalculator, np
+import benchmarks
+import LR_1
+from divider import Divider
+from expression_evaluator import ExpressionEvaluator
+import ieee754_bulk
 from binary_calculator import BinaryCalculator
 from binary_converter import BinaryConverter
-from decimal_converter import DecimalConverter
+from bit_vector import BitVector
+from code_file import FORMAT_PACKED, FORMAT_TEXT, FORMATS, CodeFile, CodeFileWriter, write_codes
+from conversion_cache import ConversionCache
+import decimal_converter
+from decimal_converter import CODE_ADDITIONAL, CODE_DIRECT, CODE_FIXED_POINT, CODE_REVERSE, DecimalConverter
+from int_engine import ENGINE_INT, ENGINE_STR
+from multiplier import METHODS, Multiplier
+from parallel import ParallelExecutor, divide_many, multiply_many
+from radix import RADIX_METHODS, RadixConverter
+from soft_float import BINARY32, BINARY64, ROUND_DOWN, ROUND_TOWARD_ZERO, ROUND_UP, SoftFloat
+from soft_float_conformance import run_conformance
 
+from decimal import Decimal
+from fractions import Fraction
+import io
+from itertools import islice
+import json
+import mmap
+import os
+import random
+import tempfile
 import unittest
+from unittest import mock
 
 class TestBinaryConverter(unittest.TestCase):
 
@@ -46,6 +74,29 @@ class TestBinaryConverter(unittest.TestCase):
         bc = BinaryConverter(2.75)
         self.assertEqual(bc.additional_code(), '010.11')
 
+    def test_codes(self):
+        for number in (5, -5, 2.75, -2.75, 0):
+            bc = BinaryConverter(number)
+            self.assertEqual(bc.codes(), (bc.direct_code(), bc.reverse_code(), bc.additional_code()))
+
+    def test_width(self):
+        self.assertEqual(BinaryConverter(5, width=8).codes(), ('00000101', '00000101', '00000101'))
+        self.assertEqual(BinaryConverter(-5, width=8).codes(), ('10000101', '11111010', '11111011'))
+        with self.assertRaises(ValueError):
+            BinaryConverter(300, width=8).direct_code()
+
+    def test_additional_min(self):
+        self.assertEqual(BinaryConverter(-128, width=8).additional_code(), '10000000')
+        self.assertEqual(BinaryConverter(-128, width=8).codes(), (None, None, '10000000'))
+        self.assertEqual(BinaryConverter(-128, width=8).bit_vectors()[2], '10000000')
+        with self.assertRaises(ValueError):
+            BinaryConverter(-128, width=8).direct_code()
+        with self.assertRaises(ValueError):
+            BinaryConverter(-129, width=8).additional_code()
+
+    def test_precision(self):
+        self.assertEqual(BinaryConverter(0.1, precision=4).direct_code(), '00.0001')
+
     def test_ieee754(self):
         bc = BinaryConverter(5.5)
         self.assertEqual(bc.ieee754(), '01000000101100000000000000000000')
@@ -134,5 +185,826 @@ class TestBinaryCalculator(unittest.TestCase):
         self.assertEqual(BinaryCalculator.sum_ieee754('01000000000000000000000000000000', '01000000000000000000000000000000'), '01000000100000000000000000000000')
 
 
+class TestIntEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def random_bits(self, max_len):
+        return ''.join(self.rng.choice('01') for _ in range(self.rng.randint(1, max_len)))
+
+    def test_matches_string_engine(self):
+        for _ in range(300):
+            bin1, bin2 = self.random_bits(40), self.random_bits(40)
+            for method in (BinaryCalculator.add_binaries,
+                           BinaryCalculator.sum_additional_code,
+                           BinaryCalculator.subtract_additional_code):
+                self.assertEqual(method(bin1, bin2, engine=ENGINE_INT), method(bin1, bin2, engine=ENGINE_STR))
+
+    def test_multiply_matches_string_engine(self):
+        for _ in range(200):
+            bin1, bin2 = self.random_bits(40), self.random_bits(40)
+            self.assertEqual(BinaryCalculator.multiply_direct_code(bin1, bin2, engine=ENGINE_INT),
+                             BinaryCalculator.multiply_direct_code(bin1, bin2, engine=ENGINE_STR))
+
+    def test_division_matches_string_engine(self):
+        for _ in range(200):
+            # Строковый движок верен только для делителя без ведущих нулей в модуле
+            dividend, divisor = self.random_bits(20), '01' + self.random_bits(12)
+            for precision in (0, 1, 5, 9):
+                self.assertEqual(BinaryCalculator.division_direct_code(dividend, divisor, precision, engine=ENGINE_INT),
+                                 BinaryCalculator.division_direct_code(dividend, divisor, precision, engine=ENGINE_STR))
+
+    def test_set_engine(self):
+        try:
+            BinaryCalculator.set_engine(ENGINE_INT)
+            self.assertEqual(BinaryCalculator.resolve_engine(), ENGINE_INT)
+            self.assertEqual(BinaryCalculator.sum_additional_code('0101', '1011'), '00000')
+        finally:
+            BinaryCalculator.set_engine(ENGINE_STR)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            BinaryCalculator.sum_additional_code('01', '01', engine='float')
+
+
+class TestMultiplier(unittest.TestCase):
+
+    def test_methods_agree(self):
+        rng = random.Random(3)
+        for width in (1, 7, 8, 33, 200, 1500, 3000):
+            a, b = rng.getrandbits(width), rng.getrandbits(width)
+            for method in METHODS:
+                self.assertEqual(Multiplier.multiply(a, b, method), a * b)
+
+    def test_choose_method(self):
+        self.assertEqual(Multiplier.choose_method(8), 'table')
+        self.assertEqual(Multiplier.choose_method(9), 'native')
+        self.assertEqual(Multiplier.choose_method(4096), 'native')
+        self.assertEqual(Multiplier.choose_method(4096, karatsuba_min_width=2048), 'karatsuba')
+        self.assertEqual(Multiplier.choose_method(8, table_max_width=0), 'native')
+
+    def test_thresholds(self):
+        results = {8: {'native': 2, 'table': 1, 'karatsuba': 3}, 16: {'native': 1, 'table': 2, 'karatsuba': 3},
+                   32: {'native': 4, 'table': 9, 'karatsuba': 3}, 64: {'native': 8, 'table': 30, 'karatsuba': 5}}
+        self.assertEqual(Multiplier.thresholds(results), (8, 32))
+
+    def test_find_crossover(self):
+        results = {8: {'a': 1, 'b': 2}, 16: {'a': 2, 'b': 1}, 32: {'a': 4, 'b': 5}, 64: {'a': 8, 'b': 3}}
+        self.assertEqual(Multiplier.find_crossover(results, 'a', 'b'), 64)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            Multiplier.multiply(3, 5, 'toom')
+
+
+class TestDivider(unittest.TestCase):
+
+    def test_non_restoring(self):
+        rng = random.Random(4)
+        for _ in range(200):
+            dividend, divisor = rng.getrandbits(300), rng.getrandbits(rng.randint(1, 200)) or 1
+            self.assertEqual(Divider.non_restoring(dividend, divisor), divmod(dividend, divisor))
+
+    def test_fraction_bits(self):
+        self.assertEqual(''.join(Divider.fraction_bits(1, 4)), '01')
+        self.assertEqual(''.join(islice(Divider.fraction_bits(1, 3), 6)), '010101')
+
+    def test_divmod_direct_code(self):
+        self.assertEqual(BinaryCalculator.divmod_direct_code('0111', '0010', 2), ('011.10', '00'))
+        self.assertEqual(BinaryCalculator.divmod_direct_code('1111', '0011', 2), ('110.01', '11'))
+
+    def test_divisor_with_leading_zeros(self):
+        self.assertEqual(BinaryCalculator.division_direct_code('010', '001', engine=ENGINE_INT), '010.00000')
+
+    def test_high_precision(self):
+        quotient = BinaryCalculator.division_direct_code('01', '011', precision=300, engine=ENGINE_INT)
+        self.assertEqual(quotient, '00.' + '01' * 150)
+
+    def test_iter_division_direct_code(self):
+        digits = BinaryCalculator.iter_division_direct_code('0110', '0101')
+        self.assertEqual(''.join(islice(digits, 9)), BinaryCalculator.division_direct_code('0110', '0101', 8))
+        self.assertEqual(list(BinaryCalculator.iter_division_direct_code('0110', '0100')), ['01.', '1'])
+        self.assertEqual(list(BinaryCalculator.iter_division_direct_code('0110', '0010')), ['011'])
+        with self.assertRaises(ValueError):
+            BinaryCalculator.iter_division_direct_code('0110', '000')
+
+    def test_zero_precision(self):
+        self.assertEqual(BinaryCalculator.division_direct_code('0111', '0010', 0, engine=ENGINE_INT), '011')
+        self.assertEqual(BinaryCalculator.divmod_direct_code('1111', '0010', 0), ('111', '11'))
+        self.assertNotIn('.', BinaryCalculator.division_direct_code('0111', '0010', 0, engine=ENGINE_STR))
+
+    def test_division_by_zero(self):
+        with self.assertRaises(ValueError):
+            BinaryCalculator.divmod_direct_code('0110', '000')
+
+
+class TestSoftFloat(unittest.TestCase):
+
+    def setUp(self):
+        self.unit = SoftFloat(BINARY32)
+
+    def test_matches_sum_ieee754(self):
+        bin1 = BinaryConverter(5.5).ieee754()
+        result = self.unit.add(self.unit.from_str(bin1), self.unit.from_str(bin1))
+        self.assertEqual(self.unit.to_str(result), BinaryCalculator.sum_ieee754(bin1, bin1))
+
+    def test_signed_operations(self):
+        unit = SoftFloat(BINARY64)
+        a, b = unit.from_float(-2.5), unit.from_float(0.75)
+        self.assertEqual(unit.to_float(unit.add(a, b)), -1.75)
+        self.assertEqual(unit.to_float(unit.sub(a, b)), -3.25)
+        self.assertEqual(unit.to_float(unit.mul(a, b)), -1.875)
+        self.assertEqual(unit.to_float(unit.div(b, a)), -0.3)
+        self.assertEqual(unit.to_float(unit.sqrt(unit.from_float(2.0))), 2.0 ** 0.5)
+        self.assertEqual(unit.to_float(unit.fma(a, b, b)), -1.125)
+
+    def test_special_values(self):
+        inf, zero = BINARY32.infinity, 0
+        self.assertTrue(self.unit.is_nan(self.unit.sub(inf, inf)))
+        self.assertTrue(self.unit.is_nan(self.unit.mul(inf, zero)))
+        self.assertTrue(self.unit.is_nan(self.unit.sqrt(self.unit.from_float(-1.0))))
+        self.assertEqual(self.unit.div(self.unit.from_float(-1.0), zero), BINARY32.sign_mask | inf)
+        self.assertEqual(self.unit.sqrt(BINARY32.sign_mask), BINARY32.sign_mask)
+
+    def test_rounding_modes(self):
+        down = SoftFloat(BINARY64, ROUND_DOWN)
+        up = SoftFloat(BINARY64, ROUND_UP)
+        one, three = down.from_float(1.0), down.from_float(3.0)
+        self.assertLess(down.to_float(down.div(one, three)), up.to_float(up.div(one, three)))
+        self.assertIn(1.0 / 3.0, (down.to_float(down.div(one, three)), up.to_float(up.div(one, three))))
+        # Переполнение при округлении к нулю дает наибольшее конечное число
+        toward_zero = SoftFloat(BINARY32, ROUND_TOWARD_ZERO)
+        self.assertEqual(toward_zero.mul(BINARY32.max_finite, toward_zero.from_float(2.0)), BINARY32.max_finite)
+        # Точный ноль разности равных чисел при округлении вниз отрицателен
+        self.assertEqual(SoftFloat(BINARY32, ROUND_DOWN).sub(self.unit.from_float(1.5), self.unit.from_float(1.5)),
+                         BINARY32.sign_mask)
+
+    def test_subnormals(self):
+        smallest = 1
+        self.assertEqual(self.unit.add(smallest, smallest), 2)
+        self.assertEqual(self.unit.mul(smallest, self.unit.from_float(0.5)), 0)
+
+    def test_conformance(self):
+        for fmt in (BINARY32, BINARY64):
+            self.assertEqual(run_conformance(fmt, count=300, seed=5), [])
+
+
+class TestIEEE754Bulk(unittest.TestCase):
+
+    values = [5.5, -5.5, 1.0, 0.0, -0.0, 1e-40, float('inf'), 3.14159]
+
+    def check_round_trip(self):
+        codes = BinaryConverter.ieee754_many(self.values)
+        self.assertEqual(codes[0], BinaryConverter(5.5).ieee754())
+        self.assertEqual(codes[1], '11000000101100000000000000000000')
+        self.assertEqual(list(DecimalConverter.ieee754_many_to_decimal(codes))[:3],
+                         [DecimalConverter.ieee754_to_decimal(code) for code in codes[:3]])
+
+        for bits in (32, 64):
+            integers = BinaryConverter.ieee754_many(self.values, bits, as_strings=False)
+            decoded = list(DecimalConverter.ieee754_many_to_decimal(integers, bits))
+            self.assertEqual(list(DecimalConverter.ieee754_many_to_decimal(
+                BinaryConverter.ieee754_many(self.values, bits), bits)), decoded)
+            if bits == 64:
+                self.assertEqual(decoded, self.values)
+
+    def check_invalid(self):
+        for codes in (['0' * 31], ['0' * 33], ['0' * 31 + '2'], ['0' * 30 + ' 1']):
+            with self.assertRaises(ValueError):
+                ieee754_bulk.IEEE754Bulk.decode(codes)
+        with self.assertRaises(OverflowError):
+            ieee754_bulk.IEEE754Bulk.encode([1.0, 1e40])
+        self.assertEqual(ieee754_bulk.IEEE754Bulk.encode([float('-inf')])[0], '1' + '1' * 8 + '0' * 23)
+
+    @unittest.skipIf(ieee754_bulk.np is None, "NumPy не установлен")
+    def test_numpy(self):
+        self.check_round_trip()
+        self.check_invalid()
+
+    def test_without_numpy(self):
+        saved = ieee754_bulk.np
+        ieee754_bulk.np = None
+        try:
+            self.check_round_trip()
+            self.check_invalid()
+        finally:
+            ieee754_bulk.np = saved
+
+    def test_unsupported_width(self):
+        with self.assertRaises(ValueError):
+            BinaryConverter.ieee754_many([1.0], bits=16)
+
+
+class TestConversionCache(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+        cache = ConversionCache(maxsize=2)
+        self.assertEqual(cache.additional_code(-5), '1011')
+        self.assertEqual(cache.reverse_code(-5), '1010')
+        self.assertEqual(cache.direct_code(-5), '1101')
+        self.assertEqual(cache.stats(), {'hits': 2, 'misses': 1, 'size': 1, 'maxsize': 2})
+
+    def test_key_includes_width_and_precision(self):
+        cache = ConversionCache()
+        self.assertEqual(cache.direct_code(5), '0101')
+        self.assertEqual(cache.direct_code(5, width=8), '00000101')
+        self.assertEqual(cache.direct_code(0.1, precision=2), '00.00')
+        self.assertEqual(cache.misses, 3)
+
+    def test_lru_eviction(self):
+        cache = ConversionCache(maxsize=2)
+        cache.codes(1)
+        cache.codes(2)
+        cache.codes(1)
+        cache.codes(3)  # вытесняет 2 – давно не использовавшееся
+        cache.codes(1)
+        self.assertEqual(cache.hits, 2)
+        cache.codes(2)
+        self.assertEqual(cache.misses, 4)
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+
+    def test_disabled(self):
+        cache = ConversionCache(maxsize=0)
+        cache.codes(7)
+        cache.codes(7)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 2, 0))
+
+
+class TestFixedWidth(unittest.TestCase):
+
+    def test_calculator_width(self):
+        for engine in (ENGINE_STR, ENGINE_INT):
+            self.assertEqual(BinaryCalculator.sum_additional_code('0111', '01', engine=engine, width=4), '1000')
+            self.assertEqual(BinaryCalculator.sum_additional_code('1111', '1', engine=engine, width=8), '11111110')
+            self.assertEqual(BinaryCalculator.subtract_additional_code('0001', '0010', engine=engine, width=4), '1111')
+        with self.assertRaises(ValueError):
+            BinaryCalculator.sum_additional_code('010101', '01', width=4)
+
+    def test_zero_width(self):
+        # width=0 – неверная ширина, а не "минимальная"
+        for method in ('direct_code', 'bit_vectors'):
+            with self.assertRaisesRegex(ValueError, "не помещается"):
+                getattr(BinaryConverter(5, width=0), method)()
+        with self.assertRaises(ValueError):
+            BinaryCalculator.sum_additional_code('01', '01', engine=ENGINE_INT, width=0)
+
+    def test_chain_keeps_width(self):
+        result = '0'
+        for _ in range(1000):
+            result = BinaryCalculator.sum_additional_code(result, '0111', engine=ENGINE_INT, width=8)
+        self.assertEqual(len(result), 8)
+        self.assertEqual(result, format(7000 % 256, '08b'))
+
+    def test_add_flags(self):
+        alu = ALU(8)
+        result = alu.add(alu.load_number(127), alu.load_number(1))
+        self.assertEqual(alu.store(result), '10000000')
+        self.assertEqual(alu.flags(), {'carry': False, 'overflow': True, 'zero': False, 'negative': True})
+
+        result = alu.add(alu.load_number(-1), alu.load_number(1))
+        self.assertEqual(alu.flags(), {'carry': True, 'overflow': False, 'zero': True, 'negative': False})
+
+    def test_sub_flags(self):
+        alu = ALU(8)
+        result = alu.sub(alu.load_number(1), alu.load_number(2))
+        self.assertEqual(alu.to_signed(result), -1)
+        self.assertTrue(alu.carry)
+        self.assertFalse(alu.overflow)
+        alu.sub(alu.load_number(-128), alu.load_number(1))
+        self.assertTrue(alu.overflow)
+
+    def test_mul_and_shifts(self):
+        alu = ALU(16)
+        self.assertEqual(alu.to_signed(alu.mul(alu.load_number(-300), alu.load_number(100))), -30000)
+        self.assertFalse(alu.overflow)
+        alu.mul(alu.load_number(300), alu.load_number(300))
+        self.assertTrue(alu.overflow)
+        self.assertEqual(alu.to_signed(alu.shift_right(alu.load_number(-8), 2)), -2)
+        self.assertEqual(alu.shift_left(alu.load('1000000000000001')), 2)
+        self.assertTrue(alu.carry)
+
+    def test_load_sign_extends(self):
+        alu = ALU(8)
+        self.assertEqual(alu.store(alu.load('101')), '11111101')
+        with self.assertRaises(ValueError):
+            alu.load('1' * 9)
+
+
+class TestExpressionEvaluator(unittest.TestCase):
+
+    def test_integers(self):
+        self.assertEqual(ExpressionEvaluator.evaluate("2 + 3 * 4"), ('01110', 14))
+        self.assertEqual(ExpressionEvaluator.evaluate("-(7 - 10) * -2"), ('1010', -6))
+        self.assertEqual(ExpressionEvaluator.evaluate("10 - 20 - 30")[1], -40)
+
+    def test_fixed_point(self):
+        self.assertEqual(ExpressionEvaluator.evaluate("2.75 + 0.5", precision=4), ('011.0100', 3.25))
+        self.assertEqual(ExpressionEvaluator.evaluate("1 / 4 - 1", precision=3), ('1.010', -0.75))
+        self.assertEqual(ExpressionEvaluator.evaluate("1.5 * -1.5", precision=4)[1], -2.25)
+
+    def test_compiled_once(self):
+        ExpressionEvaluator.compile.cache_clear()
+        for _ in range(3):
+            ExpressionEvaluator.evaluate("1 + 1")
+        self.assertEqual(ExpressionEvaluator.compile.cache_info().misses, 1)
+
+    def test_evaluate_lines(self):
+        lines = iter(["1 + 2", "", "# комментарий", "4 / 0", "(1 + 2", "3 * 3 # девять"])
+        results = list(ExpressionEvaluator.evaluate_lines(lines))
+        self.assertEqual([result[2] for result in results], [3, None, None, 9])
+        self.assertIsNotNone(results[1][3])
+        self.assertIsNotNone(results[2][3])
+
+    def test_invalid(self):
+        for expression in ("", "1 +", "* 2", "1 2", "2 ^ 3", "(1))"):
+            with self.assertRaises(ValueError):
+                ExpressionEvaluator.evaluate(expression)
+
+
+class TestBatchCalculator(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(2)
+        self.values1 = [rng.randint(-128, 127) for _ in range(200)]
+        self.values2 = [rng.randint(-128, 127) for _ in range(200)]
+        self.bins1 = [format(value & 0xFF, '08b') for value in self.values1]
+        self.bins2 = [format(value & 0xFF, '08b') for value in self.values2]
+
+    def test_sum_strings(self):
+        codes, decimals = BatchCalculator.sum_additional_code(self.bins1, self.bins2)
+        for bin1, bin2, code, decimal in zip(self.bins1, self.bins2, codes, decimals):
+            self.assertEqual(code, BinaryCalculator.sum_additional_code(bin1, bin2))
+            self.assertEqual(decimal, DecimalConverter.additional_code_to_decimal(code))
+
+    def test_subtract_strings(self):
+        codes, decimals = BatchCalculator.subtract_additional_code(self.bins1, self.bins2)
+        for bin1, bin2, code, decimal in zip(self.bins1, self.bins2, codes, decimals):
+            self.assertEqual(code, BinaryCalculator.subtract_additional_code(bin1, bin2))
+            self.assertEqual(decimal, DecimalConverter.additional_code_to_decimal(code))
+
+    @unittest.skipIf(np is None, "NumPy не установлен")
+    def test_numpy_arrays(self):
+        array1 = np.array([int(bits, 2) for bits in self.bins1], dtype=np.uint8)
+        array2 = np.array([int(bits, 2) for bits in self.bins2], dtype=np.uint8)
+        codes, decimals = BatchCalculator.subtract_additional_code(array1, array2, width=8)
+        expected_codes, expected_decimals = BatchCalculator.subtract_additional_code(self.bins1, self.bins2)
+        self.assertEqual(codes.tolist(), expected_codes)
+        self.assertEqual(decimals.tolist(), expected_decimals)
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            BatchCalculator.sum_additional_code(['01'], [])
+
+    @unittest.skipIf(np is None, "NumPy не установлен")
+    def test_mixed_operands(self):
+        array = np.array([int(bits, 2) for bits in self.bins2], dtype=np.uint8)
+        with self.assertRaises(ValueError):
+            BatchCalculator.sum_additional_code(self.bins1, array, width=8)
+        codes, decimals = BatchCalculator.sum_additional_code(self.bins1, np.array(self.bins2))
+        self.assertEqual((codes, decimals), BatchCalculator.sum_additional_code(self.bins1, self.bins2))
+
+
+class TestRadix(unittest.TestCase):
+
+    def test_to_binary_methods(self):
+        rng = random.Random(11)
+        numbers = [0, 1, 2, 5, (1 << 64) - 1, 1 << 64] + [rng.getrandbits(rng.randint(1, 2000)) for _ in range(50)]
+        for method in RADIX_METHODS:
+            for number in numbers:
+                self.assertEqual(BinaryConverter.to_binary(number, method), format(number, 'b'))
+        with self.assertRaises(ValueError):
+            BinaryConverter.to_binary(5, 'octal')
+
+    def test_decimal_round_trip(self):
+        rng = random.Random(12)
+        for number in [0, 7, 10 ** 40] + [rng.getrandbits(rng.randint(1, 5000)) for _ in range(50)]:
+            binary = format(number, 'b')
+            digits = DecimalConverter.binary_to_decimal(binary)
+            self.assertEqual(digits, str(number))
+            self.assertEqual(BinaryConverter.decimal_to_binary(digits), binary)
+
+    def test_huge_numbers(self):
+        # 100 тысяч десятичных цифр – больше ограничения int(str) по умолчанию
+        digits = '9' * 100000
+        binary = BinaryConverter.decimal_to_binary(digits)
+        self.assertEqual(int(binary, 2), 10 ** 100000 - 1)
+        self.assertEqual(DecimalConverter.binary_to_decimal(binary), digits)
+        self.assertEqual(RadixConverter.decimal_to_int('-' + digits), 1 - 10 ** 100000)
+
+    def test_invalid_decimal(self):
+        with self.assertRaises(ValueError):
+            BinaryConverter.decimal_to_binary('12a')
+        with self.assertRaises(ValueError):
+            BinaryConverter.decimal_to_binary('-5')
+
+
+class TestExactFraction(unittest.TestCase):
+
+    def test_prefix_and_period(self):
+        self.assertEqual(BinaryConverter.exact_frac_to_binary(Fraction(1, 3)), ('', '01'))
+        self.assertEqual(BinaryConverter.exact_frac_to_binary(Fraction(5, 8)), ('101', ''))
+        self.assertEqual(BinaryConverter.exact_frac_to_binary(Decimal('0.1')), ('0', '0011'))
+        self.assertEqual(BinaryConverter.exact_frac_to_binary(Fraction(1, 12)), ('00', '01'))
+        self.assertEqual(BinaryConverter.exact_frac_to_binary(0), ('', ''))
+
+    def test_expansion_is_exact(self):
+        rng = random.Random(13)
+        for _ in range(500):
+            denominator = rng.randint(1, 1000)
+            frac = Fraction(rng.randrange(denominator), denominator)
+            bits = BinaryConverter.frac_to_binary(frac, 100)
+            self.assertEqual(int(bits.ljust(100, '0'), 2), int(frac * 2 ** 100))
+
+    def test_codes(self):
+        self.assertEqual(BinaryConverter(Fraction(-13, 3), precision=12).direct_code(), '1100.010101010101')
+        self.assertEqual(BinaryConverter(Decimal('2.75')).direct_code(), '010.11')
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            BinaryConverter.exact_frac_to_binary(Fraction(3, 2))
+
+
+class TestAdders(unittest.TestCase):
+
+    def test_same_result_as_add_binaries(self):
+        rng = random.Random(14)
+        for _ in range(100):
+            bin1 = format(rng.getrandbits(rng.randint(1, 40)), 'b')
+            bin2 = format(rng.getrandbits(rng.randint(1, 40)), 'b').zfill(rng.randint(1, 44))
+            expected = BinaryCalculator.add_binaries(bin1, bin2, engine=ENGINE_STR)
+            for adder in ADDERS:
+                self.assertEqual(BinaryCalculator.add_with_cost(bin1, bin2, adder)[0], expected)
+
+    def test_cost(self):
+        self.assertEqual(Adders.add('1', '1', ADDER_RIPPLE), ('10', {'gates': 5, 'depth': 3}))
+        results = Adders.sweep([64])[64]
+        # Префиксный сумматор самый быстрый, последовательный – самый дешевый
+        self.assertEqual(min(ADDERS, key=lambda adder: results[adder]['depth']), ADDER_KOGGE_STONE)
+        self.assertEqual(min(ADDERS, key=lambda adder: results[adder]['gates']), ADDER_RIPPLE)
+        self.assertLess(results[ADDER_LOOKAHEAD]['depth'], results[ADDER_RIPPLE]['depth'])
+        self.assertLess(results[ADDER_CARRY_SELECT]['depth'], results[ADDER_RIPPLE]['depth'])
+
+    def test_carry_save(self):
+        rng = random.Random(15)
+        operands = [format(rng.getrandbits(16), 'b') for _ in range(10)]
+        result, cost = BinaryCalculator.add_many_with_cost(operands)
+        self.assertEqual(int(result, 2), sum(int(operand, 2) for operand in operands))
+        self.assertGreater(cost['gates'], 0)
+        self.assertEqual(Adders.carry_save(['0011'])[0], '0011')
+
+    def test_unknown_adder(self):
+        with self.assertRaises(ValueError):
+            Adders.add('1', '1', 'magic')
+
+
+class TestSumMany(unittest.TestCase):
+
+    def test_engines_agree(self):
+        rng = random.Random(16)
+        for _ in range(100):
+            codes = []
+            for _ in range(rng.randint(1, 20)):
+                length = rng.randint(1, 16)
+                codes.append(format(rng.getrandbits(length), f'0{length}b'))
+            expected = sum(DecimalConverter.additional_code_to_decimal(code) for code in codes)
+            result = BinaryCalculator.sum_many(codes, engine=ENGINE_STR)
+            self.assertEqual(result, BinaryCalculator.sum_many(codes, engine=ENGINE_INT))
+            self.assertEqual(DecimalConverter.additional_code_to_decimal(result), expected)
+
+    def test_width(self):
+        # 5 слагаемых по 4 бита: 4 + ceil(log2 5) = 7 бит
+        self.assertEqual(BinaryCalculator.sum_many(['0111'] * 5), '0100011')
+        self.assertEqual(BinaryCalculator.sum_many(['1000'] * 4), '100000')
+        self.assertEqual(BinaryCalculator.sum_many(['0111', '0001'], width=4), '1000')
+        self.assertEqual(BinaryCalculator.sum_many(['101']), '101')
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            BinaryCalculator.sum_many([])
+        with self.assertRaises(ValueError):
+            BinaryCalculator.sum_many(['01010'], width=4)
+
+
+class TestBoothMultiplier(unittest.TestCase):
+
+    def test_exhaustive(self):
+        for bin1 in (format(value, '05b') for value in range(32)):
+            for bin2 in (format(value, '04b') for value in range(16)):
+                expected = DecimalConverter.additional_code_to_decimal(bin1) * \
+                    DecimalConverter.additional_code_to_decimal(bin2)
+                full = BinaryCalculator.multiply_additional_code(bin1, bin2, full=True)
+                self.assertEqual(len(full), 9)
+                self.assertEqual(DecimalConverter.additional_code_to_decimal(full), expected)
+                self.assertEqual(full, BinaryCalculator.multiply_additional_code(bin1, bin2, engine=ENGINE_INT, full=True))
+                short = BinaryCalculator.multiply_additional_code(bin1, bin2)
+                self.assertEqual(short, BinaryCalculator.multiply_additional_code(bin1, bin2, engine=ENGINE_INT))
+                self.assertEqual(DecimalConverter.additional_code_to_decimal(short), expected)
+
+    def test_minimal_width(self):
+        self.assertEqual(BinaryCalculator.multiply_additional_code('1110', '011'), '1010')  # -2 * 3 = -6
+        self.assertEqual(BinaryCalculator.multiply_additional_code('100', '01'), '100')  # -4 * 1 = -4
+        self.assertEqual(BinaryCalculator.multiply_additional_code('0101', '0000'), '0')
+
+    def test_partial_products_halved(self):
+        rows = BinaryCalculator.booth_partial_products('0' + '1' * 15, '01' * 8, 32)
+        self.assertLessEqual(len(rows), 8 + 1)  # 8 цифр Бута и строка поправок
+
+
+class TestDecimalDecoders(unittest.TestCase):
+
+    def test_engines_agree(self):
+        for length in range(1, 9):
+            for value in range(1 << length):
+                code = format(value, f'0{length}b')
+                for decode in (DecimalConverter.reverse_code_to_decimal, DecimalConverter.additional_code_to_decimal,
+                               DecimalConverter.direct_code_to_decimal_int):
+                    self.assertEqual(decode(code, ENGINE_INT), decode(code, ENGINE_STR))
+                fixed = code[:1] + code[1:length // 2 + 1] + '.' + code[length // 2 + 1:]
+                result = DecimalConverter.direct_code_to_decimal_float(fixed, ENGINE_INT)
+                expected = DecimalConverter.direct_code_to_decimal_float(fixed, ENGINE_STR)
+                self.assertEqual((result, type(result)), (expected, type(expected)))
+
+    def test_decode_many_list(self):
+        codes = ['0101', '1101', '1000']
+        self.assertEqual(DecimalConverter.decode_many(codes), [5, -3, -8])
+        self.assertEqual(DecimalConverter.decode_many(codes, CODE_DIRECT), [5, -5, -0])
+        self.assertEqual(DecimalConverter.decode_many(codes, CODE_REVERSE, ENGINE_STR), [5, -2, -7])
+        self.assertEqual(DecimalConverter.decode_many(['01.1', '110.01'], CODE_FIXED_POINT), [1.5, -2.25])
+        with self.assertRaises(ValueError):
+            DecimalConverter.decode_many(codes, 'gray')
+
+    def test_decode_many_global_engine(self):
+        with mock.patch.object(DecimalConverter, 'engine', 'unknown'):
+            with self.assertRaises(ValueError):
+                DecimalConverter.decode_many(['0101'])
+            self.assertEqual(DecimalConverter.decode_many(['0101', '1101'], engine=ENGINE_INT), [5, -3])
+
+    def test_decode_many_mmap(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(b'0101\n1101\r\n\n1000 0001\n0111')
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self.assertEqual(DecimalConverter.decode_many(buffer, CODE_ADDITIONAL), [5, -3, -8, 1, 7])
+        self.assertEqual(DecimalConverter.decode_many(b'11 01'), [-1, 1])
+
+    def test_iter_decode_chunks(self):
+        data = b'0101\n1101 1000\n\n0001\n0111'
+        codes = DecimalConverter.iter_decode(memoryview(data))
+        self.assertNotIsInstance(codes, list)
+        # Куски по 3 байта режут коды пополам
+        with mock.patch.object(decimal_converter, 'BUFFER_CHUNK', 3):
+            self.assertEqual(list(codes), [5, -3, -8, 1, 7])
+            self.assertEqual(DecimalConverter.decode_many(bytearray(data)), [5, -3, -8, 1, 7])
+
+
+class TestCodeFile(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'codes')
+        rng = random.Random(17)
+        self.codes = [format(rng.getrandbits(13), '013b') for _ in range(200)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        for file_format in FORMATS:
+            self.assertEqual(write_codes(self.path, self.codes, 13, file_format), 200)
+            with CodeFile(self.path) as codes:
+                self.assertEqual(codes.format, file_format)
+                self.assertEqual(len(codes), 200)
+                self.assertEqual(list(codes), self.codes)
+                self.assertEqual(codes[-1], self.codes[-1])
+                self.assertEqual(codes[10:13], self.codes[10:13])
+                self.assertEqual(codes.value(5), int(self.codes[5], 2))
+                self.assertEqual(DecimalConverter.decode_many(codes), DecimalConverter.decode_many(self.codes))
+
+    def test_packed_is_smaller(self):
+        write_codes(self.path, self.codes, 13, FORMAT_TEXT)
+        text_size = os.path.getsize(self.path)
+        write_codes(self.path, (int(code, 2) for code in self.codes), 13, FORMAT_PACKED)
+        self.assertLess(os.path.getsize(self.path), text_size / 6)
+
+    def test_text_without_trailing_newline(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'0101\r\n1100')
+        with CodeFile(self.path) as codes:
+            self.assertEqual(list(codes), ['0101', '1100'])
+
+    def test_errors(self):
+        with CodeFileWriter(self.path, 4) as writer:
+            with self.assertRaises(ValueError):
+                writer.write('010')
+            with self.assertRaises(ValueError):
+                writer.write(16)
+        with open(self.path, 'wb') as file:
+            file.write(b'0101\n110\n')
+        with CodeFile(self.path) as codes:
+            with self.assertRaises(ValueError):
+                list(codes)
+        with open(self.path, 'wb') as file:
+            file.write(b'0101\n01x1\n')
+        with CodeFile(self.path) as codes:
+            self.assertEqual(codes[0], '0101')
+            with self.assertRaises(ValueError):
+                codes.value(1)
+
+    def test_invalid_file_is_closed(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'0101\n110')
+        opened = []
+        real_open = open
+
+        def tracking_open(*args, **kwargs):
+            opened.append(real_open(*args, **kwargs))
+            return opened[-1]
+
+        with mock.patch('builtins.open', tracking_open):
+            with self.assertRaises(ValueError):
+                CodeFile(self.path)
+        write_codes(self.path, ['0101', '1100'], 4, FORMAT_PACKED)
+        with open(self.path, 'r+b') as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+        with mock.patch('builtins.open', tracking_open):
+            with self.assertRaises(ValueError):
+                CodeFile(self.path)
+        with open(self.path, 'wb') as file:
+            file.write(b'LR1B\x04')
+        with mock.patch('builtins.open', tracking_open):
+            with self.assertRaisesRegex(ValueError, 'обрезан'):
+                CodeFile(self.path)
+        self.assertEqual(len(opened), 3)
+        self.assertTrue(all(file.closed for file in opened))
+
+
+class TestBitVector(unittest.TestCase):
+
+    def test_string_like(self):
+        bits = BitVector.from_str('10110')
+        self.assertEqual(str(bits), '10110')
+        self.assertEqual(len(bits), 5)
+        self.assertEqual(bits[0], '1')
+        self.assertEqual(bits[1:4], BitVector.from_str('011'))
+        self.assertEqual(bits, '10110')
+        self.assertEqual(bits + '01', BitVector.from_str('1011001'))
+        self.assertEqual(bits.to_signed(), -10)
+        self.assertEqual(bits.to_bytes(), bytes([0b10110000]))
+        with self.assertRaises(ValueError):
+            BitVector.from_str('012')
+
+    def test_word_operations(self):
+        a, b = BitVector.from_str('1100'), BitVector.from_str('1010')
+        self.assertEqual(a & b, '1000')
+        self.assertEqual(a | b, '1110')
+        self.assertEqual(a ^ b, '0110')
+        self.assertEqual(~a, '0011')
+        self.assertEqual(a << 1, '1000')
+        self.assertEqual(a >> 1, '0110')
+        self.assertEqual(a.sign_extend(6), '111100')
+        self.assertEqual(BitVector.from_signed(-3, 4), '1101')
+        self.assertEqual(len({BitVector.coerce('101'), '101', BitVector(5, 3)}), 1)
+
+    def test_calculator_accepts_and_returns(self):
+        rng = random.Random(18)
+        for _ in range(100):
+            bin1 = format(rng.getrandbits(12), '012b')
+            bin2 = format(rng.getrandbits(9), '09b')
+            bits1, bits2 = BitVector.from_str(bin1), BitVector.from_str(bin2)
+            for operation in (BinaryCalculator.add_binaries, BinaryCalculator.sum_additional_code,
+                              BinaryCalculator.subtract_additional_code, BinaryCalculator.multiply_direct_code,
+                              BinaryCalculator.multiply_additional_code):
+                result = operation(bits1, bits2)
+                self.assertIsInstance(result, BitVector)
+                self.assertEqual(str(result), operation(bin1, bin2, engine=ENGINE_INT))
+            for decode in (DecimalConverter.reverse_code_to_decimal, DecimalConverter.additional_code_to_decimal,
+                           DecimalConverter.direct_code_to_decimal_int):
+                self.assertEqual(decode(bits1), decode(bin1))
+
+    def test_converter_bit_vectors(self):
+        for number in range(-20, 21):
+            for width in (None, 8):
+                converter = BinaryConverter(number, width=width)
+                self.assertEqual(tuple(str(code) for code in converter.bit_vectors()), converter.codes())
+        with self.assertRaises(ValueError):
+            BinaryConverter(1.5).bit_vectors()
+
+
+class TestBatchCli(unittest.TestCase):
+
+    SOURCE = "5 3\n-7, 2\n# комментарий\n\n1 0\nx y\n"
+
+    def run_batch(self, operation, output_format='json', workers=1, engine=None):
+        output = io.StringIO()
+        # min_parallel=0: даже короткий файл при workers > 1 идет через пул процессов
+        count, errors, _ = LR_1.run_batch(io.StringIO(self.SOURCE), output, operation, output_format, workers,
+                                          engine, min_parallel=0)
+        return count, errors, output.getvalue()
+
+    def test_json(self):
+        count, errors, text = self.run_batch('add')
+        records = [json.loads(line) for line in text.splitlines()]
+        self.assertEqual((count, errors), (4, 1))
+        self.assertEqual([record['line'] for record in records], [1, 2, 5, 6])
+        self.assertEqual([record['decimal'] for record in records], [8, -5, 1, None])
+        self.assertEqual(records[0]['code'], BinaryCalculator.sum_additional_code('0101', '011'))
+        self.assertIsNotNone(records[3]['error'])
+
+    def test_division_by_zero(self):
+        _, errors, text = self.run_batch('div')
+        records = [json.loads(line) for line in text.splitlines()]
+        self.assertEqual(errors, 2)
+        self.assertEqual(records[1]['decimal'], -3.5)
+        self.assertEqual(records[2]['error'], "Деление на ноль невозможно")
+
+    def test_csv(self):
+        _, _, text = self.run_batch('mul', 'csv')
+        lines = text.splitlines()
+        self.assertEqual(lines[0], 'line,a,b,code,decimal,error')
+        self.assertEqual(lines[1], '1,5,3,01111,15,')
+
+    def test_workers_preserve_order(self):
+        self.assertEqual(self.run_batch('sub', workers=2)[2], self.run_batch('sub')[2])
+        self.assertEqual(self.run_batch('div', workers=2, engine=ENGINE_INT)[2], self.run_batch('div')[2])
+
+    def test_fadd(self):
+        output = io.StringIO()
+        LR_1.run_batch(io.StringIO("1.5 2.25\n"), output, 'fadd')
+        self.assertEqual(json.loads(output.getvalue())['decimal'], 3.75)
+
+    def test_fadd_non_finite(self):
+        output = io.StringIO()
+        count, errors, _ = LR_1.run_batch(io.StringIO("inf 1\n1e400 1\nnan 1\n1.5 2.25\n"), output, 'fadd')
+        records = [json.loads(line, parse_constant=self.fail) for line in output.getvalue().splitlines()]
+        self.assertEqual((count, errors), (4, 3))
+        self.assertEqual([record['a'] for record in records], [None, None, None, 1.5])
+        self.assertEqual(records[3]['decimal'], 3.75)
+
+    def test_engine_restored(self):
+        BinaryCalculator.set_engine(ENGINE_STR)
+        LR_1.run_batch(io.StringIO(self.SOURCE), io.StringIO(), 'add', engine=ENGINE_INT)
+        self.assertEqual((BinaryCalculator.engine, DecimalConverter.engine), (ENGINE_STR, ENGINE_STR))
+
+
+class TestParallel(unittest.TestCase):
+
+    def test_order_preserved(self):
+        executor = ParallelExecutor(workers=2, chunk_size=7, min_parallel=0)
+        self.assertEqual(list(executor.map(abs, range(-100, 0))), list(range(100, 0, -1)))
+
+    def test_small_batch_in_process(self):
+        calls = []
+        executor = ParallelExecutor(workers=4, initializer=calls.append, initargs=('init',))
+        self.assertEqual(list(executor.map(abs, [-1, -2])), [1, 2])
+        self.assertEqual(calls, [])
+
+    def test_empty_input(self):
+        executor = ParallelExecutor(workers=2, min_parallel=0)
+        with mock.patch('parallel.ProcessPoolExecutor') as pool:
+            self.assertEqual(list(executor.map(abs, [])), [])
+        pool.assert_not_called()
+
+    def test_divide_and_multiply_many(self):
+        rng = random.Random(20)
+        pairs = [('0' + format(rng.getrandbits(12), '012b'), '01' + format(rng.getrandbits(5), '05b'))
+                 for _ in range(60)]
+        self.assertEqual(list(divide_many(pairs, precision=8, workers=2, chunk_size=16, min_parallel=0)),
+                         [BinaryCalculator.division_direct_code(a, b, 8) for a, b in pairs])
+        self.assertEqual(list(multiply_many(pairs, engine=ENGINE_INT, workers=2, chunk_size=7, min_parallel=0)),
+                         [BinaryCalculator.multiply_direct_code(a, b, engine=ENGINE_INT) for a, b in pairs])
+        self.assertEqual(list(multiply_many(pairs, engine=ENGINE_INT, workers=1)),
+                         [BinaryCalculator.multiply_direct_code(a, b, engine=ENGINE_INT) for a, b in pairs])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ParallelExecutor(workers=2, chunk_size=0)
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_run(self):
+        results = benchmarks.run(['add_binaries[int]', 'sum_ieee754'], widths=[8, 16], min_time=0.001)
+        self.assertEqual([(result['benchmark'], result['width']) for result in results],
+                         [('add_binaries[int]', 8), ('add_binaries[int]', 16), ('sum_ieee754', 32)])
+        for result in results:
+            self.assertGreater(result['ops_per_sec'], 0)
+            self.assertGreaterEqual(result['peak_bytes'], 0)
+
+    def test_frac_to_binary_scales_with_width(self):
+        setup, function = benchmarks.BENCHMARKS['frac_to_binary']
+        for width in (64, 512):
+            self.assertEqual(len(function(*setup(random.Random(10), width))), width)
+
+    def test_compare(self):
+        baseline = [{'benchmark': 'a', 'width': 8, 'ops_per_sec': 100.0},
+                    {'benchmark': 'b', 'width': 8, 'ops_per_sec': 100.0}]
+        results = [{'benchmark': 'a', 'width': 8, 'ops_per_sec': 70.0},
+                   {'benchmark': 'b', 'width': 8, 'ops_per_sec': 90.0},
+                   {'benchmark': 'c', 'width': 8, 'ops_per_sec': 1.0}]
+        self.assertEqual(benchmarks.compare(results, baseline, threshold=0.2), [('a', 8, 100.0, 70.0)])
+
+
 if __name__ == '__main__':
     unittest.main()
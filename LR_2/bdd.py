@@ -0,0 +1,371 @@
+from typing import Dict, Iterator, List, Optional
+
+# Номера терминальных узлов
+FALSE = 0
+TRUE = 1
+
+# Двухместные операции над значениями 0/1 терминальных узлов
+OPERATIONS = {
+    '&': lambda a, b: a & b,
+    '|': lambda a, b: a | b,
+    '->': lambda a, b: (1 - a) | b,
+    '~': lambda a, b: int(a == b),
+}
+
+
+class BDD:
+    """Сокращенная упорядоченная диаграмма двоичных решений (ROBDD).
+    Узел – номер в массивах уровня, младшего (переменная = 0) и старшего (= 1) потомков;
+    уровень – позиция переменной в порядке order, терминалы FALSE и TRUE имеют уровень len(order).
+    Таблица уникальности (уровень, младший, старший) -> узел гарантирует, что одинаковые подграфы
+    хранятся один раз, кеш операций запоминает результаты apply и negate.
+    """
+
+    def __init__(self, variables: List[str]):
+        self.order = list(variables)
+        self._position = {variable: level for level, variable in enumerate(self.order)}
+        self._reset()
+
+    def _reset(self):
+        terminal_level = len(self.order)
+        self._level = [terminal_level, terminal_level]
+        self._low = [FALSE, TRUE]
+        self._high = [FALSE, TRUE]
+        self._refs = [0, 0]  # число ссылок на узел от родителей (и от корней при просеивании)
+        self._live = 0  # число нетерминальных узлов в таблице уникальности
+        self._unique = {}
+        self._computed = {}
+        self._level_nodes = [set() for _ in self.order]
+
+    def mk(self, level: int, low: int, high: int) -> int:
+        """Возвращает узел (level, low, high), не создавая повторов и лишних проверок."""
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            node = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+            self._refs.append(0)
+            self._refs[low] += 1
+            self._refs[high] += 1
+            self._live += 1
+            self._register(node)
+        return node
+
+    def _register(self, node: int):
+        self._unique[(self._level[node], self._low[node], self._high[node])] = node
+        self._level_nodes[self._level[node]].add(node)
+
+    def _release(self, node: int):
+        """Снимает ссылку на узел; узел без ссылок удаляется вместе с освободившимися потомками."""
+        self._refs[node] -= 1
+        if self._refs[node] or node <= TRUE:
+            return
+        del self._unique[(self._level[node], self._low[node], self._high[node])]
+        self._level_nodes[self._level[node]].discard(node)
+        self._live -= 1
+        self._release(self._low[node])
+        self._release(self._high[node])
+
+    def var(self, variable: str) -> int:
+        return self.mk(self._position[variable], FALSE, TRUE)
+
+    def _split(self, node: int, level: int):
+        """Потомки узла по переменной уровня level (узел без этой переменной – оба потомка он сам)."""
+        if self._level[node] == level:
+            return self._low[node], self._high[node]
+        return node, node
+
+    def apply(self, operator: str, u: int, v: int) -> int:
+        if u <= TRUE and v <= TRUE:
+            return OPERATIONS[operator](u, v)
+        if operator == '&':
+            if u == FALSE or v == FALSE:
+                return FALSE
+            if u == TRUE or u == v:
+                return v
+            if v == TRUE:
+                return u
+        elif operator == '|':
+            if u == TRUE or v == TRUE:
+                return TRUE
+            if u == FALSE or u == v:
+                return v
+            if v == FALSE:
+                return u
+
+        key = (operator, u, v)
+        result = self._computed.get(key)
+        if result is None:
+            level = min(self._level[u], self._level[v])
+            u_low, u_high = self._split(u, level)
+            v_low, v_high = self._split(v, level)
+            result = self.mk(level, self.apply(operator, u_low, v_low), self.apply(operator, u_high, v_high))
+            self._computed[key] = result
+        return result
+
+    def negate(self, u: int) -> int:
+        if u <= TRUE:
+            return TRUE - u
+        key = ('!', u)
+        result = self._computed.get(key)
+        if result is None:
+            result = self.mk(self._level[u], self.negate(self._low[u]), self.negate(self._high[u]))
+            self._computed[key] = result
+        return result
+
+    def ite(self, f: int, g: int, h: int) -> int:
+        """Если f, то g, иначе h."""
+        return self.apply('|', self.apply('&', f, g), self.apply('&', self.negate(f), h))
+
+    def from_rpn(self, rpn: List[str]) -> int:
+        """Строит диаграмму прямо по обратной польской записи (ReversePolishNotationConverter)."""
+        stack = []
+        for token in rpn:
+            if token == '!':
+                if not stack:
+                    raise ValueError(f"Не хватает операндов для оператора {token}")
+                stack.append(self.negate(stack.pop()))
+            elif token in OPERATIONS:
+                if len(stack) < 2:
+                    raise ValueError(f"Не хватает операндов для оператора {token}")
+                operand2 = stack.pop()
+                operand1 = stack.pop()
+                stack.append(self.apply(token, operand1, operand2))
+            elif token.isalnum():
+                if token not in self._position:
+                    raise ValueError(f"Неизвестная переменная: {token}")
+                stack.append(self.var(token))
+        if len(stack) != 1:
+            raise ValueError("Некорректное логическое выражение")
+        return stack[0]
+
+    def size(self, roots: List[int]) -> int:
+        """Число нетерминальных узлов, достижимых из roots."""
+        seen = set()
+        stack = [root for root in roots if root > TRUE]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack += [child for child in (self._low[node], self._high[node]) if child > TRUE]
+        return len(seen)
+
+    def count(self, u: int) -> int:
+        """Число наборов всех переменных order, на которых функция u истинна."""
+        counts = {FALSE: 0, TRUE: 1}
+
+        def walk(node):
+            if node not in counts:
+                level, low, high = self._level[node], self._low[node], self._high[node]
+                # Каждая пропущенная между уровнями переменная удваивает число наборов
+                counts[node] = (walk(low) << (self._level[low] - level - 1)) + \
+                               (walk(high) << (self._level[high] - level - 1))
+            return counts[node]
+
+        return walk(u) << self._level[u]
+
+    def iter_rows(self, u: int, row_variables: List[str]) -> Iterator[int]:
+        """Номера строк таблицы истинности, где функция u истинна; строки нумеруются по row_variables
+        (первая переменная – старший бит). Перебираются только пути к TRUE, поэтому время
+        пропорционально числу найденных строк. Если order совпадает с row_variables,
+        номера идут по возрастанию."""
+        terminal_level = len(self.order)
+        bits = [1 << (len(row_variables) - 1 - row_variables.index(variable)) for variable in self.order]
+
+        def walk(node, level, row):
+            if node == FALSE:
+                return
+            if level == terminal_level:
+                yield row
+                return
+            low, high = self._split(node, level)
+            yield from walk(low, level + 1, row)
+            yield from walk(high, level + 1, row | bits[level])
+
+        yield from walk(u, 0, 0)
+
+    def truth_vector(self, u: int) -> int:
+        """Столбец значений u как целое из 2^n бит: строка 0 – старший бит, строки нумеруются по order.
+        Значения подграфов запоминаются, поэтому общие подграфы не разворачиваются повторно."""
+        terminal_level = len(self.order)
+        vectors = {}
+
+        def vector(node, level):
+            rows = 1 << (terminal_level - level)
+            if node == FALSE:
+                return 0
+            if node == TRUE:
+                return (1 << rows) - 1
+            key = (node, level)
+            if key not in vectors:
+                low, high = self._split(node, level)
+                vectors[key] = vector(low, level + 1) << (rows // 2) | vector(high, level + 1)
+            return vectors[key]
+
+        return vector(u, 0)
+
+    def transfer(self, u: int, other: 'BDD') -> int:
+        """Переносит функцию u в диаграмму other (с другим порядком переменных)."""
+        nodes = {FALSE: FALSE, TRUE: TRUE}
+
+        def walk(node):
+            if node not in nodes:
+                variable = other.var(self.order[self._level[node]])
+                nodes[node] = other.ite(variable, walk(self._high[node]), walk(self._low[node]))
+            return nodes[node]
+
+        return walk(u)
+
+    def _swap(self, level: int):
+        """Меняет местами переменные уровней level и level + 1 на месте. Номера узлов сохраняются,
+        и каждый узел представляет ту же функцию, поэтому корни остаются верными. Узлы, на которые
+        больше нет ссылок, сразу удаляются, так что число живых узлов известно без обхода;
+        корни должны быть защищены _protect(). Кеш операций мог ссылаться на удаленные узлы
+        и очищается."""
+        upper = list(self._level_nodes[level])
+        lower = list(self._level_nodes[level + 1])
+        for node in upper + lower:
+            del self._unique[(self._level[node], self._low[node], self._high[node])]
+
+        # Узлы верхней переменной, зависящие от нижней: f = x ? f1 : f0, f0 = y ? f01 : f00 и т. д.
+        cofactors = {}
+        for node in upper:
+            low, high = self._low[node], self._high[node]
+            if self._level[low] == level + 1 or self._level[high] == level + 1:
+                cofactors[node] = self._split(low, level + 1) + self._split(high, level + 1)
+
+        self._level_nodes[level], self._level_nodes[level + 1] = set(), set()
+        upper_variable, lower_variable = self.order[level], self.order[level + 1]
+        self.order[level], self.order[level + 1] = lower_variable, upper_variable
+        self._position[lower_variable], self._position[upper_variable] = level, level + 1
+
+        for node in lower:
+            self._level[node] = level
+            self._register(node)
+        for node in upper:
+            if node not in cofactors:
+                self._level[node] = level + 1
+                self._register(node)
+        # f = y ? (x ? f11 : f01) : (x ? f10 : f00)
+        for node, (f00, f01, f10, f11) in cofactors.items():
+            old_low, old_high = self._low[node], self._high[node]
+            self._low[node] = self.mk(level + 1, f00, f10)
+            self._high[node] = self.mk(level + 1, f01, f11)
+            self._refs[self._low[node]] += 1
+            self._refs[self._high[node]] += 1
+            self._level[node] = level
+            self._register(node)
+            # Бывшие потомки могли остаться без ссылок
+            self._release(old_low)
+            self._release(old_high)
+        self._computed.clear()
+
+    def collect(self, roots: List[int]) -> List[int]:
+        """Оставляет только узлы, достижимые из roots. Номера узлов меняются, поэтому
+        возвращаются новые номера корней, а кеш операций очищается."""
+        old_level, old_low, old_high = self._level, self._low, self._high
+        self._reset()
+        nodes = {FALSE: FALSE, TRUE: TRUE}
+
+        def copy(node):
+            if node not in nodes:
+                nodes[node] = self.mk(old_level[node], copy(old_low[node]), copy(old_high[node]))
+            return nodes[node]
+
+        return [copy(root) for root in roots]
+
+    def sift(self, roots: List[int]) -> List[int]:
+        """Перестановка переменных просеиванием (sifting, Rudell): каждая переменная, начиная с самых
+        населенных уровней, проводится соседними перестановками через все позиции и остается там,
+        где диаграмма меньше всего. Возвращает новые номера корней."""
+        roots = self._protect(self.collect(roots))
+        for variable in sorted(self.order, key=lambda name: -len(self._level_nodes[self._position[name]])):
+            best_size, best_level = self._live, self._position[variable]
+            for step in (1, -1):
+                # Сначала вниз до последнего уровня, затем вверх до первого
+                while 0 <= self._position[variable] + step < len(self.order):
+                    self._swap(min(self._position[variable], self._position[variable] + step))
+                    if self._live < best_size:
+                        best_size, best_level = self._live, self._position[variable]
+            while self._position[variable] < best_level:
+                self._swap(self._position[variable])
+            roots = self._protect(self.collect(roots))
+        return roots
+
+    def _protect(self, roots: List[int]) -> List[int]:
+        """Корни считаются внешними ссылками, чтобы swap не удалил их."""
+        for root in roots:
+            self._refs[root] += 1
+        return roots
+
+
+class ExpressionBDD:
+    """Логическое выражение в виде ROBDD. Строки таблицы истинности нумеруются по variables
+    (первая переменная – старший бит, как в VariableManager); порядок переменных в самой
+    диаграмме может меняться sift(). Все результаты получаются обходом диаграммы,
+    без перебора 2^n строк."""
+
+    def __init__(self, rpn: List[str], variables: List[str]):
+        self.variables = list(variables)
+        self.manager = BDD(self.variables)
+        self.root = self.manager.from_rpn(rpn)
+
+    def is_satisfiable(self) -> bool:
+        return self.root != FALSE
+
+    def satisfying_assignment(self) -> Optional[Dict[str, bool]]:
+        """Один выполняющий набор (непроверенные переменные – False) или None."""
+        if self.root == FALSE:
+            return None
+        assignment = dict.fromkeys(self.variables, False)
+        node = self.root
+        while node > TRUE:
+            variable = self.manager.order[self.manager._level[node]]
+            if self.manager._low[node] != FALSE:
+                node = self.manager._low[node]
+            else:
+                assignment[variable] = True
+                node = self.manager._high[node]
+        return assignment
+
+    def count_models(self) -> int:
+        return self.manager.count(self.root)
+
+    def iter_models(self) -> Iterator[int]:
+        """Номера строк, на которых выражение истинно (по возрастанию, пока порядок не изменен sift())."""
+        return self.manager.iter_rows(self.root, self.variables)
+
+    def iter_pdnf(self) -> Iterator[str]:
+        """Конституенты единицы СДНФ в виде "a & !b & c"."""
+        for row in self.iter_models():
+            literals = []
+            for idx, variable in enumerate(self.variables):
+                is_set = row >> (len(self.variables) - 1 - idx) & 1
+                literals.append(variable if is_set else f"!{variable}")
+            yield " & ".join(literals)
+
+    def generate_pdnf(self) -> str:
+        return " | ".join(f"({clause})" for clause in self.iter_pdnf())
+
+    def to_numeric_form_pdnf(self) -> str:
+        rows = self.iter_models() if self.manager.order == self.variables else sorted(self.iter_models())
+        return f"( {' , '.join(str(row) for row in rows)} ) |"
+
+    def to_index_form(self) -> int:
+        if self.manager.order == self.variables:
+            return self.manager.truth_vector(self.root)
+        ordered = BDD(self.variables)
+        return ordered.truth_vector(self.manager.transfer(self.root, ordered))
+
+    def size(self) -> int:
+        return self.manager.size([self.root])
+
+    def sift(self) -> int:
+        """Уменьшает диаграмму перестановкой переменных, возвращает новое число узлов."""
+        self.root, = self.manager.sift([self.root])
+        return self.size()
@@ -1,32 +1,122 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List
 from variable_manager import VariableManager
 from rpn_converter import ReversePolishNotationConverter
-from truth_table_generator import TruthTableGenerator
+from truth_table_generator import TruthTableGenerator, BLOCK_BITS
+from rpn_compiler import RPNCompiler
+from bdd import ExpressionBDD
 
 class LogicalExpression:
-    def __init__(self, expression: str):
+    def __init__(self, expression: str, lazy: bool = None):
+        self.lazy = lazy
+        self.set_expression(expression)
+
+    def set_expression(self, expression: str):
+        """Задает выражение: разбор повторяется, сохраненная таблица истинности сбрасывается."""
         self.expression = expression
-        self.variable_manager = VariableManager(expression)
+        self.variable_manager = VariableManager(expression, self.lazy)
         self.rpn_converter = ReversePolishNotationConverter(expression)
         self.rpn = self.rpn_converter.to_reverse_polish_notation()
-        self.truth_table_generator = TruthTableGenerator(self.variable_manager.get_variable_map(), self.rpn)
+        self.compiler = RPNCompiler(self.rpn, self.variable_manager.get_variable_map())
+        self.truth_table_generator = TruthTableGenerator(self.variable_manager.get_variable_map(), self.rpn, self.compiler)
+        self.invalidate()
+
+    def invalidate(self):
+        """Сбрасывает сохраненную таблицу истинности; следующий запрос вычислит ее заново."""
+        self._truth_table_masks = None
+        self._truth_table = None
+        self._bdd = None
+
+    def to_bdd(self) -> ExpressionBDD:
+        """ROBDD выражения, построенная прямо по ОПЗ без таблицы истинности, поэтому подходит для
+        формул с десятками переменных. Сохраняется до invalidate()."""
+        if self._bdd is None:
+            self._bdd = ExpressionBDD(self.rpn, list(self.variable_manager.get_variable_map()))
+        return self._bdd
+
+    def evaluate(self, assignment: Dict[str, bool]) -> bool:
+        """Значение выражения на наборе {переменная: значение} через скомпилированную ОПЗ."""
+        return self.compiler.evaluate(assignment)
+
+    def truth_table_masks(self) -> Dict[str, int]:
+        """Таблица истинности в компактном виде {столбец: маска}, бит i маски – строка i.
+        Вычисляется один раз и общая для всех производных форм (СДНФ, СКНФ, числовых, индексной).
+        В ленивом режиме не сохраняется, чтобы память не росла с числом строк."""
+        if self._truth_table_masks is not None:
+            return self._truth_table_masks
+        _, _, masks = next(self._evaluate_blocks(self.variable_manager.count_variables()))
+        if not self.variable_manager.lazy:
+            self._truth_table_masks = masks
+        return masks
+
+    def result_mask(self) -> int:
+        return self.truth_table_masks()[self.expression]
 
     def generate_truth_table(self) -> Dict[str, List[bool]]:
-        truth_table = self.variable_manager.get_variable_map().copy()
-        final_result, intermediates = self.truth_table_generator.evaluate_expression()
-        
-        if intermediates:
-            last_key = list(intermediates.keys())[-1]
-            del intermediates[last_key]
-        
-        truth_table.update(intermediates)
-        truth_table[self.expression] = final_result
-        return truth_table
+        if self._truth_table is not None:
+            return dict(self._truth_table)
 
-    def print_truth_table(self):
-        truth_table = self.generate_truth_table()
         num_combinations = 2 ** self.variable_manager.count_variables()
-        headers = list(truth_table.keys())
+        variable_map = self.variable_manager.get_variable_map()
+        truth_table = {}
+        for header, mask in self.truth_table_masks().items():
+            if header in variable_map:
+                truth_table[header] = variable_map[header]
+            else:
+                truth_table[header] = TruthTableGenerator.mask_to_list(mask, num_combinations)
+
+        if not self.variable_manager.lazy:
+            self._truth_table = truth_table
+        return dict(truth_table)
+
+    def truth_table_headers(self) -> List[str]:
+        """Столбцы таблицы истинности в порядке generate_truth_table."""
+        self.compiler.mask_function()
+        headers = list(self.variable_manager.get_variable_map()) + self.compiler.step_names[:-1]
+        return list(dict.fromkeys(headers + [self.expression]))
+
+    def iter_truth_table_blocks(self, block_bits: int = BLOCK_BITS) -> Iterator[tuple]:
+        """Потоковая таблица истинности: блоки по 2^block_bits строк в виде
+        (номер первой строки, число строк, {столбец: маска}), бит i маски – строка start + i.
+        В ленивом режиме таблица целиком не строится, поэтому подходит и для 30+ переменных;
+        иначе блоки нарезаются из сохраненной таблицы truth_table_masks()."""
+        if self.variable_manager.lazy:
+            yield from self._evaluate_blocks(block_bits)
+            return
+        masks = self.truth_table_masks()
+        num_combinations = 2 ** self.variable_manager.count_variables()
+        count = min(1 << block_bits, num_combinations)
+        for start in range(0, num_combinations, count):
+            yield start, count, {header: mask >> start & ((1 << count) - 1) for header, mask in masks.items()}
+
+    def _evaluate_blocks(self, block_bits: int) -> Iterator[tuple]:
+        for start, count, columns, final_result, intermediates in self.truth_table_generator.iter_blocks(block_bits):
+            if intermediates:
+                del intermediates[list(intermediates)[-1]]
+            columns.update(intermediates)
+            columns[self.expression] = final_result
+            yield start, count, columns
+
+    def iter_truth_table_rows(self, block_bits: int = BLOCK_BITS) -> Iterator[List[bool]]:
+        """Лениво выдает строки таблицы: значения в порядке truth_table_headers()."""
+        headers = self.truth_table_headers()
+        for _, count, columns in self.iter_truth_table_blocks(block_bits):
+            masks = [columns[header] for header in headers]
+            for i in range(count):
+                yield [bool(mask >> i & 1) for mask in masks]
+
+    def iter_result_rows(self, value: bool = True, block_bits: int = BLOCK_BITS) -> Iterator[int]:
+        """Лениво выдает номера строк, на которых выражение равно value."""
+        for start, count, columns in self.iter_truth_table_blocks(block_bits):
+            mask = columns[self.expression]
+            if not value:
+                mask ^= (1 << count) - 1
+            while mask:
+                lowest = mask & -mask
+                yield start + lowest.bit_length() - 1
+                mask ^= lowest
+
+    def print_truth_table(self):
+        headers = self.truth_table_headers()
         
         col_widths = {header: max(len(header), 3) for header in headers}
         
@@ -34,63 +124,54 @@ class LogicalExpression:
         print(header_row)
         print("-" * len(header_row))
         
-        for i in range(num_combinations):
+        for values in self.iter_truth_table_rows():
             row = []
-            for header in headers:
-                val = '1' if truth_table[header][i] else '0'
+            for header, value in zip(headers, values):
+                val = '1' if value else '0'
                 row.append(val.ljust(col_widths[header]))
             print(" | ".join(row))
 
     def generate_pdnf(self):
         result = []
-        expression_result = self.generate_truth_table()[self.expression]
-
-        for i in range(len(expression_result)):
-            if expression_result[i]:
-                clause = []
-                for variable in self.variable_manager.get_variable_map().keys():
-                    clause.append(variable if self.variable_manager.get_variable_map()[variable][i] else f"!{variable}")
-                result.append(" & ".join(clause))
+        for i in self.iter_result_rows(True):
+            result.append(" & ".join(self._row_literals(i, negate_set=False)))
 
         return LogicalExpression(" | ".join(f"({clause})" for clause in result))
 
     def generate_pcnf(self):
         result = []
-        expression_result = self.generate_truth_table()[self.expression]
-
-        for i in range(len(expression_result)):
-            if not expression_result[i]:
-                clause = []
-                for variable in self.variable_manager.get_variable_map().keys():
-                    clause.append(f"!{variable}" if self.variable_manager.get_variable_map()[variable][i] else variable)
-                result.append(" | ".join(clause))
+        for i in self.iter_result_rows(False):
+            result.append(" | ".join(self._row_literals(i, negate_set=True)))
 
         return LogicalExpression(" & ".join(f"({clause})" for clause in result))
 
-    def to_numeric_form_pdnf(self) -> str:
-        result = []
-        expression_result = self.generate_truth_table()[self.expression]
-
-        for i in range(len(expression_result)):
-            if expression_result[i]:
-                result.append(str(i))
+    def _row_literals(self, row: int, negate_set: bool) -> List[str]:
+        """Литералы переменных для строки row: значение переменной – бит номера строки,
+        первая переменная – старший бит (как в VariableManager)."""
+        variables = list(self.variable_manager.get_variable_map())
+        literals = []
+        for idx, variable in enumerate(variables):
+            is_set = row >> (len(variables) - 1 - idx) & 1
+            literals.append(f"!{variable}" if is_set == negate_set else variable)
+        return literals
 
+    def to_numeric_form_pdnf(self) -> str:
+        result = [str(i) for i in self.iter_result_rows(True)]
         return f"( {' , '.join(result)} ) |"
 
     def to_numeric_form_pcnf(self) -> str:
-        result = []
-        expression_result = self.generate_truth_table()[self.expression]
-
-        for i in range(len(expression_result)):
-            if not expression_result[i]:
-                result.append(str(i))
-
+        result = [str(i) for i in self.iter_result_rows(False)]
         return f"( {' , '.join(result)} ) &"
 
     def to_index_form(self) -> int:
-        expression_result = self.generate_truth_table()[self.expression]
-        binary_string = ''.join('1' if value else '0' for value in expression_result)
-        return int(binary_string, 2)
+        # Строка 0 – старший бит индекса; блоки переводятся в байты по мере вычисления
+        packed = bytearray()
+        for _, count, columns in self.iter_truth_table_blocks():
+            bits = format(columns[self.expression], f'0{count}b')[::-1]
+            if count % 8:
+                return int(bits, 2)  # таблица меньше байта – это единственный блок
+            packed += int(bits, 2).to_bytes(count // 8, 'big')
+        return int.from_bytes(packed, 'big')
 
     def get_expression(self) -> str:
         return self.expression
\ No newline at end of file
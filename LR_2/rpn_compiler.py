@@ -0,0 +1,87 @@
+from typing import Callable, List
+
+# Шаблоны операторов для вычисления одной строки (значения – bool или 0/1)
+ROW_OPERATORS = {
+    '!': 'not {0}',
+    '&': '{0} and {1}',
+    '|': '{0} or {1}',
+    '->': 'not {0} or {1}',
+    '~': '{0} == {1}',
+}
+
+# Шаблоны операторов для битовых масок (бит i – строка i, ALL_ROWS – маска из всех строк)
+ALL_ROWS = '_all_rows'
+MASK_OPERATORS = {
+    '!': ALL_ROWS + ' ^ {0}',
+    '&': '{0} & {1}',
+    '|': '{0} | {1}',
+    '->': ALL_ROWS + ' ^ {0} | {1}',
+    '~': ALL_ROWS + ' ^ {0} ^ {1}',
+}
+
+
+class RPNCompiler:
+    """Компилирует обратную польскую запись в функцию Python.
+    Токены разбираются один раз: по ОПЗ генерируется исходный код функции, где каждый шаг –
+    отдельное присваивание, и код компилируется через compile(). Переменные передаются
+    позиционно в порядке variables. Скомпилированные функции кешируются в объекте.
+    """
+
+    def __init__(self, rpn: List[str], variables):
+        self.rpn = rpn
+        self.variables = list(variables)
+        # Шаги одинаковы для обеих функций: по одному на каждый оператор ОПЗ
+        self.step_names = [f"step_{number} ({token})"
+                           for number, token in enumerate((token for token in rpn if token in ROW_OPERATORS), 1)]
+        self._row_function = None
+        self._mask_function = None
+
+    def row_function(self) -> Callable[..., bool]:
+        """Функция f(*values) -> значение выражения на одном наборе переменных."""
+        if self._row_function is None:
+            self._row_function = self._compile(ROW_OPERATORS, [], False)
+        return self._row_function
+
+    def mask_function(self) -> Callable[..., tuple]:
+        """Функция f(all_rows, *masks) -> (маски шагов в порядке step_names..., итоговая маска)."""
+        if self._mask_function is None:
+            self._mask_function = self._compile(MASK_OPERATORS, [ALL_ROWS], True)
+        return self._mask_function
+
+    def evaluate(self, assignment) -> bool:
+        """Значение выражения для словаря {переменная: значение}."""
+        return self.row_function()(*(assignment[variable] for variable in self.variables))
+
+    def _compile(self, operators, extra_params: List[str], return_steps: bool):
+        # Имена переменных могут быть цифрами, поэтому параметры называются _v0, _v1, ...
+        params = {variable: f"_v{index}" for index, variable in enumerate(self.variables)}
+        lines = []
+        steps = 0
+        stack = []
+        for token in self.rpn:
+            if token in operators:
+                arity = 1 if token == '!' else 2
+                if len(stack) < arity:
+                    raise ValueError(f"Не хватает операндов для оператора {token}")
+                operands = stack[-arity:]
+                del stack[-arity:]
+                steps += 1
+                step = f"_s{steps}"
+                lines.append(f"    {step} = {operators[token].format(*operands)}")
+                stack.append(step)
+            elif token in params:
+                stack.append(params[token])
+            elif token.isalnum():
+                raise ValueError(f"Неизвестная переменная: {token}")
+        if len(stack) != 1:
+            raise ValueError("Некорректное логическое выражение")
+
+        if return_steps:
+            result = "(" + ", ".join([f"_s{n}" for n in range(1, steps + 1)] + [stack[0]]) + ",)"
+        else:
+            result = stack[0]
+        source = "\n".join([f"def _compiled({', '.join(extra_params + list(params.values()))}):",
+                            *lines, f"    return {result}"])
+        namespace = {}
+        exec(compile(source, '<rpn>', 'exec'), namespace)
+        return namespace['_compiled']
@@ -1,5 +1,8 @@
 import unittest
 from logical_expression import TruthTableGenerator, VariableManager, LogicalExpression, ReversePolishNotationConverter
+from rpn_compiler import RPNCompiler
+from variable_manager import VariableColumn
+from bdd import BDD, ExpressionBDD, FALSE, TRUE
 
 
 class TestReversePolishNotationConverter(unittest.TestCase):
@@ -19,6 +22,10 @@ class TestReversePolishNotationConverter(unittest.TestCase):
         converter = ReversePolishNotationConverter("a & b | c")
         self.assertEqual(converter.to_reverse_polish_notation(), ['a', 'b', '&', 'c', '|'])
 
+    def test_double_negation(self):
+        self.assertEqual(ReversePolishNotationConverter("!!a").to_reverse_polish_notation(), ['a', '!', '!'])
+        self.assertEqual(ReversePolishNotationConverter("a & !!b").to_reverse_polish_notation(), ['a', 'b', '!', '!', '&'])
+
 
 class TestVariableManager(unittest.TestCase):
     def test_extract_variables(self):
@@ -92,5 +99,187 @@ class TestLogicalExpression(unittest.TestCase):
         self.assertEqual(index_form, 1) 
 
 
+class TestBitSlicedTruthTable(unittest.TestCase):
+    def test_variable_mask(self):
+        # Строки 0..7: a – старший бит номера строки, c – младший
+        self.assertEqual(VariableManager.variable_mask(0, 3), 0b11110000)
+        self.assertEqual(VariableManager.variable_mask(1, 3), 0b11001100)
+        self.assertEqual(VariableManager.variable_mask(2, 3), 0b10101010)
+
+    def test_evaluate_masks(self):
+        manager = VariableManager("a -> b ~ c")
+        generator = TruthTableGenerator(manager.get_variable_map(), ['a', 'b', '->', 'c', '~'])
+        final_mask, intermediates = generator.evaluate_masks()
+        self.assertEqual(intermediates['step_1 (->)'], 0b11001111)
+        self.assertEqual(final_mask, 0b10011010)
+
+    def test_matches_row_by_row(self):
+        expression = LogicalExpression("!(a -> (b ~ !c)) | d & a")
+        truth_table = expression.generate_truth_table()
+        for i in range(16):
+            a, b, c, d = (bool(i >> shift & 1) for shift in (3, 2, 1, 0))
+            expected = not ((not a) or (b == (not c))) or (d and a)
+            self.assertEqual(truth_table[expression.expression][i], expected)
+
+
+class TestRPNCompiler(unittest.TestCase):
+    def test_row_function(self):
+        compiler = RPNCompiler(['a', 'b', '->', 'c', '~'], ['a', 'b', 'c'])
+        self.assertTrue(compiler.evaluate({'a': True, 'b': False, 'c': False}))
+        self.assertFalse(compiler.evaluate({'a': False, 'b': False, 'c': False}))
+
+    def test_mask_function(self):
+        compiler = RPNCompiler(['a', '!', 'b', '&'], ['a', 'b'])
+        self.assertEqual(compiler.mask_function()(0b1111, 0b1100, 0b1010), (0b0011, 0b0010, 0b0010))
+        self.assertEqual(compiler.step_names, ['step_1 (!)', 'step_2 (&)'])
+
+    def test_step_names_before_compile(self):
+        compiler = RPNCompiler(['a', '!', 'b', '&'], ['a', 'b'])
+        self.assertEqual(compiler.step_names, ['step_1 (!)', 'step_2 (&)'])
+        compiler.row_function()
+        self.assertEqual(compiler.step_names, ['step_1 (!)', 'step_2 (&)'])
+
+    def test_single_variable(self):
+        compiler = RPNCompiler(['a'], ['a'])
+        self.assertEqual(compiler.mask_function()(0b11, 0b10), (0b10,))
+
+    def test_invalid_rpn(self):
+        with self.assertRaises(ValueError):
+            RPNCompiler(['a', '&'], ['a']).row_function()
+        with self.assertRaises(ValueError):
+            RPNCompiler(['a', 'b', '|'], ['a']).row_function()
+
+    def test_logical_expression_evaluate(self):
+        expression = LogicalExpression("a -> b")
+        self.assertFalse(expression.evaluate({'a': True, 'b': False}))
+        self.assertTrue(expression.evaluate({'a': False, 'b': False}))
+
+
+class TestStreamingTruthTable(unittest.TestCase):
+    def test_variable_column(self):
+        column = VariableColumn(1, 3)
+        self.assertEqual(list(column), [False, False, True, True, False, False, True, True])
+        self.assertEqual(column.block_mask(4, 4), 0b1100)
+        self.assertEqual(VariableColumn(0, 3).block_mask(4, 2), 0b11)
+
+    def test_lazy_variable_manager(self):
+        manager = VariableManager("a & b", lazy=True)
+        self.assertIsInstance(manager.variable_map['a'], VariableColumn)
+        self.assertEqual(list(manager.variable_map['b']), [False, True, False, True])
+
+    def test_blocks_match_full_table(self):
+        expression = LogicalExpression("(a -> b) & !c | d")
+        truth_table = expression.generate_truth_table()
+        rows = list(expression.iter_truth_table_rows(block_bits=2))
+        self.assertEqual(expression.truth_table_headers(), list(truth_table))
+        self.assertEqual(rows, [list(row) for row in zip(*truth_table.values())])
+
+    def test_lazy_forms(self):
+        eager = LogicalExpression("(a ~ b) | c & !d -> e")
+        lazy = LogicalExpression("(a ~ b) | c & !d -> e", lazy=True)
+        self.assertEqual(lazy.to_numeric_form_pdnf(), eager.to_numeric_form_pdnf())
+        self.assertEqual(lazy.to_numeric_form_pcnf(), eager.to_numeric_form_pcnf())
+        self.assertEqual(lazy.to_index_form(), eager.to_index_form())
+        self.assertEqual(lazy.generate_truth_table()[lazy.expression], eager.generate_truth_table()[eager.expression])
+
+    def test_wide_expression_is_lazy(self):
+        expression = LogicalExpression(" & ".join("abcdefghijklmnopqrstuvw"))
+        self.assertTrue(expression.variable_manager.lazy)
+        self.assertEqual(expression.to_numeric_form_pdnf(), f"( {2 ** 23 - 1} ) |")
+
+
+class TestTruthTableCache(unittest.TestCase):
+    def test_masks_are_computed_once(self):
+        expression = LogicalExpression("a -> b")
+        masks = expression.truth_table_masks()
+        self.assertIs(expression.truth_table_masks(), masks)
+        self.assertEqual(expression.result_mask(), 0b1011)
+        expression.to_numeric_form_pdnf()
+        expression.generate_pcnf()
+        self.assertIs(expression.truth_table_masks(), masks)
+
+    def test_invalidate(self):
+        expression = LogicalExpression("a & b")
+        masks = expression.truth_table_masks()
+        expression.invalidate()
+        self.assertIsNot(expression.truth_table_masks(), masks)
+        self.assertEqual(expression.truth_table_masks(), masks)
+
+    def test_set_expression(self):
+        expression = LogicalExpression("a & b")
+        self.assertEqual(expression.to_index_form(), 1)
+        expression.set_expression("a | b")
+        self.assertEqual(expression.to_index_form(), 7)
+        self.assertEqual(expression.to_numeric_form_pcnf(), "( 0 ) &")
+
+    def test_returned_table_is_a_copy(self):
+        expression = LogicalExpression("a & b")
+        expression.generate_truth_table()['extra'] = []
+        self.assertNotIn('extra', expression.generate_truth_table())
+
+    def test_forms_from_cache(self):
+        expression = LogicalExpression("!(a ~ b) & c")
+        self.assertEqual(expression.generate_pdnf().get_expression(), "(!a & b & c) | (a & !b & c)")
+        self.assertEqual(expression.to_numeric_form_pdnf(), "( 3 , 5 ) |")
+
+
+class TestBDD(unittest.TestCase):
+    def test_matches_truth_table(self):
+        for text in ["a & b", "(a | b) & !c", "a -> b ~ c", "!(a -> (b ~ !c)) | d & a", "a ~ a", "a & !a"]:
+            expression = LogicalExpression(text)
+            bdd = expression.to_bdd()
+            self.assertEqual(bdd.count_models(), bin(expression.result_mask()).count('1'))
+            self.assertEqual(bdd.is_satisfiable(), expression.result_mask() != 0)
+            self.assertEqual(bdd.to_numeric_form_pdnf(), expression.to_numeric_form_pdnf())
+            self.assertEqual(bdd.to_index_form(), expression.to_index_form())
+
+    def test_unique_table(self):
+        manager = BDD(['a', 'b'])
+        first = manager.from_rpn(['a', 'b', '&'])
+        self.assertEqual(manager.from_rpn(['b', 'a', '&']), first)
+        self.assertEqual(manager.from_rpn(['a', 'a', '!', '|']), TRUE)
+        self.assertEqual(manager.from_rpn(['a', 'a', '!', '&']), FALSE)
+
+    def test_pdnf_and_assignment(self):
+        expression = LogicalExpression("!(a ~ b) & c")
+        bdd = expression.to_bdd()
+        self.assertEqual(bdd.generate_pdnf(), expression.generate_pdnf().get_expression())
+        self.assertTrue(expression.evaluate(bdd.satisfying_assignment()))
+        self.assertIsNone(LogicalExpression("a & !a").to_bdd().satisfying_assignment())
+
+    def test_sift(self):
+        # Пары (x & X) при порядке a b c d A B C D дают экспоненциальную диаграмму
+        expression = LogicalExpression("a & A | b & B | c & C | d & D")
+        bdd = ExpressionBDD(expression.rpn, list("abcdABCD"))
+        numeric_form, index_form = bdd.to_numeric_form_pdnf(), bdd.to_index_form()
+        self.assertEqual(bdd.size(), 30)
+        self.assertEqual(bdd.sift(), 8)
+        self.assertEqual(bdd.count_models(), bin(expression.result_mask()).count('1'))
+        self.assertEqual(bdd.to_numeric_form_pdnf(), numeric_form)
+        self.assertEqual(bdd.to_index_form(), index_form)
+
+    def test_wide_expression(self):
+        variables = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMN"
+        expression = LogicalExpression(" & ".join(f"({x} | {y})" for x, y in zip(variables, variables[1:])))
+        bdd = expression.to_bdd()
+        self.assertTrue(bdd.is_satisfiable())
+        # Наборы без двух нулей подряд: число Фибоначчи F(42)
+        self.assertEqual(bdd.count_models(), 267914296)
+        self.assertEqual(next(bdd.iter_models()), int("01" * 20, 2))
+
+    def test_invalid_rpn(self):
+        with self.assertRaises(ValueError):
+            BDD(['a']).from_rpn(['a', '&'])
+        with self.assertRaises(ValueError):
+            BDD(['a']).from_rpn(['a', 'b', '|'])
+
+    def test_cache_invalidation(self):
+        expression = LogicalExpression("a & b")
+        bdd = expression.to_bdd()
+        self.assertIs(expression.to_bdd(), bdd)
+        expression.set_expression("a | b")
+        self.assertEqual(expression.to_bdd().count_models(), 3)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
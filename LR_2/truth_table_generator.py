@@ -1,55 +1,74 @@
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
+from rpn_compiler import RPNCompiler
+from variable_manager import VariableColumn
+
+# Байты 0 и 1 в символы '0' и '1' для перевода столбца в маску через int(..., 2)
+BIT_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+# Строк в одном блоке при потоковом вычислении: 2^BLOCK_BITS
+BLOCK_BITS = 16
 
 class TruthTableGenerator:
-    def __init__(self, variable_map: Dict[str, List[bool]], rpn: List[str]):
+    """Вычисляет таблицу истинности по обратной польской записи.
+    Столбцы хранятся как битовые маски: бит i целого числа – значение в строке i.
+    Каждый оператор выполняется одной побитовой операцией сразу над всеми 2^n строками,
+    а не отдельно для каждой строки."""
+
+    def __init__(self, variable_map: Dict[str, List[bool]], rpn: List[str], compiler: RPNCompiler = None):
         self.variable_map = variable_map
         self.rpn = rpn
+        # ОПЗ компилируется один раз, разбор токенов не повторяется при каждом вычислении
+        self.compiler = compiler or RPNCompiler(rpn, variable_map)
 
     def evaluate_expression(self) -> Tuple[List[bool], Dict[str, List[bool]]]:
-        intermediate_results = {}
-        final_result = []
         num_combinations = 2 ** len(self.variable_map)
-        
-        step_number = 1
-        for token in self.rpn:
-            if self.is_operator(token):
-                op_name = f"step_{step_number} ({token})"
-                intermediate_results[op_name] = [None] * num_combinations
-                step_number += 1
-
-        for i in range(num_combinations):
-            stack = []
-            step_number = 1
-            
-            for token in self.rpn:
-                if self.is_operand(token):
-                    stack.append(self.variable_map[token][i])
-                elif self.is_operator(token):
-                    op_name = f"step_{step_number} ({token})"
-                    
-                    if token == '!':
-                        operand = stack.pop()
-                        result = not operand
-                    else:
-                        operand2 = stack.pop()
-                        operand1 = stack.pop()
-                        if token == '&':
-                            result = operand1 and operand2
-                        elif token == '|':
-                            result = operand1 or operand2
-                        elif token == '->':
-                            result = (not operand1) or operand2
-                        elif token == '~':
-                            result = operand1 == operand2
-                    
-                    intermediate_results[op_name][i] = result
-                    stack.append(result)
-                    step_number += 1
-            
-            final_result.append(stack.pop())
+        final_mask, intermediate_masks = self.evaluate_masks()
+        intermediate_results = {name: self.mask_to_list(mask, num_combinations)
+                                for name, mask in intermediate_masks.items()}
+        return self.mask_to_list(final_mask, num_combinations), intermediate_results
 
+    def evaluate_masks(self) -> Tuple[int, Dict[str, int]]:
+        """Возвращает итоговый столбец и столбцы промежуточных шагов в виде битовых масок."""
+        _, final_result, intermediate_results = self.evaluate_block(0, 2 ** len(self.variable_map))
         return final_result, intermediate_results
 
+    def evaluate_block(self, start: int, count: int) -> Tuple[Dict[str, int], int, Dict[str, int]]:
+        """Вычисляет строки start..start + count - 1 (count – степень двойки, start кратен count).
+        Возвращает маски переменных, итоговую маску и маски шагов; бит i – строка start + i."""
+        all_rows = (1 << count) - 1
+        columns = {variable: self.column_block_mask(self.variable_map[variable], start, count)
+                   for variable in self.compiler.variables}
+
+        *steps, final_result = self.compiler.mask_function()(all_rows, *columns.values())
+        return columns, final_result, dict(zip(self.compiler.step_names, steps))
+
+    def iter_blocks(self, block_bits: int = BLOCK_BITS) -> Iterator[Tuple[int, int, Dict[str, int], int, Dict[str, int]]]:
+        """Лениво вычисляет таблицу блоками по 2^block_bits строк (таблица меньше блока считается одним блоком).
+        Выдает (номер первой строки, число строк, маски переменных, итоговая маска, маски шагов);
+        в памяти одновременно только один блок."""
+        num_combinations = 2 ** len(self.variable_map)
+        count = min(1 << block_bits, num_combinations)
+        for start in range(0, num_combinations, count):
+            yield (start, count) + self.evaluate_block(start, count)
+
+    @staticmethod
+    def column_block_mask(column, start: int, count: int) -> int:
+        if isinstance(column, VariableColumn):
+            return column.block_mask(start, count)
+        if start == 0 and count == len(column):
+            return TruthTableGenerator.list_to_mask(column)
+        return TruthTableGenerator.list_to_mask(column[start:start + count])
+
+    @staticmethod
+    def list_to_mask(values: List[bool]) -> int:
+        """Столбец значений в битовую маску (строка 0 – младший бит)."""
+        bits = bytes(map(bool, reversed(values))).translate(BIT_DIGITS)
+        return int(bits, 2) if bits else 0
+
+    @staticmethod
+    def mask_to_list(mask: int, num_combinations: int) -> List[bool]:
+        bits = format(mask, f'0{num_combinations}b')[::-1]
+        return [bit == '1' for bit in bits]
+
     def is_operator(self, token: str) -> bool:
         return token in {'!', '&', '|', '~', '->'}
 
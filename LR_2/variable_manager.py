@@ -1,9 +1,15 @@
+from collections.abc import Sequence
 from typing import Dict, List
 
+# Больше переменных – столбцы не строятся списками, а вычисляются по номеру строки
+MAX_MATERIALIZED_VARIABLES = 20
+
 class VariableManager:
-    def __init__(self, expression: str):
+    def __init__(self, expression: str, lazy: bool = None):
         self.expression = expression
         self.variable_map = {}
+        # None – ленивый режим включается сам, если переменных больше MAX_MATERIALIZED_VARIABLES
+        self.lazy = lazy
         self.initialize_variable_map()
 
     def extract_variables(self):
@@ -16,13 +22,29 @@ class VariableManager:
         num_vars = self.count_variables() 
         num_combinations = 2 ** num_vars   # Количество комбинаций
 
-        for var in self.variable_map:
-            self.variable_map[var] = []
-
-        for i in range(num_combinations):
-            bin_str = format(i, f'0{num_vars}b')
+        if self.lazy is None:
+            self.lazy = num_vars > MAX_MATERIALIZED_VARIABLES
+        if self.lazy:
             for idx, var in enumerate(self.variable_map):
-                self.variable_map[var].append(bin_str[idx] == '1')
+                self.variable_map[var] = VariableColumn(idx, num_vars)
+            return
+
+        for idx, var in enumerate(self.variable_map):
+            bits = format(self.variable_mask(idx, num_vars), f'0{num_combinations}b')[::-1]
+            self.variable_map[var] = [bit == '1' for bit in bits]
+
+    @staticmethod
+    def variable_mask(index: int, num_vars: int) -> int:
+        """Столбец переменной с номером index в виде битовой маски (бит i – строка i).
+        Первая переменная – старший бит номера строки, поэтому столбец состоит из блоков
+        по 2^(num_vars - 1 - index) нулей и единиц; узор удваивается до 2^num_vars строк."""
+        half = 1 << (num_vars - 1 - index)
+        mask = ((1 << half) - 1) << half
+        length = half * 2
+        while length < 1 << num_vars:
+            mask |= mask << length
+            length *= 2
+        return mask
 
     def is_operand(self, token: str) -> bool:
         return token.isalnum()
@@ -31,4 +53,34 @@ class VariableManager:
         return len(self.variable_map)
 
     def get_variable_map(self) -> Dict[str, List[bool]]:
-        return self.variable_map
\ No newline at end of file
+        return self.variable_map
+
+
+class VariableColumn(Sequence):
+    """Столбец переменной в ленивом режиме: значения не хранятся, а вычисляются по номеру
+    строки, поэтому память не зависит от числа строк 2^num_vars."""
+
+    def __init__(self, index: int, num_vars: int):
+        self.index = index
+        self.num_vars = num_vars
+        self.shift = num_vars - 1 - index
+
+    def __len__(self):
+        return 2 ** self.num_vars
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("Номер строки вне таблицы истинности")
+        return bool(row >> self.shift & 1)
+
+    def block_mask(self, start: int, count: int) -> int:
+        """Маска строк start..start + count - 1; count – степень двойки, start кратен count."""
+        block_bits = count.bit_length() - 1
+        if self.shift >= block_bits:
+            # Внутри блока переменная не меняется
+            return (1 << count) - 1 if start >> self.shift & 1 else 0
+        return VariableManager.variable_mask(block_bits - 1 - self.shift, block_bits)
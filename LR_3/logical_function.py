@@ -2,27 +2,32 @@ from itertools import product, combinations
 from collections import defaultdict
 from typing import List
 
+from LR_2.rpn_converter import ReversePolishNotationConverter
+from LR_2.rpn_compiler import RPNCompiler
+
 
 class LogicalFunction:
     def __init__(self, variables, expression, truth_table):
         self.variables = sorted(variables)
         self.expression = expression
         self.truth_table = truth_table
+        self._compiler = None
         self.minterms = self._get_minterms()
         self.maxterms = self._get_maxterms()
     
     def _evaluate_expression(self, assignment):
         """Вычисление значения выражения при заданных значениях переменных"""
-        expr = self.expression
-        for var, val in assignment.items():
-            expr = expr.replace(var, str(val))
-        
-        expr = expr.replace('!', ' not ').replace('|', ' or ').replace('&', ' and ')
-        
         try:
-            return int(eval(expr))
-        except:
+            return int(self._get_compiler().evaluate(assignment))
+        except (KeyError, ValueError):
             raise ValueError("Неверное логическое выражение")
+
+    def _get_compiler(self) -> RPNCompiler:
+        """Выражение переводится в ОПЗ и компилируется один раз на объект"""
+        if self._compiler is None:
+            rpn = ReversePolishNotationConverter(self.expression).to_reverse_polish_notation()
+            self._compiler = RPNCompiler(rpn, self.variables)
+        return self._compiler
     
     def _get_minterms(self) -> List[List[int]]:
         """Возвращает список бинарных представлений минтермов."""
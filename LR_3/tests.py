@@ -30,6 +30,19 @@ class TestLogicalFunction(unittest.TestCase):
         self.assertEqual(lf._evaluate_expression({'A': 0, 'B': 1}), 0)
         self.assertEqual(lf._evaluate_expression({'A': 0, 'B': 0}), 0)
 
+    def test_evaluate_implication_and_equivalence(self):
+        """Тест вычисления импликации и эквивалентности через скомпилированную ОПЗ"""
+        lf = LogicalFunction(['A', 'B', 'C'], '(A -> B) ~ !C', {})
+        self.assertEqual(lf._evaluate_expression({'A': 1, 'B': 0, 'C': 1}), 1)
+        self.assertEqual(lf._evaluate_expression({'A': 0, 'B': 0, 'C': 1}), 0)
+        with self.assertRaises(ValueError):
+            lf._evaluate_expression({'A': 1, 'B': 0})
+
+    def test_double_negation(self):
+        """Тест двойного отрицания: '!' правоассоциативен"""
+        self.assertEqual(LogicalFunction(['A', 'B'], '!!A', {}).minterms, [[1, 0], [1, 1]])
+        self.assertEqual(LogicalFunction(['A', 'B'], 'A & !!B', {}).minterms, [[1, 1]])
+
     def test_minterm_to_binary(self):
         """Тест преобразования индекса минтерма в бинарное представление"""
         lf = LogicalFunction(['A', 'B', 'C'], 'A', {})
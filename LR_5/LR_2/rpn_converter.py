@@ -25,7 +25,8 @@ class ReversePolishNotationConverter:
                     result.append(stack.pop())
                 stack.pop()
             elif self.is_operator(operator):
-                while stack and self.get_priority(stack[-1]) >= self.get_priority(operator):
+                # Унарный '!' правоассоциативен: в '!!a' первый '!' ждет результата второго
+                while stack and operator != '!' and self.get_priority(stack[-1]) >= self.get_priority(operator):
                     result.append(stack.pop())
                 stack.append(operator)
         
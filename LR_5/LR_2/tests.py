@@ -19,6 +19,10 @@ class TestReversePolishNotationConverter(unittest.TestCase):
         converter = ReversePolishNotationConverter("a & b | c")
         self.assertEqual(converter.to_reverse_polish_notation(), ['a', 'b', '&', 'c', '|'])
 
+    def test_double_negation(self):
+        self.assertEqual(ReversePolishNotationConverter("!!a").to_reverse_polish_notation(), ['a', '!', '!'])
+        self.assertEqual(ReversePolishNotationConverter("a & !!b").to_reverse_polish_notation(), ['a', 'b', '!', '!', '&'])
+
 
 class TestVariableManager(unittest.TestCase):
     def test_extract_variables(self):